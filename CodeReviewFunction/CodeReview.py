@@ -2,24 +2,46 @@ import logging
 import azure.functions as func
 from bs4 import BeautifulSoup, SoupStrainer
 import json
+import math
+import os
 import time
 from collections import namedtuple
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from . import SoupUtilities
+from . import ReviewCache
+from . import ReleaseDiff
+from . import ReviewDeadline
+from . import ReviewJobs
+from . import Constants
 from .ReportPage import ReportPage
-from .Considerations.ObjectConsiderations import get_object_consideration_module_classes
-from .Considerations.ProcessConsiderations import process_consideration_module_classes
+from .Considerations.AppModelRegistry import AppModelRegistry
+from .Considerations.ConsiderationRegistry import normalize_consideration_name
+from .Considerations.KeywordMatcher import KeywordMatcher
+from .Considerations.ObjectConsiderations import OBJECT_CONSIDERATIONS
+from .Considerations.ObjectModel import ObjectModel
+from .Considerations.ReviewContext import ReviewContext
+from .Considerations.StageIndex import StageIndex
+from .Considerations.ProcessConsiderations import PROCESS_CONSIDERATIONS
 
 # logging.critical .error .warning .info .debug
 logging.info("CodeReview module running")
 Sub_Soup = namedtuple('Sub_Soup', 'processes, objects, queues, metadata')
+ReviewPlan = namedtuple('ReviewPlan', 'considerations, blacklist')
+PlannedConsideration = namedtuple('PlannedConsideration', 'consideration_class, score_scale, force_result')
+ObjectReview = namedtuple('ObjectReview', 'name, object_type, evaluated, actions, object_model')
+PAGE_TYPES = {'objects': 'Object', 'processes': 'Process'}
 
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
     print("Main running")
     xml_string = ''
-    report_pages = []
     logging.info("Python HTTP trigger function processed a request.")
 
+    if 'job' in req.params:
+        return handle_job_request(req)
+
     try:
         logging.info("Attempting to get the body")
         req_body = req.get_body()
@@ -30,23 +52,13 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
 
     # Use the extracted XML to create the report
     if xml_string:
-        sub_soups = SoupUtilities.extract_soups(xml_string)  # Parse the XML into multiple BeautifulSoup Objects
-        metadata = extract_metadata(sub_soups.metadata)
-        object_considerations, process_considerations = get_active_considerations(metadata)
-
-        for object_tag in sub_soups.objects.contents:
-            report_page_dict = make_report_object(object_tag, object_considerations, metadata)
-            report_pages.append(report_page_dict)
+        review_deadline = ReviewDeadline.ReviewDeadline(get_time_budget(req.params))
+        report_pages = review_release_by_mode(xml_string, req.params, ReviewCache.get_shared_cache(), review_deadline)
 
-        for process_tag in sub_soups.processes.contents:
-            report_page_dict = make_report_process(process_tag, process_considerations, metadata)
-            report_pages.append(report_page_dict)
-
-        report_page_dict = make_report_settings_page(metadata)
-        report_pages.append(report_page_dict)
-
-        json_report = json.dumps(report_pages)
-        print(json_report)
+        # Each page is serialized as soon as it is made, so the streaming mode doesn't hold every page as a dict. The
+        # JSON of the whole report is still built in memory, as func.HttpResponse takes the full body, not a stream
+        json_report = ''.join(iter_report_json(report_pages))
+        logging.info("Report created, {} characters of JSON".format(len(json_report)))
 
         # Sends an HTTP response containing the full report information in JSON
         return func.HttpResponse(json_report)
@@ -57,6 +69,401 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             status_code=400
         )
 
+
+def review_release_by_mode(xml_string, params, review_cache=None, review_deadline=None):
+    """Review the release in the review mode, and with the parser backend, given by the parameters of the request.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param params: (Mapping) Parameters of the HTTP request, or of a submitted review job.
+    :param review_cache: (ReviewCache) Cache of Object report pages to use. None reviews every Object.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by. None reviews everything.
+    :return: (iterable) Report pages as dicts. A generator for the streaming review mode.
+    """
+    review_mode = params.get('mode', Constants.DEFAULT_REVIEW_MODE)
+    parser_backend = params.get('parser', Constants.DEFAULT_PARSER_BACKEND)
+    if review_mode == Constants.REVIEW_MODES['streaming']:
+        return iter_review_release_streaming(xml_string, parser_backend, review_cache, review_deadline)
+    elif review_mode == Constants.REVIEW_MODES['parallel']:
+        return review_release_parallel(xml_string, parser_backend, get_max_workers(params), review_cache,
+                                       review_deadline)
+    elif review_mode == Constants.REVIEW_MODES['diff']:
+        return review_release_with_manifests(params, xml_string, parser_backend, review_cache, review_deadline)
+    else:
+        return review_release(xml_string, parser_backend, review_cache, review_deadline)
+
+
+def review_release(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND, review_cache=None,
+                   review_deadline=None):
+    """Create every report page for the release, with the full release parsed into soups up front.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the parser used to read the release.
+    :param review_cache: (ReviewCache) Cache of Object report pages to use. None reviews every Object.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by, whose coverage is added to the Settings
+    page. None reviews everything.
+    :return: (list) Report pages as dicts. Object pages, then Process pages, then the Settings page.
+    """
+    report_pages = []
+    metadata = extract_metadata(SoupUtilities.extract_header_soup(xml_string, parser_backend))
+    object_considerations, process_considerations = get_active_considerations(metadata)
+    review_plan = make_review_plan(object_considerations, metadata)
+    xml_string = skip_blacklisted_objects(xml_string, review_plan)
+    sub_soups = SoupUtilities.extract_soups(xml_string, parser_backend)  # Parse the XML into multiple BeautifulSoup Objects
+    app_model_registry = make_app_model_registry(xml_string, parser_backend, sub_soups.objects.contents)
+
+    for object_tag in sub_soups.objects.contents:
+        report_page_dict = make_report_object(object_tag, review_plan, metadata, review_cache, app_model_registry,
+                                              review_deadline=review_deadline)
+        report_pages.append(report_page_dict)
+
+    for process_tag in sub_soups.processes.contents:
+        report_page_dict = make_report_process(process_tag, process_considerations, metadata, review_deadline)
+        report_pages.append(report_page_dict)
+
+    if review_deadline is not None:
+        review_deadline.record_pages(report_pages)
+    report_page_dict = make_report_settings_page(metadata, review_deadline)
+    report_pages.append(report_page_dict)
+
+    return report_pages
+
+
+def review_release_streaming(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND, review_cache=None,
+                             review_deadline=None):
+    """Create every report page for the release while it is parsed incrementally.
+
+    Each Object is reviewed as soon as its closing tag is read and its soup is decomposed straight after, so only one
+    Object is held in memory at a time. The pages are returned in the same order as review_release.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the parser used to read the release.
+    :param review_cache: (ReviewCache) Cache of Object report pages to use. None reviews every Object.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by. None reviews everything.
+    :return: (list) Report pages as dicts. Object pages, then Process pages, then the Settings page.
+    """
+    return list(iter_review_release_streaming(xml_string, parser_backend, review_cache, review_deadline))
+
+
+def iter_review_release_streaming(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND, review_cache=None,
+                                  review_deadline=None):
+    """Generator version of review_release_streaming, yielding each Object's page as soon as it has been reviewed.
+
+    Process pages are held back until every Object has been yielded, to keep the pages in the order of review_release.
+
+    :return: Generator of report pages as dicts. Object pages, then Process pages, then the Settings page.
+    """
+    process_report_pages = []
+    metadata = extract_metadata(SoupUtilities.extract_header_soup(xml_string, parser_backend))
+    object_considerations, process_considerations = get_active_considerations(metadata)
+    review_plan = make_review_plan(object_considerations, metadata)
+
+    xml_string = skip_blacklisted_objects(xml_string, review_plan)
+    app_model_registry = make_app_model_registry(xml_string, parser_backend)
+
+    for section, release_tag in SoupUtilities.iter_release_soups(xml_string, parser_backend):
+        if section == 'objects':
+            report_page_dict = make_report_object(release_tag, review_plan, metadata, review_cache, app_model_registry,
+                                                  review_deadline=review_deadline)
+            release_tag.decompose()  # bs4 trees are cyclic, so free the subtree now rather than waiting for the gc
+            if review_deadline is not None:
+                review_deadline.record_page(report_page_dict)
+            yield report_page_dict
+        else:
+            report_page_dict = make_report_process(release_tag, process_considerations, metadata, review_deadline)
+            release_tag.decompose()
+            process_report_pages.append(report_page_dict)
+
+    if review_deadline is not None:
+        review_deadline.record_pages(process_report_pages)
+    yield from process_report_pages
+    yield make_report_settings_page(metadata, review_deadline)
+
+
+def iter_report_json(report_pages):
+    """Serialize the report pages into a JSON array one page at a time.
+
+    Joining the chunks gives the same JSON as json.dumps(list(report_pages)), but when report_pages is a generator
+    only the page currently being serialized is held as a dict.
+
+    :param report_pages: (iterable) Report pages as dicts.
+    :return: Generator of str chunks of the JSON array.
+    """
+    separator = '['
+    for report_page_dict in report_pages:
+        yield separator
+        yield json.dumps(report_page_dict)
+        separator = ', '
+    yield ']' if separator == ', ' else '[]'
+
+
+def review_release_parallel(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND,
+                            max_workers=Constants.PARALLEL_MAX_WORKERS, review_cache=None, review_deadline=None):
+    """Create every report page for the release, reviewing the Objects across a pool of worker processes.
+
+    Each Object is sent to a worker as XML and parsed again there. The pages are collected in the release's order, so
+    the report is the same as review_release. Releases with fewer than Constants.PARALLEL_MIN_OBJECTS Objects, or a
+    single worker, are reviewed serially.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the parser used to read the release.
+    :param max_workers: (int) Number of worker processes. None uses one per CPU core.
+    :param review_cache: (ReviewCache) Cache of Object report pages to use. None reviews every Object.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by. Each worker is given a copy, and gives
+    the Objects it hasn't started by then a 'not evaluated' page. None reviews everything.
+    :return: (list) Report pages as dicts. Object pages, then Process pages, then the Settings page.
+    """
+    report_pages = []
+    metadata = extract_metadata(SoupUtilities.extract_header_soup(xml_string, parser_backend))
+    object_considerations, process_considerations = get_active_considerations(metadata)
+    review_plan = make_review_plan(object_considerations, metadata)
+    xml_string = skip_blacklisted_objects(xml_string, review_plan)
+    sub_soups = SoupUtilities.extract_soups(xml_string, parser_backend)
+
+    object_tags = sub_soups.objects.contents
+    app_model_registry = make_app_model_registry(xml_string, parser_backend, object_tags)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(object_tags))
+    if len(object_tags) < Constants.PARALLEL_MIN_OBJECTS or max_workers < 2:
+        for object_tag in object_tags:
+            report_page_dict = make_report_object(object_tag, review_plan, metadata, review_cache, app_model_registry,
+                                                  review_deadline=review_deadline)
+            report_pages.append(report_page_dict)
+    else:
+        object_report_pages = [make_blacklisted_object_page(object_tag.get('name'))
+                               if is_blacklisted(review_plan, object_tag.get('name')) else None
+                               for object_tag in object_tags]
+        if review_cache is not None:
+            cache_keys = [ReviewCache.make_cache_key(str(object_tag), metadata,
+                                                     app_model_registry.get_object_inherited_key(object_tag))
+                          for object_tag in object_tags]
+            object_report_pages = [report_page_dict or review_cache.get(cache_key)
+                                   for report_page_dict, cache_key in zip(object_report_pages, cache_keys)]
+
+        # Only the Objects that weren't blacklisted or cached are sent to the workers
+        unreviewed_indexes = [index for index, report_page_dict in enumerate(object_report_pages)
+                              if report_page_dict is None]
+        if unreviewed_indexes:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(unreviewed_indexes))) as executor:
+                # map returns the pages in the order the Objects were given, whichever worker finishes first
+                if plan_uses_soup(review_plan):
+                    unreviewed_xml_strings = [str(object_tags[index]) for index in unreviewed_indexes]
+                    report_page_jsons = executor.map(_review_object_xml, unreviewed_xml_strings,
+                                                     repeat(parser_backend), repeat(review_plan), repeat(metadata),
+                                                     repeat(app_model_registry), repeat(review_deadline))
+                else:
+                    # The workers are sent each Object's compact ObjectModel, rather than its XML to parse again
+                    object_reviews = [make_object_review(object_tags[index], app_model_registry)
+                                      for index in unreviewed_indexes]
+                    report_page_jsons = executor.map(_review_object_model, object_reviews, repeat(review_plan),
+                                                     repeat(metadata), repeat(review_deadline))
+                for index, report_page_json in zip(unreviewed_indexes, report_page_jsons):
+                    object_report_pages[index] = json.loads(report_page_json)
+                    if review_cache is not None and ReviewDeadline.is_fully_reviewed(object_report_pages[index]):
+                        review_cache.set(cache_keys[index], object_report_pages[index])
+        report_pages.extend(object_report_pages)
+
+    for process_tag in sub_soups.processes.contents:
+        report_page_dict = make_report_process(process_tag, process_considerations, metadata, review_deadline)
+        report_pages.append(report_page_dict)
+
+    if review_deadline is not None:
+        review_deadline.record_pages(report_pages)
+    report_page_dict = make_report_settings_page(metadata, review_deadline)
+    report_pages.append(report_page_dict)
+
+    return report_pages
+
+
+def review_release_diff(xml_string, baseline_manifest=None, parser_backend=Constants.DEFAULT_PARSER_BACKEND,
+                        review_cache=None, review_deadline=None):
+    """Create every report page for the release, only reviewing what has changed since a baseline release.
+
+    The release is parsed incrementally as in review_release_streaming. Each Object and Process is fingerprinted from
+    its XML before it is converted into a soup, and those whose fingerprint matches the baseline manifest have their
+    page copied from the baseline's report instead.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param baseline_manifest: (dict) Manifest of the baseline release, see ReleaseDiff. None reviews everything.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the parser used to read the release.
+    :param review_cache: (ReviewCache) Cache of Object report pages to use.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by. Items whose review was cut short are
+    left out of the manifest, so the next diff against it reviews them. None reviews everything.
+    :return: (tuple) The report pages as dicts, in the same order as review_release, and the release's manifest to
+    diff the next version of the release against.
+    """
+    report_pages = []
+    process_report_pages = []
+    metadata = extract_metadata(SoupUtilities.extract_header_soup(xml_string, parser_backend))
+    object_considerations, process_considerations = get_active_considerations(metadata)
+    review_plan = make_review_plan(object_considerations, metadata)
+    release_diff = ReleaseDiff.ReleaseDiff(baseline_manifest)
+    xml_string = skip_blacklisted_objects(xml_string, review_plan)
+    app_model_registry = make_app_model_registry(xml_string, parser_backend)
+
+    for section, element in SoupUtilities.iter_release_elements(xml_string):
+        item_name = element.get('name')
+        inherited_key = ''
+        if section == 'objects':
+            inherited_key = app_model_registry.get_inherited_key(ReleaseDiff.get_parent_object_name(element))
+        report_page_dict = release_diff.add_item(section, element, metadata, inherited_key)
+        if report_page_dict is None:
+            if ReviewDeadline.is_expired(review_deadline) and not (section == 'objects' and
+                                                                   is_blacklisted(review_plan, item_name)):
+                # Not converted into a soup, as it won't be reviewed
+                report_page_dict = ReviewDeadline.make_not_evaluated_page(item_name, PAGE_TYPES[section])
+            else:
+                release_tag = SoupUtilities.release_element_to_soup(section, element, parser_backend)
+                if section == 'objects':
+                    report_page_dict = make_report_object(release_tag, review_plan, metadata, review_cache,
+                                                          app_model_registry, review_deadline=review_deadline)
+                else:
+                    report_page_dict = make_report_process(release_tag, process_considerations, metadata,
+                                                           review_deadline)
+            if ReviewDeadline.is_fully_reviewed(report_page_dict):
+                release_diff.set_report_page(section, item_name, report_page_dict)
+            else:
+                release_diff.discard_item(section, item_name)
+
+        if section == 'objects':
+            report_pages.append(report_page_dict)
+        else:
+            process_report_pages.append(report_page_dict)
+
+    logging.info("Reviewed {} changed Objects and Processes: {}".format(len(release_diff.changed_items),
+                                                                        release_diff.changed_items))
+    report_pages.extend(process_report_pages)
+    if review_deadline is not None:
+        review_deadline.record_pages(report_pages)
+    report_page_dict = make_report_settings_page(metadata, review_deadline)
+    report_pages.append(report_page_dict)
+
+    return report_pages, release_diff.manifest
+
+
+def review_release_with_manifests(params, xml_string, parser_backend, review_cache=None, review_deadline=None):
+    """Run review_release_diff for the diff review mode, using the release manifests kept between requests.
+
+    The 'baseline' parameter of the request names the stored manifest to diff against, and the release's own manifest
+    is stored under the name in the 'release' parameter. A release name that isn't ReleaseDiff.is_valid_release_name is
+    logged and its manifest isn't stored, so a request can't write outside the manifest directory.
+
+    :param params: (Mapping) Parameters of the HTTP request, or of a submitted review job.
+    :return: (list) Report pages as dicts.
+    """
+    baseline_manifest = None
+    if 'baseline' in params:
+        baseline_manifest = ReleaseDiff.load_manifest(params['baseline'])
+    report_pages, release_manifest = review_release_diff(xml_string, baseline_manifest, parser_backend, review_cache,
+                                                         review_deadline)
+    if 'release' in params:
+        if ReleaseDiff.is_valid_release_name(params['release']):
+            ReleaseDiff.save_manifest(params['release'], release_manifest)
+        else:
+            logging.warning("Release manifest not stored, invalid release name " + repr(params['release']))
+    return report_pages
+
+
+def _review_object_xml(object_xml, parser_backend, review_plan, metadata, app_model_registry, review_deadline=None):
+    """Worker process side of review_release_parallel. Parse a single Object's XML and create its report page.
+
+    The page is returned as JSON, as the page's strings can be bs4 NavigableStrings that would pickle the whole soup.
+    The AppModelRegistry only holds plain strings, so it is sent to the worker as it is.
+    """
+    soup_object = SoupUtilities.parse_object_soup(object_xml, parser_backend)
+    return json.dumps(make_report_object(soup_object, review_plan, metadata, app_model_registry=app_model_registry,
+                                         free_soup=True, review_deadline=review_deadline))
+
+
+def _review_object_model(object_review: ObjectReview, review_plan, metadata, review_deadline=None):
+    """Worker process side of review_release_parallel when every checked consideration reads the ObjectModel. Create
+    the report page of an Object from the ObjectReview the main process read, without parsing the Object again."""
+    if ReviewDeadline.is_expired(review_deadline):
+        return json.dumps(ReviewDeadline.make_not_evaluated_page(object_review.name, 'Object'))
+    return json.dumps(check_object_considerations(object_review, review_plan, metadata,
+                                                  review_deadline=review_deadline))
+
+
+def get_max_workers(params):
+    """Return the worker process count from the 'workers' parameter of the request, or the configured default."""
+    try:
+        return int(params['workers'])
+    except (KeyError, ValueError):
+        return Constants.PARALLEL_MAX_WORKERS
+
+
+def get_time_budget(params, max_budget=Constants.REVIEW_TIME_BUDGET):
+    """Return the review's time budget in seconds from the 'budget' parameter of the request, or the configured
+    default.
+
+    A budget that isn't a finite number of seconds more than 0 is ignored, and one longer than max_budget is cut to
+    it, so a request can't turn off the deadline that keeps the review inside the HTTP timeout.
+
+    :param max_budget: (float) The longest budget allowed. None allows any, for a review job.
+    """
+    try:
+        time_budget = float(params['budget'])
+    except (KeyError, ValueError):
+        return Constants.REVIEW_TIME_BUDGET
+    if not math.isfinite(time_budget) or time_budget <= 0:
+        logging.warning("Ignoring the time budget {}".format(params['budget']))
+        return Constants.REVIEW_TIME_BUDGET
+    if max_budget is not None:
+        time_budget = min(time_budget, max_budget)
+    return time_budget
+
+
+def handle_job_request(req: func.HttpRequest) -> func.HttpResponse:
+    """Submit a release as a review job, or poll or fetch a submitted one, for the 'job' parameter of the request.
+
+    'submit' stores the body's release and returns the job as JSON, with its 'Job Id'. The release is reviewed with the
+    rest of the request's parameters, as main would. 'status' returns the job with the 'id' parameter as JSON, and
+    'report' returns its report once it is complete. Jobs are kept for Constants.JOB_RETENTION_SECONDS after they
+    finish, and removed when a later job is submitted. See ReviewJobs.
+    """
+    job_action = req.params['job']
+    job_queue = ReviewJobs.get_job_queue()
+    blob_store = ReviewJobs.get_blob_store()
+
+    if job_action == Constants.JOB_ACTIONS['submit']:
+        try:
+            xml_string = req.get_body()
+        except ValueError:
+            logging.error("Unable to access request body")
+            xml_string = None
+        if not xml_string:
+            return func.HttpResponse("Unable to read XML", status_code=400)
+        ReviewJobs.prune_jobs(job_queue, blob_store)
+        params = {name: value for name, value in req.params.items() if name != 'job'}
+        job = ReviewJobs.submit_job(xml_string, params, job_queue, blob_store)
+        if Constants.JOB_WORKER_THREAD:
+            ReviewJobs.start_worker(job_queue, blob_store, review_job_release)
+        return func.HttpResponse(json.dumps(job.as_dict()), status_code=202)
+
+    if job_action not in Constants.JOB_ACTIONS.values():
+        return func.HttpResponse("Unknown job action " + job_action, status_code=400)
+    job_queue.expire()
+    job = job_queue.get_job(req.params.get('id', ''))
+    if job is None:
+        return func.HttpResponse("Unknown job", status_code=404)
+    if job_action == Constants.JOB_ACTIONS['report']:
+        if job.status == ReviewJobs.JOB_STATUSES['complete']:
+            return func.HttpResponse(blob_store.get(ReviewJobs.get_report_blob_name(job.job_id)))
+        # Not finished yet, or failed, so the job's status is returned instead
+        return func.HttpResponse(json.dumps(job.as_dict()), status_code=409)
+    return func.HttpResponse(json.dumps(job.as_dict()))
+
+
+def review_job_release(xml_string, params) -> str:
+    """Worker side of the review job API. Review a submitted release and return its report as JSON.
+
+    A job isn't limited by the HTTP timeout, so it is only given a time budget by a 'budget' parameter.
+    """
+    review_deadline = None
+    if 'budget' in params:
+        review_deadline = ReviewDeadline.ReviewDeadline(get_time_budget(params, max_budget=None))
+    report_pages = review_release_by_mode(xml_string, params, ReviewCache.get_shared_cache(), review_deadline)
+    return ''.join(iter_report_json(report_pages))
+
+
 # --- TESTING ONLY ---
 def test_with_local():
     print("Local testing running")
@@ -87,13 +494,14 @@ def test_with_local():
         # try:
         metadata = extract_metadata(sub_soups.metadata)
         active_object_consid_classes, active_process_consid_classes = get_active_considerations(metadata)
+        review_plan = make_review_plan(active_object_consid_classes, metadata)
         # except:
         print("!!! Unable to find the header in the XML !!!")  # Only for testing
 
         # print(sub_soups.objects.prettify())
         start_processing = time.clock()
         for object_tag in sub_soups.objects:
-            report_page_dict = make_report_object(object_tag, active_object_consid_classes, metadata)
+            report_page_dict = make_report_object(object_tag, review_plan, metadata)
             report_pages.append(report_page_dict)
 
         for process_tag in sub_soups.processes:
@@ -178,53 +586,109 @@ def extract_metadata(soup_metadata: BeautifulSoup):
 def get_active_considerations(metadata):
     """Create lists containing consideration class' objects for all active object and process considerations.
 
-    Goes through config file for all considerations marked as active. Then compares these active considerations
-    to the considerations available within this script.
+    Goes through config file for all considerations marked as active and looks up each one's class in the
+    consideration registries, which every consideration class is added to when its module is imported.
 
     The object_consideration_classes and process_consideration_classes will contain a list of objects
     of the Consideration's class. Only considerations that are marked as 'Active' in the config file
     will have their class' object added to the respective active_process_consideration_classes or
     active_object_consideration_classes list. These class objects are later iterated through and instantiated.
+    Active names in the config that match no class are logged by the registry.
     """
-
-    active_object_consideration_classes = []
-    active_process_consideration_classes = []
-
-    active_considerations_object = metadata['active considerations object']
-    active_considerations_process = metadata['active considerations process']
-    object_consideration_classes = get_object_consideration_module_classes()
-    process_consideration_classes = process_consideration_module_classes()
-
-    # Retrieve active Object Considerations
-    for consideration_status_dict in active_considerations_object:
-        if consideration_status_dict['Active']:  # Consideration is active from metadata
-            report_consideration_name = consideration_status_dict['Object Considerations']
-            for object_class in object_consideration_classes:
-                class_consideration_name = object_class[1].CONSIDERATION_NAME
-                if class_consideration_name == report_consideration_name:
-                    # Add class' object to object consideration list
-                    active_object_consideration_classes.append(object_class[1])
-                    break
+    active_object_consideration_classes, unmatched_object_names = OBJECT_CONSIDERATIONS.get_active_classes(
+        metadata['active considerations object'], 'Object Considerations')
 
     # TODO: Test function once process side of report is built
-    # Retrieve active Object Considerations
-    for consideration_status_dict in active_considerations_process:
-        if consideration_status_dict['Active']:  # Consideration is active
-            report_consideration_name = consideration_status_dict['Process Considerations']
-            for process_class in process_consideration_classes:
-                class_consideration_name = process_class[1].CONSIDERATION_NAME
-                if class_consideration_name == report_consideration_name:
-                    # Adds  Class' object to process consideration list
-                    active_process_consideration_classes.append(process_class[1])
-                    break
+    active_process_consideration_classes, unmatched_process_names = PROCESS_CONSIDERATIONS.get_active_classes(
+        metadata['active considerations process'], 'Process Considerations')
 
     return active_object_consideration_classes, active_process_consideration_classes
 
 
-# Still in dev
-def make_report_process(soup_process, active_process_considerations_classes, metadata):
+def make_review_plan(active_object_consideration_classes, metadata) -> ReviewPlan:
+    """Compile how every Object in the release is reviewed, so make_report_object doesn't search the config each time.
+
+    :param active_object_consideration_classes: (list) Active Object consideration classes from
+    get_active_considerations.
+    :param metadata: (dict) Metadata from extract_metadata.
+    :return: (ReviewPlan) The considerations to run on each Object in order, as PlannedConsiderations, and a
+    KeywordMatcher of the blacklisted Object names. A PlannedConsideration has a score_scale and force_result when
+    the config forces its result, otherwise both are None and it is checked.
+    """
+    config_by_name = {}
+    for active_object in metadata['active considerations object']:
+        consideration_key = normalize_consideration_name(active_object['Object Considerations'])
+        config_by_name.setdefault(consideration_key, []).append(active_object)
+
+    planned_considerations = []
+    for object_consideration in active_object_consideration_classes:
+        consideration_key = normalize_consideration_name(object_consideration.CONSIDERATION_NAME)
+        for active_object in config_by_name.get(consideration_key, []):
+            # Check if forced result was set in config
+            force_result = active_object['Force Result']
+            score_scale = active_object['Score Scale']
+            if force_result == score_scale == '':
+                planned_considerations.append(PlannedConsideration(object_consideration, None, None))
+            else:
+                planned_considerations.append(PlannedConsideration(object_consideration, float(score_scale),
+                                                                   force_result))
+
+    blacklist = KeywordMatcher(Constants.BLACKLIST_OBJECT_NAMES + metadata['blacklist'], ignore_case=True)
+    return ReviewPlan(planned_considerations, blacklist)
+
+
+def is_blacklisted(review_plan: ReviewPlan, object_name) -> bool:
+    """Return True if the Object's name contains an entry of Constants.BLACKLIST_OBJECT_NAMES or the release's
+    blacklist, ignoring case."""
+    return review_plan.blacklist.contains(object_name)
+
+
+def skip_blacklisted_objects(xml_string, review_plan: ReviewPlan):
+    """Return the release with every blacklisted Object emptied, so they aren't parsed. See
+    SoupUtilities.skip_blacklisted_objects."""
+    return SoupUtilities.skip_blacklisted_objects(xml_string, partial(is_blacklisted, review_plan))[0]
+
+
+def make_app_model_registry(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND,
+                            object_tags=None) -> AppModelRegistry:
+    """Register the App Model of every Object that another Object in the release inherits from.
+
+    The inherited Objects are found in the raw release first, so a release without any inheritance isn't read again.
+
+    :param xml_string: The release, after skip_blacklisted_objects.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the parser used to read the release.
+    :param object_tags: (list) The soups of the release's Objects, if it has already been parsed. None reads only the
+    inherited Objects from xml_string, for the review modes that parse one Object at a time.
+    :return: (AppModelRegistry) The release's registry, to give to make_report_object.
+    """
+    app_model_registry = AppModelRegistry()
+    parent_names = SoupUtilities.get_parent_object_names(xml_string)
+    if not parent_names:
+        return app_model_registry
+
+    if object_tags is not None:
+        for object_tag in object_tags:
+            if object_tag.get('name') in parent_names:
+                app_model_registry.add_object(object_tag)
+    else:
+        for section, element in SoupUtilities.iter_release_elements(xml_string):
+            if section == 'objects' and element.get('name') in parent_names:
+                app_model_registry.add_object(SoupUtilities.release_element_to_soup(section, element, parser_backend))
+    logging.info("Registered the inherited App Models of {}".format(sorted(parent_names)))
+    return app_model_registry
+
+
+def make_blacklisted_object_page(object_name) -> dict:
+    """Return the report page of a blacklisted Object, which has no Actions or considerations as it isn't read."""
+    return ReportPage(object_name, 'Object', Constants.BLACKLISTED_OBJECT_TYPE, []).get_page_as_dict()
+
+
+def make_report_process(soup_process, active_process_considerations_classes, metadata, review_deadline=None):
     """Use the filtered soup of a single process tag element to generate the JSON for a page in the report."""
     current_process_name = soup_process.get('name')
+    if ReviewDeadline.is_expired(review_deadline):
+        logging.info("Time budget ran out before Process " + current_process_name)
+        return ReviewDeadline.make_not_evaluated_page(current_process_name, 'Process')
     report_page = ReportPage(current_process_name, 'Process')
 
     logging.info("Running make_report_process function for " + report_page.page_name)
@@ -234,68 +698,150 @@ def make_report_process(soup_process, active_process_considerations_classes, met
     return report_page.get_page_as_dict()
 
 
-def make_report_object(soup_object, active_object_consideration_classes, metadata: dict):
+def make_report_object(soup_object, review_plan: ReviewPlan, metadata: dict, review_cache=None,
+                       app_model_registry: AppModelRegistry = None, free_soup=False, review_deadline=None):
     """Create a single object page in the report using the filtered soup of a single object's tag element.
 
     :param soup_object: (BeautifulSoup) Soup of the BP Object.
-    :param active_object_consideration_classes: (list) List of an object for each class. Each object can be used to
-    instantiate a new consideration.
-    :param metadata: (dict) Metadata about the report creation.
+    :param review_plan: (ReviewPlan) The considerations to run on the Object, from make_review_plan.
+    :param metadata: (dict) Metadata about the report creation. Not changed, the considerations get a read only copy.
+    :param review_cache: (ReviewCache) Cache the page is returned from if the Object has been reviewed before with
+    the same config, and stored in otherwise. None always reviews the Object.
+    :param app_model_registry: (AppModelRegistry) The release's registry from make_app_model_registry, so an Object
+    that inherits its App Model is checked against it. None only uses the Object's own App Model.
+    :param free_soup: (bool) Decompose the soup once the Object's ObjectModel is read, if none of the considerations
+    checking it need the soup. Only for a caller that doesn't use the soup again.
+    :param review_deadline: (ReviewDeadline) Time the review has to stop by. An Object not started by then gets a
+    'not evaluated' page, and the considerations not checked by then a 'not evaluated' result. Such pages aren't
+    cached. None checks every consideration.
     :return: (dict) Full report page information as a dict.
     """
+    # Blacklisted Objects were emptied before the release was parsed, so only their name is read
+    current_object_name = soup_object.get('name')
+    if is_blacklisted(review_plan, current_object_name):
+        logging.info("Blacklisted Object " + current_object_name)
+        return make_blacklisted_object_page(current_object_name)
+
+    if review_cache is not None:
+        inherited_key = app_model_registry.get_object_inherited_key(soup_object) if app_model_registry else ''
+        cache_key = ReviewCache.make_cache_key(str(soup_object), metadata, inherited_key)
+        report_page_dict = review_cache.get(cache_key)
+        if report_page_dict is not None:
+            logging.info("Using the cached report page for " + soup_object.get('name'))
+            return report_page_dict
+
+    if ReviewDeadline.is_expired(review_deadline):
+        logging.info("Time budget ran out before Object " + current_object_name)
+        return ReviewDeadline.make_not_evaluated_page(current_object_name, 'Object')
 
     # Collect BP Information from Soup
-    current_object_name = soup_object.get('name')
     object_actions = SoupUtilities.get_object_actions(soup_object)
     object_type, evaluated = SoupUtilities.determine_object_type(current_object_name.lower(), soup_object)
-    object_type_full = ''
-    if evaluated:
-        object_type_full = object_type + " (Evaluated)"
+    logging.info("Running make_report_object function for " + current_object_name)
+
+    # The StageIndex is built once so the considerations don't each search the soup for stages. Considerations that
+    # only read the ObjectModel are given it instead. While any consideration needs the soup, the model is read from
+    # the stages the StageIndex has already found. Otherwise it is read straight from the soup, which can then be freed.
+    stage_index, object_model = None, None
+    if plan_uses_soup(review_plan):
+        stage_index = StageIndex(soup_object, app_model_registry)
+        if plan_uses_object_model(review_plan):
+            object_model = ObjectModel.from_stage_index(stage_index)
     else:
-        object_type_full = object_type
-    metadata['object type'] = object_type
+        if plan_uses_object_model(review_plan):
+            object_model = ObjectModel.from_soup(soup_object, app_model_registry)
+        if free_soup:
+            soup_object.decompose()
+
+    object_review = ObjectReview(current_object_name, object_type, evaluated, object_actions, object_model)
+    report_page_dict = check_object_considerations(object_review, review_plan, metadata, soup_object, stage_index,
+                                                   review_deadline)
+    if review_cache is not None and ReviewDeadline.is_fully_reviewed(report_page_dict):
+        review_cache.set(cache_key, report_page_dict)
+    return report_page_dict
+
+
+def check_object_considerations(object_review: ObjectReview, review_plan: ReviewPlan, metadata: dict,
+                                soup_object=None, stage_index: StageIndex = None, review_deadline=None) -> dict:
+    """Run the review plan's considerations on a single Object and return its report page.
+
+    :param object_review: (ObjectReview) The Object's name, type, Actions and ObjectModel. The model is only needed if
+    a checked consideration uses it.
+    :param soup_object: (BeautifulSoup) Soup of the BP Object, only needed if a checked consideration uses it.
+    :param stage_index: (StageIndex) The soup's StageIndex, only needed along with the soup.
+    :return: (dict) Full report page information as a dict.
+    """
+    object_type_full = object_review.object_type
+    if object_review.evaluated:
+        object_type_full = object_review.object_type + " (Evaluated)"
+    report_page = ReportPage(object_review.name, 'Object', object_type_full, object_review.actions)
+    object_model = object_review.object_model
+    context = ReviewContext.create(object_review.name, object_review.object_type, object_review.evaluated,
+                                   stage_index, metadata)
+
+    for planned_consideration in review_plan.considerations:
+        temp_consideration = planned_consideration.consideration_class()
+        if planned_consideration.score_scale is None and ReviewDeadline.is_expired(review_deadline):
+            temp_consideration._consideration_not_evaluated()
+        elif planned_consideration.score_scale is None:
+            if planned_consideration.consideration_class.USES_OBJECT_MODEL:
+                temp_consideration.check_consideration(object_model, context)
+            else:
+                temp_consideration.check_consideration(soup_object, context)
+            temp_consideration.evaluate_score_and_result()
+        else:
+            temp_consideration.evaluate_score_and_result(planned_consideration.score_scale,
+                                                         planned_consideration.force_result)
 
-    report_page = ReportPage(current_object_name, 'Object', object_type_full, object_actions)
-    logging.info("Running make_report_object function for " + report_page.page_name)
+        report_page.set_consideration(temp_consideration)
 
-    blacklist_objects = metadata['blacklist']
-    metadata_active_objects = metadata['active considerations object']
+    return report_page.get_page_as_dict()
 
-    for object_consideration in active_object_consideration_classes:
-        # Check the Object name isn't a blacklisted object
-        if not any(ignored_object in current_object_name.lower() for ignored_object in blacklist_objects):
-            for active_object in metadata_active_objects:
-                # Find current consideration in the active consideration info of config file
-                if active_object['Object Considerations'] == object_consideration.CONSIDERATION_NAME:
-                    # Check if forced result was set in config and apply it
-                    force_result = active_object['Force Result']
-                    score_scale = active_object['Score Scale']
-
-                    temp_consideration = object_consideration()
-                    if force_result == score_scale == '':
-                        temp_consideration.check_consideration(soup_object, metadata)
-                        temp_consideration.evaluate_score_and_result()
-                    else:
-                        temp_consideration.evaluate_score_and_result(float(score_scale), force_result)
-
-                    report_page.set_consideration(temp_consideration)
 
-    return report_page.get_page_as_dict()
+def make_object_review(soup_object, app_model_registry: AppModelRegistry = None) -> ObjectReview:
+    """Read everything check_object_considerations needs from an Object's soup when no checked consideration needs
+    the soup itself, so the review can go on without it."""
+    object_name = soup_object.get('name')
+    object_type, evaluated = SoupUtilities.determine_object_type(object_name.lower(), soup_object)
+    # The Action names are NavigableStrings, which would pickle the whole soup
+    object_actions = [str(action_name) for action_name in SoupUtilities.get_object_actions(soup_object)]
+    return ObjectReview(object_name, object_type, evaluated, object_actions,
+                        ObjectModel.from_soup(soup_object, app_model_registry))
+
+
+def get_checked_classes(review_plan: ReviewPlan) -> list:
+    """Return the classes of the considerations the plan checks, rather than forcing their result."""
+    return [planned_consideration.consideration_class for planned_consideration in review_plan.considerations
+            if planned_consideration.score_scale is None]
+
+
+def plan_uses_soup(review_plan: ReviewPlan) -> bool:
+    """Return True if a consideration the plan checks is given the Object's soup rather than its ObjectModel."""
+    return not all(consideration_class.USES_OBJECT_MODEL for consideration_class in get_checked_classes(review_plan))
+
+
+def plan_uses_object_model(review_plan: ReviewPlan) -> bool:
+    """Return True if a consideration the plan checks is given the Object's ObjectModel."""
+    return any(consideration_class.USES_OBJECT_MODEL for consideration_class in get_checked_classes(review_plan))
 
 
-def make_report_settings_page(metadata):
+def make_report_settings_page(metadata, review_deadline=None):
     """Add a setting report page where 'Report Considerations' are the settings to be sent to Blue Prism.
 
     These settings are used by the BP SAM Process to determine what should and should not be in the final report.
     This page will not be included in the output report.
 
     :param metadata: (dict) Metadata information from the XML.
+    :param review_deadline: (ReviewDeadline) The review's deadline, once every other page has been recorded with it.
+    Its coverage is added after the release's settings. None adds only the release's settings.
     :return: (dict) A single settings report page as a dict.
     """
     report_page = ReportPage('Settings Page', 'Settings')
     logging.info("Running make_report_object function for Settings")
     for setting in metadata['settings']:
         report_page.considerations.append(setting)
+    if review_deadline is not None:
+        report_page.considerations.append(review_deadline.get_coverage_setting())
 
     return report_page.get_page_as_dict()
 
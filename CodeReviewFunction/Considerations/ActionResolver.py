@@ -0,0 +1,53 @@
+"""
+This module contains the ActionResolver, which gives the name of the Action a stage belongs to from its subsheetid.
+
+A subsheet is the BP release XML equivalent of an Action page within a BP Object, and every stage on that page holds
+the page's subsheetid.
+"""
+
+from .KeywordMatcher import KeywordMatcher
+
+
+class ActionResolver:
+    """Hash map from the subsheetid of each Action page in a BP Object to the Action's name."""
+
+    def __init__(self, subsheets):
+        """
+        :param subsheets: (list) The <subsheet> tags of a single BP Object.
+        """
+        self.action_names = {}
+        for subsheet in subsheets:
+            self.action_names.setdefault(subsheet.get('subsheetid'), subsheet.next_element.string)
+        self._lower_action_names = {}
+
+    def get_action_name(self, subsheetid) -> str:
+        """Return the name of the Action with the given subsheetid, or None if there isn't one."""
+        return self.action_names.get(subsheetid)
+
+    def get_lower_action_name(self, subsheetid) -> str:
+        """Return the lower case name of the Action, which is cached for the blacklist and whitelist checks.
+
+        Returns an empty string if there is no Action with the given subsheetid.
+        """
+        lower_action_name = self._lower_action_names.get(subsheetid)
+        if lower_action_name is None:
+            action_name = self.action_names.get(subsheetid)
+            lower_action_name = action_name.lower() if action_name else ''
+            self._lower_action_names[subsheetid] = lower_action_name
+        return lower_action_name
+
+    def action_name_contains(self, subsheetid, words: KeywordMatcher) -> bool:
+        """Return True if the Action's name contains any of the matcher's lower case words (e.g. a blacklist of Action
+        names)."""
+        return words.contains(self.get_lower_action_name(subsheetid))
+
+    def not_blacklisted(self, blacklist: KeywordMatcher, subsheetid) -> bool:
+        """Return True if the Action's name contains none of the matcher's lower case words in the blacklist.
+
+        The equivalent of check_not_blacklisted() that uses the cached lower case Action name.
+        """
+        return not self.action_name_contains(subsheetid, blacklist)
+
+    def items(self) -> list:
+        """Return (subsheetid, Action name) of every Action page, in the order they appear in the Object."""
+        return list(self.action_names.items())
@@ -0,0 +1,119 @@
+"""
+This module contains the AppModel, the elements and attributes of a single BP Object's Application Modeller.
+
+The App Model is scanned once per Object, reading the basetype and every attribute of each element into plain records.
+The attribute considerations all work from these records rather than each searching the App Model's soup again, and
+the Navigate check finds the element each step uses by its id. The records only hold plain strings, so they keep none
+of the soup alive and can be sent to another process.
+"""
+
+from collections import namedtuple
+from ..SoupUtilities import iter_child_tags, read_string
+
+
+class AppModelAttribute(namedtuple('AppModelAttribute', 'name, inuse, comparisontype, value')):
+    """A single attribute of an App Model element.
+
+    name (str): The attribute's name, e.g. 'WindowText'.
+    inuse (str): The inuse XML attribute, set when the attribute is used to match the element. None if not.
+    comparisontype (str): How the attribute is matched, e.g. 'dynamic'. None for an equal match.
+    value (str): Value of the attribute's <processvalue>, or None if it doesn't have one.
+    """
+    __slots__ = ()
+
+
+class AppModelElement(namedtuple('AppModelElement', 'id, name, basetype, datatype, group, attributes')):
+    """A single element of the App Model, with its attributes in the order they appear in the release.
+
+    id (str): The element's id, which Navigate, Read and Wait steps use to refer to it.
+    name (str): The element's name.
+    basetype (str): The element's basetype, e.g. 'HTMLButton'.
+    datatype (str): The datatype of the element's value, e.g. 'flag'.
+    group (str): Name of the group the element is in, or None if it isn't in a group.
+    attributes (tuple): The element's AppModelAttributes.
+    """
+    __slots__ = ()
+
+    def get_attribute(self, attribute_name) -> AppModelAttribute:
+        """Return the first of the element's attributes with the name, or None if it doesn't have one."""
+        for attribute in self.attributes:
+            if attribute.name == attribute_name:
+                return attribute
+        return None
+
+
+class AppModel:
+    """Every element of a BP Object's Application Modeller, read in a single pass over the App Model.
+
+    An Object with a parentobject uses the App Model of the Object it inherits from. Its own App Model is empty, so
+    get_element looks up an element id in the parent's AppModel when one has been linked.
+    """
+
+    def __init__(self, appdef):
+        """
+        :param appdef: (bs4.Tag or XmlTag) The Object's <appdef> tag. None gives an App Model without any elements.
+        """
+        self.elements = []
+        self.elements_by_id = {}
+        self.parent = None
+        """The AppModel of the Object this one inherits from, or None if it isn't known."""
+        if appdef is not None:
+            self._read_elements(appdef, None)
+
+    def get_element(self, element_id) -> AppModelElement:
+        """Return the element with the id, from this App Model or the one it inherits. None if neither has it."""
+        app_model = self
+        while app_model is not None:
+            element = app_model.elements_by_id.get(element_id)
+            if element is not None:
+                return element
+            app_model = app_model.parent
+        return None
+
+    def _read_elements(self, tag, group):
+        """Read the elements inside a tag of the App Model, and every element nested in those, in document order.
+
+        :param tag: (bs4.Tag or XmlTag) The <appdef>, or an <element> or <group> of the App Model.
+        :param group: (str) Name of the group the tag is in, or None if it isn't in a group.
+        """
+        for child in iter_child_tags(tag):
+            if child.name == 'element':
+                self._read_element(child, group)
+            elif child.name == 'group':
+                self._read_elements(child, child.get('name'))
+
+    def _read_element(self, element, group):
+        """Add the record of an <element> tag, followed by the elements nested in it."""
+        element_id, basetype, datatype = None, None, None
+        attributes = []
+        nested = False
+        for child in iter_child_tags(element):
+            if child.name == 'id' and element_id is None:
+                element_id = read_string(child)
+            elif child.name == 'basetype' and basetype is None:
+                basetype = read_string(child)
+            elif child.name == 'datatype' and datatype is None:
+                datatype = read_string(child)
+            elif child.name == 'attributes' and not attributes:
+                attributes = [_read_attribute(attribute) for attribute in iter_child_tags(child)
+                              if attribute.name == 'attribute']
+            elif child.name in ('element', 'group'):
+                nested = True
+
+        app_model_element = AppModelElement(element_id, element.get('name'), basetype, datatype, group,
+                                            tuple(attributes))
+        self.elements.append(app_model_element)
+        if element_id is not None:
+            self.elements_by_id.setdefault(element_id, app_model_element)
+        if nested:
+            self._read_elements(element, group)
+
+
+def _read_attribute(attribute) -> AppModelAttribute:
+    """Return the record of an element's <attribute> tag."""
+    value = None
+    for child in iter_child_tags(attribute):
+        if child.name == 'processvalue':
+            value = child.get('value')
+            break
+    return AppModelAttribute(attribute.get('name'), attribute.get('inuse'), attribute.get('comparisontype'), value)
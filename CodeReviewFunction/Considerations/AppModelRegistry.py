@@ -0,0 +1,100 @@
+"""
+This module contains the AppModelRegistry, the App Models of the Objects in a release that other Objects inherit.
+
+An Object with a <parentobject> uses the App Model of the Object named in it rather than its own. Each Object is
+reviewed on its own, so the registry is built once for the release and given to every Object's StageIndex. It links
+the Object's AppModel to the AppModel of its parent, and so on up the chain, so a consideration can find an inherited
+element. Only the Objects that are inherited from are registered, which are found before the release is parsed (see
+SoupUtilities.get_parent_object_names).
+"""
+
+import hashlib
+from .AppModel import AppModel
+
+
+class AppModelRegistry:
+    """The AppModel of each Object in a release that another Object inherits from, by the Object's name."""
+
+    def __init__(self):
+        self._app_models = {}
+        self._parent_names = {}
+        self._inherited_keys = {}
+
+    def add_object(self, object_soup):
+        """Scan and register the App Model of an Object that other Objects inherit from.
+
+        :param object_soup: (bs4.Tag or XmlTag) Soup of a single BP Object. Only its AppModel is kept.
+        """
+        object_name = object_soup.get('name')
+        if object_name not in self._app_models:
+            self._app_models[object_name] = AppModel(object_soup.find('appdef', recursive=False))
+            self._parent_names[object_name] = get_parent_object_name(object_soup)
+
+    def get_app_model(self, object_soup) -> AppModel:
+        """Return the Object's AppModel, linked to the AppModel of the Object it inherits if that one is registered.
+
+        A registered Object gets its registered AppModel rather than its App Model being scanned again.
+
+        :param object_soup: (bs4.Tag or XmlTag) Soup of a single BP Object.
+        """
+        object_name = object_soup.get('name')
+        app_model = self._app_models.get(object_name)
+        if app_model is None:
+            app_model = AppModel(object_soup.find('appdef', recursive=False))
+            parent_name = get_parent_object_name(object_soup)
+        else:
+            parent_name = self._parent_names[object_name]
+        self._link_parents(app_model, parent_name)
+        return app_model
+
+    def get_inherited_key(self, parent_name) -> str:
+        """Return a hash of the App Models an Object with the parentobject inherits, or '' if none are registered.
+
+        Added to the Object's ReviewCache key and release fingerprint, as its report page changes with its parent's App
+        Model even when its own XML hasn't changed.
+        """
+        if parent_name not in self._app_models:
+            return ''
+        inherited_key = self._inherited_keys.get(parent_name)
+        if inherited_key is None:
+            key_hash = hashlib.sha256()
+            app_model = self._app_models[parent_name]
+            self._link_parents(app_model, self._parent_names[parent_name])
+            while app_model is not None:
+                key_hash.update(repr(app_model.elements).encode())
+                app_model = app_model.parent
+            inherited_key = self._inherited_keys[parent_name] = key_hash.hexdigest()
+        return inherited_key
+
+    def get_object_inherited_key(self, object_soup) -> str:
+        """Return get_inherited_key of the Object's parentobject, or '' if it has its own App Model."""
+        return self.get_inherited_key(get_parent_object_name(object_soup))
+
+    def _link_parents(self, app_model: AppModel, parent_name):
+        """Link the AppModel to its parent's AppModel, and each registered AppModel up the chain to its own parent.
+
+        A chain stops at an Object that isn't registered, or one that would make the chain inherit from itself.
+        """
+        while app_model.parent is None and parent_name is not None:
+            parent_app_model = self._app_models.get(parent_name)
+            if parent_app_model is None or _inherits_from(parent_app_model, app_model):
+                return
+            app_model.parent = parent_app_model
+            app_model, parent_name = parent_app_model, self._parent_names[parent_name]
+
+
+def get_parent_object_name(object_soup):
+    """Return the name of the Object whose App Model the Object inherits, or None if it has its own App Model."""
+    parent_object = object_soup.find('parentobject', recursive=False)
+    if parent_object is None or parent_object.string is None:
+        return None
+    return str(parent_object.string)
+
+
+def _inherits_from(app_model: AppModel, ancestor: AppModel) -> bool:
+    """Return True if the AppModel is the ancestor or is linked to it through its parents."""
+    while app_model is not None:
+        if app_model is ancestor:
+            return True
+        app_model = app_model.parent
+    return False
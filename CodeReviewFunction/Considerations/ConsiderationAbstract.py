@@ -15,6 +15,9 @@ class Consideration(ABC):
     INFREQUENTLY_SCALE = 0.3
     FREQUENTLY_SCALE = 0.7
 
+    # Set by considerations that only read the Object's ObjectModel, which are given it in place of the soup
+    USES_OBJECT_MODEL = False
+
     def __init__(self, max_score=10):
         self.score = max_score
         self.max_score = max_score  # Default for all Considerations
@@ -24,10 +27,14 @@ class Consideration(ABC):
         self.warning_list = []
 
     @abstractmethod
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context):
         """Check for error cases within the given soup for each specific report consideration.
 
         All errors found are appended to the object's self.errors list, with each error being a dict.
+        context is the Object's ReviewContext, which holds its type, the StageIndex shared by every consideration
+        checking it and a read only copy of the release metadata.
+        A consideration that sets USES_OBJECT_MODEL is given the Object's ObjectModel as soup, and mustn't use the
+        context's StageIndex, as it isn't built when no consideration checking the Object needs the soup.
         """
         ...
 
@@ -74,6 +81,11 @@ class Consideration(ABC):
         #  (assuming will cause the JArray issue again). This is needed for Capture.
         self._force_result(Result.NOT_APPLICABLE, 0, 0)
 
+    def _consideration_not_evaluated(self):
+        """Force the results for the consideration to 'Not Evaluated', as the review's deadline passed before it was
+        checked. Scored as 0 out of 0 like 'Not Applicable', so it doesn't count against the Object."""
+        self._force_result(Result.NOT_EVALUATED, 0, 0)
+
     def _force_result(self, result, score, max_score=None):
         """ Set the result of the consideration and override scoring of errors.
 
@@ -0,0 +1,61 @@
+"""
+This module contains the ConsiderationRegistry, which each consideration class is added to as its module is imported.
+
+The registry finds the class for a consideration name from the release config in a single dict lookup. Names are
+normalized so stray whitespace or a change of case in the config still finds the class.
+"""
+
+import logging
+
+
+class ConsiderationRegistry:
+    """Hash map from the normalized CONSIDERATION_NAME of each consideration class to the class."""
+
+    def __init__(self, consideration_type):
+        """
+        :param consideration_type: (str) The kind of consideration held, e.g. 'Object', used in log messages.
+        """
+        self.consideration_type = consideration_type
+        self.consideration_classes = {}
+
+    def register(self, consideration_class):
+        """Class decorator adding the consideration class to the registry under its CONSIDERATION_NAME."""
+        consideration_key = normalize_consideration_name(consideration_class.CONSIDERATION_NAME)
+        if consideration_key in self.consideration_classes:
+            raise ValueError("{} and {} have the same CONSIDERATION_NAME".format(
+                self.consideration_classes[consideration_key].__name__, consideration_class.__name__))
+        self.consideration_classes[consideration_key] = consideration_class
+        return consideration_class
+
+    def get_consideration_class(self, consideration_name):
+        """Return the consideration class for a name from the config, or None if no class has that name."""
+        return self.consideration_classes.get(normalize_consideration_name(consideration_name))
+
+    def get_active_classes(self, active_considerations, name_key):
+        """Return the classes of every consideration marked as active in the config.
+
+        :param active_considerations: (list) Config dicts of each consideration, e.g. the 'active considerations
+        object' value of the metadata.
+        :param name_key: (str) Key of the consideration's name in each config dict, e.g. 'Object Considerations'.
+        :return: (tuple) The list of active consideration classes in config order, and the list of active names in
+        the config that match no class.
+        """
+        active_classes = []
+        unmatched_names = []
+        for consideration_status_dict in active_considerations:
+            if consideration_status_dict['Active']:
+                consideration_class = self.get_consideration_class(consideration_status_dict[name_key])
+                if consideration_class is None:
+                    unmatched_names.append(consideration_status_dict[name_key])
+                elif consideration_class not in active_classes:
+                    active_classes.append(consideration_class)
+
+        if unmatched_names:
+            logging.warning("No {} consideration class matches the config names: {}".format(self.consideration_type,
+                                                                                         unmatched_names))
+        return active_classes, unmatched_names
+
+
+def normalize_consideration_name(consideration_name) -> str:
+    """Return the name lower case, with surrounding whitespace removed and any whitespace within it as single spaces."""
+    return ' '.join(consideration_name.split()).lower()
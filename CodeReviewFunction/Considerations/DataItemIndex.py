@@ -0,0 +1,55 @@
+"""
+This module contains the DataItemIndex, a lookup of a single BP Object's Data items by name.
+
+The Data stages are read once per Object into plain records, so a consideration that needs the datatype of the Data
+item an expression refers to can look it up by name rather than searching all of the Object's Data stages again.
+"""
+
+from collections import namedtuple
+from ..SoupUtilities import iter_child_tags, read_string
+
+
+class DataItem(namedtuple('DataItem', 'name, datatype, initialvalue, exposure, subsheetid')):
+    """A single Data item of a BP Object.
+
+    name (str): The Data item's name, as an expression refers to it in square brackets.
+    datatype (str): The Data item's datatype, e.g. 'flag'.
+    initialvalue (str): The Data item's initial value, or None if it doesn't have one.
+    exposure (str): How the Data item is exposed, e.g. 'Environment'. None if it isn't exposed.
+    subsheetid (str): subsheetid of the page the Data item is on, or None for the Initialise page.
+    """
+    __slots__ = ()
+
+
+class DataItemIndex:
+    """Hash map from the name of each Data item in a BP Object to its DataItem.
+
+    Names are unique within a page but not across pages. As with a search of the Object's Data stages, the first Data
+    item with a name is the one looked up.
+    """
+
+    def __init__(self, data_stages):
+        """
+        :param data_stages: (list) The Data stages of a single BP Object, in the order they appear in the Object.
+        """
+        self.data_items = {}
+        for data_stage in data_stages:
+            name = data_stage.get('name')
+            if name not in self.data_items:
+                self.data_items[name] = _read_data_item(data_stage, name)
+
+    def get(self, name) -> DataItem:
+        """Return the first Data item with the name, or None if the Object doesn't have one."""
+        return self.data_items.get(name)
+
+    def __len__(self):
+        return len(self.data_items)
+
+
+def _read_data_item(data_stage, name) -> DataItem:
+    """Return the record of a Data stage, read in a single pass over its child tags."""
+    strings = dict.fromkeys(DataItem._fields[1:])
+    for child in iter_child_tags(data_stage):
+        if child.name in strings and strings[child.name] is None:
+            strings[child.name] = read_string(child)
+    return DataItem(name, **strings)
@@ -0,0 +1,41 @@
+"""
+This module contains analyse_expression, which breaks a BP Decision or Choice expression down into its shape, the Data
+item it compares and whether it is a boolean or a comparison.
+
+Objects repeat the same expressions across their Decision and Choice stages, and a release repeats them across its
+Objects, so each expression is analysed once and the result cached by the expression's string.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+EXPRESSION_CACHE_SIZE = 4096
+
+DATA_ITEM_PATTERN = re.compile(r'\[(.*?)\]')
+COMPARISON_SIGNS = ('=', '<', '>')
+"""Every comparison operator ('=', '<>', '>', '>=', '<', '<=') contains one of these."""
+
+
+class ExpressionAnalysis(namedtuple('ExpressionAnalysis', 'shape, last_data_item, has_boolean, has_comparison_sign')):
+    """The parts of a single BP expression the considerations check.
+
+    shape (str): The expression with the name of each Data item removed and without spaces, e.g. '[]=[]'.
+    last_data_item (str): The text between the expression's last '[' and last ']', the name of its last Data item.
+    has_boolean (bool): True if the expression contains 'True' or 'False'.
+    has_comparison_sign (bool): True if any of the expression contains a comparison sign, including a Data item's name.
+    """
+    __slots__ = ()
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def analyse_expression(expression) -> ExpressionAnalysis:
+    """Return the ExpressionAnalysis of a BP expression, e.g. '[Found] = True'.
+
+    :param expression: (str) The expression of a Decision stage or of one of a Choice stage's choices.
+    """
+    return ExpressionAnalysis(
+        shape=DATA_ITEM_PATTERN.sub('[]', expression).replace(' ', ''),
+        last_data_item=expression[expression.rfind('[') + 1:expression.rfind(']')],
+        has_boolean='True' in expression or 'False' in expression,
+        has_comparison_sign=any(sign in expression for sign in COMPARISON_SIGNS))
@@ -0,0 +1,69 @@
+"""
+This module contains the FlowGraph, the onsuccess links between the stages of a single BP Object.
+
+Anchor stages only exist to route a link around the page, so the considerations skip over them. The graph follows every
+chain of Anchors once when it is built, meaning the next non-Anchor stage is a single dict lookup. A chain of Anchors
+that links back on itself, or to a stage that doesn't exist, resolves to None instead of being followed forever.
+"""
+
+
+class FlowGraph:
+    """Successor lookups for the stages of a single BP Object, with chains of Anchor stages collapsed ahead of time."""
+
+    def __init__(self, stage_index):
+        """Compile the graph from the stages in an Object's StageIndex.
+
+        :param stage_index: (StageIndex) Index of the Object's stages.
+        """
+        self._stage_index = stage_index
+        self.successors = {}  # stageid -> stageid of its onsuccess stage
+        for stage in stage_index.stages:
+            onsuccess = stage.onsuccess
+            if onsuccess and onsuccess.string:
+                self.successors[stage.get('stageid')] = onsuccess.string
+
+        self.anchor_targets = {}  # Anchor stageid -> stageid of the first non-Anchor stage it leads to, or None
+        self.cyclic_anchors = set()  # Anchor stageids whose chain of links loops forever
+        for anchor_stage in stage_index.get_stages('Anchor'):
+            self._collapse_anchor_chain(anchor_stage.get('stageid'))
+
+    def _collapse_anchor_chain(self, anchor_id):
+        """Follow a chain of Anchors from anchor_id, recording where every Anchor along it leads."""
+        chain = []
+        chain_ids = set()
+        current_id = anchor_id
+        while current_id is not None and current_id not in self.anchor_targets:
+            current_stage = self._stage_index.get_stage(current_id)
+            if current_stage is None:
+                target_id = None  # Linked to a stage that doesn't exist
+                break
+            if current_stage.get('type') != 'Anchor':
+                target_id = current_id
+                break
+            if current_id in chain_ids:
+                self.cyclic_anchors.update(chain_ids)
+                target_id = None
+                break
+            chain.append(current_id)
+            chain_ids.add(current_id)
+            current_id = self.successors.get(current_id)
+        else:
+            # Reached the end of the links, or an Anchor that has already been collapsed
+            target_id = self.anchor_targets.get(current_id) if current_id is not None else None
+
+        for chain_id in chain:
+            self.anchor_targets[chain_id] = target_id
+
+    def get_next_stage(self, stage):
+        """Return the stage the given stage's onsuccess links to, or None if it isn't linked."""
+        return self._stage_index.get_stage(self.successors.get(stage.get('stageid')))
+
+    def get_next_non_anchor_stage(self, stage):
+        """Return the first stage after the given stage that isn't an Anchor.
+
+        Returns None if the stage isn't linked, or if the Anchors after it end without a link or loop back on
+        themselves.
+        """
+        next_id = self.successors.get(stage.get('stageid'))
+        next_id = self.anchor_targets.get(next_id, next_id)
+        return self._stage_index.get_stage(next_id)
@@ -0,0 +1,67 @@
+"""
+This module contains the KeywordMatcher, which finds any of a list of keywords in a string with a single search.
+
+The considerations test names and values against lists of warning words, whitelists and blacklists. Rather than
+searching the string once for each word of a list, the list is compiled once into a single regular expression.
+"""
+
+import re
+
+
+class KeywordMatcher:
+    """A list of keywords compiled into one regular expression, matched as plain substrings of a string."""
+
+    def __init__(self, keywords, ignore_case=False):
+        """
+        :param keywords: (list) The keywords to find. They are plain strings, not patterns.
+        :param ignore_case: (bool) Lower case the keywords and each string searched, the same as comparing
+        keyword.lower() in string.lower().
+        """
+        self.keywords = tuple(keyword.lower() if ignore_case else keyword for keyword in keywords)
+        self.ignore_case = ignore_case
+        self._keyword_set = frozenset(self.keywords)
+        self._pattern = None
+        self._all_pattern = None
+        if self.keywords:
+            # Longest first, so the keyword matched at a position is the longest of those starting there
+            alternatives = '|'.join(re.escape(keyword)
+                                    for keyword in sorted(self._keyword_set, key=len, reverse=True))
+            self._pattern = re.compile(alternatives)
+            # A lookahead doesn't consume the match, so overlapping keywords are all found
+            self._all_pattern = re.compile('(?=({}))'.format(alternatives))
+
+    def search(self, string, end=None) -> str:
+        """Return the first keyword in the string, or None if it contains none of them.
+
+        The first keyword is the one starting earliest, or the longest of those starting at the same index.
+
+        :param string: (str) The string to search.
+        :param end: (int) Only find keywords ending at or before this index of the string (once lower cased if the
+        matcher ignores case). Defaults to the end of the string.
+        """
+        if self._pattern is None:
+            return None
+        if self.ignore_case:
+            string = string.lower()
+        match = self._pattern.search(string, 0, len(string) if end is None else max(end, 0))
+        return match.group() if match else None
+
+    def contains(self, string, end=None) -> bool:
+        """Return True if the string contains any of the keywords. See search()."""
+        return self.search(string, end) is not None
+
+    def find_all(self, string) -> list:
+        """Return every keyword the string contains, in the order they first appear in a single pass over it."""
+        if self._all_pattern is None:
+            return []
+        if self.ignore_case:
+            string = string.lower()
+        found = {}
+        for match in self._all_pattern.finditer(string):
+            longest_keyword = match.group(1)
+            # Shorter keywords starting at the same index are prefixes of the longest one
+            for length in range(1, len(longest_keyword) + 1):
+                keyword = longest_keyword[:length]
+                if keyword in self._keyword_set:
+                    found.setdefault(keyword)
+        return list(found)
@@ -1,16 +1,36 @@
 from bs4 import BeautifulSoup, Tag
 import logging
-import inspect
-import sys
 import re
 import time
+from functools import lru_cache
 from ..ReportPage import error_as_dict, warning_as_dict, Result
 from .ConsiderationAbstract import Consideration
+from .AppModel import AppModel, AppModelElement
+from .ConsiderationRegistry import ConsiderationRegistry
+from .ExpressionAnalysis import analyse_expression
+from .KeywordMatcher import KeywordMatcher
+from .ObjectModel import ObjectModel
+from .ReviewContext import ReviewContext
+from .StageIndex import StageIndex
+from .StageTable import LOGGING_MODES
 from .. import Constants
-from dateutil.parser import parse as dateparse
+from dateutil.parser import parse as dateparse, parserinfo
+
+OBJECT_CONSIDERATIONS = ConsiderationRegistry('Object')
+"""Every Object consideration class, added by the register decorator on each class."""
+
+DATE_WORDS = frozenset(word.lower() for words in parserinfo.JUMP + parserinfo.WEEKDAYS + parserinfo.MONTHS
+                       + parserinfo.HMS + parserinfo.AMPM + parserinfo.PERTAIN + parserinfo.UTCZONE
+                       for word in ([words] if isinstance(words, str) else words)) | {'nan', 'inf', 'infinity'}
+"""Lower case words dateutil's parser understands, along with the words float() reads as a number."""
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+TIMEZONE_NAME_PATTERN = re.compile(r'[A-Z]{1,5}')
+"""Words dateutil may take as a timezone name."""
+ATTRIBUTE_VALUE_CACHE_SIZE = 4096
 
 # -------------------------------------------------- Object Considerations Classes
 # Topic: Application Modeller Tree broken down
+@OBJECT_CONSIDERATIONS.register
 class CheckElementsLogicallyBrokenDown(Consideration):
     """Check App Model tree has at least two levels of descendants."""
     CONSIDERATION_NAME = "Are the elements logically broken down by screen or each part of the screen?"
@@ -24,11 +44,11 @@ class CheckElementsLogicallyBrokenDown(Consideration):
 
     def __init__(self): super().__init__(self.MAX_ERROR_SCORE)
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         appdef = soup.find('appdef', recursive=False)
         inherits_app_model = soup.find('parentobject', recursive=False)
 
-        if metadata['object type'] == Constants.OBJECT_TYPES['base']:
+        if context.object_type == Constants.OBJECT_TYPES['base']:
             # Ensure the base Object has an application model
             if appdef:
                 # Check the number of elements in the App Model
@@ -84,7 +104,7 @@ class CheckElementsLogicallyBrokenDown(Consideration):
                 self.errors_list.append(error_as_dict(error_str, ""))
                 print(error_str)
 
-        elif metadata['object type'] == Constants.OBJECT_TYPES['surface auto base']:
+        elif context.object_type == Constants.OBJECT_TYPES['surface auto base']:
             # Ensure the base Object has an application model
             if appdef:
                 if not inherits_app_model:
@@ -100,6 +120,7 @@ class CheckElementsLogicallyBrokenDown(Consideration):
 
 
 # Topic: Element - Names
+@OBJECT_CONSIDERATIONS.register
 class CheckElementNamesFollowBestPractice(Consideration):
     # TODO: Ensure the metadata from checklist contains a check to flip the order name/type. This is used
     #  in the method params of _check_element_title
@@ -111,6 +132,7 @@ class CheckElementNamesFollowBestPractice(Consideration):
     ELEMENT_TYPE_WHITELIST = ['box', 'button', 'label', 'field', 'link', 'text', 'tab', 'main', 'title', 'window',
                               'region', 'list', 'popup', 'input', 'header', 'section', 'table', 'element',
                               'edit', 'toolbar']
+    ELEMENT_TYPE_MATCHER = KeywordMatcher(ELEMENT_TYPE_WHITELIST, ignore_case=True)
     # Settings
     WARNING_ELEMENT_TYPE_LENGTH = 16  # Max length of a element type before warning created.
 
@@ -120,9 +142,9 @@ class CheckElementNamesFollowBestPractice(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Check that best practice was used when naming the App Modeller tree elements."""
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             appdef = soup.find('appdef', recursive=False)
             inherits_app_model = soup.find('parentobject', recursive=False)
             elements = appdef.find_all('element')
@@ -147,7 +169,7 @@ class CheckElementNamesFollowBestPractice(Consideration):
                         self._check_element_title(element, application_type)
 
                     # Checks specific to Surface Automation Base Objects
-                    if metadata['object type'] == Constants.OBJECT_TYPES['surface auto base']:
+                    if context.object_type == Constants.OBJECT_TYPES['surface auto base']:
                         regions = appdef.find_all('region')
                         for region in regions:
                             region_name = region.get('name')
@@ -197,7 +219,7 @@ class CheckElementNamesFollowBestPractice(Consideration):
             return False
 
         # Check the element type within the name matches the whitelist
-        if any(element_type in element_list[type_idx].lower() for element_type in self.ELEMENT_TYPE_WHITELIST):
+        if self.ELEMENT_TYPE_MATCHER.contains(element_list[type_idx]):
             if len(element_list[type_idx]) >= self.WARNING_ELEMENT_TYPE_LENGTH:
                 warning_str = "Element type may be excessively long"
                 self.warning_list.append(warning_as_dict(warning_str, element_list[type_idx]))
@@ -288,11 +310,13 @@ class CheckElementNamesFollowBestPractice(Consideration):
 
 
 # Topic: Element attribute selection
+@OBJECT_CONSIDERATIONS.register
 class CheckValuesContainCustomerData(Consideration):
 
     CONSIDERATION_NAME = "No values contain any environment specific data?"
 
     APPLICATION_TYPES = ['HTML', 'Java', 'Win32', 'Browser', 'Mainframe']
+    WARNING_WORDS = KeywordMatcher(['username', 'password', 'billing', 'qty', 'quantity', 'code', 'name', 'account'])
     # Settings
     PASS_HURDLE = 0
     FREQUENTLY_HURDLE = 3
@@ -300,13 +324,12 @@ class CheckValuesContainCustomerData(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             appdef = soup.find('appdef', recursive=False)
             inherits_app_model = soup.find('parentobject', recursive=False)
             if appdef:  # Ensure the base Object has an application model
                 if not inherits_app_model:
-                    elements = appdef.find_all('element')
                     application_type = appdef.find('apptypeinfo', recursive=False).find('id', recursive=False).string
                     application_type = application_type.replace('Launch', '').replace('Attach', '')
 
@@ -318,8 +341,8 @@ class CheckValuesContainCustomerData(Consideration):
 
                     # Ignore the root element and validate all elements' attributes
                     root_element_found = False
-                    for element in elements:
-                        element_basetype = element.find('basetype', recursive=False).string
+                    for element in context.stage_index.app_model.elements:
+                        element_basetype = element.basetype
                         if not root_element_found:
                             if element_basetype == 'Application':
                                 root_element_found = True
@@ -358,19 +381,18 @@ class CheckValuesContainCustomerData(Consideration):
         else:
             self._consideration_not_applicable()
 
-    def _check_attributes_windows(self, element: Tag, element_basetype):
+    def _check_attributes_windows(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['WindowText']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False).contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
+            attribute_name = attribute.name
             # Ignore if it doesn't have a value
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
 
             if attribute_value:
@@ -386,33 +408,31 @@ class CheckValuesContainCustomerData(Consideration):
                     self.warning_list.append(warning_as_dict(warning_str, ""))
                     print(warning_str)
 
-    def _check_attributes_html(self, element: Tag, element_basetype):
+    def _check_attributes_html(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['Title', 'Value']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
+        element_name = element.name
 
-        input_type = attributes.find('attribute', {'name': 'InputType'}, recursive=False)
+        input_type = element.get_attribute('InputType')
         if input_type:
-            if input_type.processvalue.get('value') == 'button':
+            if input_type.value == 'button':
                 # print('found a button')
                 return
 
-        tag_name = attributes.find('attribute', {'name': 'TagName'}, recursive=False)
+        tag_name = element.get_attribute('TagName')
         if tag_name:
-            tag_name_value = tag_name.processvalue.get('value')
+            tag_name_value = tag_name.value
             if tag_name_value == 'A' or tag_name_value == 'BUTTON':
                 # print('link tag or button')
                 return
 
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
 
             if attribute_value:
@@ -429,20 +449,17 @@ class CheckValuesContainCustomerData(Consideration):
                     self.warning_list.append(warning_as_dict(warning_str, ""))
                     print(warning_str)
 
-    def _check_attributes_aa(self, element: Tag, element_basetype):
+    def _check_attributes_aa(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['Name', 'pName', 'WindowText', 'Value', 'Description']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
-
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
             # Ignore if value is empty
             if attribute_value:
@@ -459,19 +476,17 @@ class CheckValuesContainCustomerData(Consideration):
                     self.warning_list.append(warning_as_dict(warning_str, ""))
                     print(warning_str)
 
-    def _check_attributes_java(self, element: Tag, element_basetype):
+    def _check_attributes_java(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['Name', 'Description', 'JavaText']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
             # Ignore if value is blank
             if attribute_value:
@@ -497,57 +512,31 @@ class CheckValuesContainCustomerData(Consideration):
          """
         attributes_check_list = []
         for attribute in attributes:
-            if attribute.get('inuse'):
-                if not attribute.get('comparisontype'):
+            if attribute.inuse:
+                if not attribute.comparisontype:
                     continue
-                elif attribute.get('comparisontype') != 'dynamic':
+                elif attribute.comparisontype != 'dynamic':
                     continue
-            if attribute.get('name') in ATTRIBUTES_TO_CHECK:
+            if attribute.name in ATTRIBUTES_TO_CHECK:
                 attributes_check_list.append(attribute)
 
         return attributes_check_list
 
-    @staticmethod
-    def _useless_value(attribute_value):
-        """Determine if the attribute value is empty or contains no useful information."""
-        attribute_value_stripped = ''.join(char for char in attribute_value if char not in '(){}<>,./ ')
-        # Don't care about single characters
-        if len(attribute_value_stripped) <= 1:
-            return True
-        # Value equal to number 0
-        try:
-            if float(attribute_value_stripped) == 0:
-                return True
-        except ValueError:
-            pass
-
-        # Check if value is just a date
-        try:
-            dateparse(attribute_value)
-            return True
-        except ValueError:
-            pass
-
-    @staticmethod
-    def _potential_customer_data(attribute_value):
+    @classmethod
+    def _potential_customer_data(cls, attribute_value):
         """Determine if a key warning word is in the value of the attribute which may indicate customer data."""
-        WARNING_WORDS = ['username', 'password', 'billing', 'qty', 'quantity', 'code', 'name', 'account']
         attribute_value = attribute_value.lower()
-        # Find if an error word is in the warning word list
-        error_word_gen = (error_word for error_word in WARNING_WORDS if error_word in attribute_value)
-        for error_word in error_word_gen:
-            chars_after_error_word = len(attribute_value) - (attribute_value.find(error_word) + len(error_word))
-            if chars_after_error_word > 1:
-                return True
-        else:
-            return False
+        # Find if an error word in the warning word list is followed by more than one character
+        return cls.WARNING_WORDS.contains(attribute_value, end=len(attribute_value) - 2)
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckValuesContainEnvironmentData(Consideration):
 
     CONSIDERATION_NAME = "No attribute values contain Customer data?"
 
     APPLICATION_TYPES = ['HTML', 'Java', 'Win32', 'Browser', 'Mainframe']
+    WARNING_WORDS = KeywordMatcher(['dev', 'test', 'uat', 'prod', 'staging', 'sandbox', 'env'], ignore_case=True)
     # Settings
     PASS_HURDLE = 0
     FREQUENTLY_HURDLE = 3
@@ -555,13 +544,12 @@ class CheckValuesContainEnvironmentData(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             appdef = soup.find('appdef', recursive=False)
             inherits_app_model = soup.find('parentobject', recursive=False)
             if appdef:  # Ensure the base Object has an application model
                 if not inherits_app_model:
-                    elements = appdef.find_all('element')
                     application_type = appdef.find('apptypeinfo', recursive=False).find('id', recursive=False).string
                     application_type = application_type.replace('Launch', '').replace('Attach', '')
 
@@ -573,8 +561,8 @@ class CheckValuesContainEnvironmentData(Consideration):
 
                     # Ignore the root element and validate all elements' attributes
                     root_element_found = False
-                    for element in elements:
-                        element_basetype = element.find('basetype', recursive=False).string
+                    for element in context.stage_index.app_model.elements:
+                        element_basetype = element.basetype
                         # Skip the root element
                         if not root_element_found:
                             if element_basetype == 'Application':
@@ -607,18 +595,17 @@ class CheckValuesContainEnvironmentData(Consideration):
         else:
             self._consideration_not_applicable()
 
-    def _check_attributes_windows(self, element: Tag, element_basetype):
+    def _check_attributes_windows(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['AncestorsText', 'pWindowText', 'WindowText']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False).contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
 
             if attribute_value:
@@ -628,20 +615,17 @@ class CheckValuesContainEnvironmentData(Consideration):
                         .format(element_name, element_basetype, attribute_name, attribute_value.strip())
                     self.errors_list.append(error_as_dict(error_str, ""))
 
-    def _check_attributes_html(self, element: Tag, element_basetype):
+    def _check_attributes_html(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['pURL']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
-
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
 
             if attribute_value:
@@ -652,20 +636,17 @@ class CheckValuesContainEnvironmentData(Consideration):
                     self.errors_list.append(error_as_dict(error_str, ""))
                     print(error_str)
 
-    def _check_attributes_aa(self, element: Tag, element_basetype):
+    def _check_attributes_aa(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['Name', 'pName', 'WindowText', 'AncestorText']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
-
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
             # Ignore if value is empty
             if attribute_value:
@@ -683,19 +664,17 @@ class CheckValuesContainEnvironmentData(Consideration):
                     # self.warning_list.append(warning_as_dict(warning_str, ""))
                     # print(warning_str)
 
-    def _check_attributes_java(self, element: Tag, element_basetype):
+    def _check_attributes_java(self, element: AppModelElement, element_basetype):
         ATTRIBUTES_TO_CHECK = ['Name', 'Description', 'JavaText']
 
-        element_name = element.get('name')
-        attributes = element.find('attributes', recursive=False)
-        attributes = attributes.contents
-        attributes_check_list = self._get_checkable_attrs(attributes, ATTRIBUTES_TO_CHECK)
+        element_name = element.name
+        attributes_check_list = self._get_checkable_attrs(element.attributes, ATTRIBUTES_TO_CHECK)
 
         for attribute in attributes_check_list:
-            attribute_name = attribute.get('name')
-            attribute_value = attribute.find('processvalue', recursive=False).get('value')
+            attribute_name = attribute.name
+            attribute_value = attribute.value
             # Ignore any basic/empty values
-            if self._useless_value(attribute_value):
+            if is_useless_attribute_value(attribute_value):
                 return
 
             if attribute_value:
@@ -714,43 +693,22 @@ class CheckValuesContainEnvironmentData(Consideration):
         """
         attributes_check_list = []
         for attribute in attributes:
-            if attribute.get('inuse'):
-                if attribute.get('comparisontype') != 'dynamic' and attribute.get('comparisontype') != 'd':
-                    if attribute.get('name') in ATTRIBUTES_TO_CHECK:
+            if attribute.inuse:
+                if attribute.comparisontype != 'dynamic' and attribute.comparisontype != 'd':
+                    if attribute.name in ATTRIBUTES_TO_CHECK:
                         attributes_check_list.append(attribute)
 
         return attributes_check_list
 
-    @staticmethod
-    def _useless_value(attribute_value):
-        """Determine if the attribute value is empty or contains no useful information."""
-        attribute_value_stripped = ''.join(char for char in attribute_value if char not in '(){}<>,./ ')
-        # Don't care about single characters
-        if len(attribute_value_stripped) <= 1:
-            return True
-        # Value equal to number 0
-        try:
-            if float(attribute_value_stripped) == 0:
-                return True
-        except ValueError:
-            pass
-        # Check if value is just a date
-        try:
-            dateparse(attribute_value)
-            return True
-        except ValueError:
-            pass
-
-    @staticmethod
-    def _potential_env_data(attribute_value):
+    @classmethod
+    def _potential_env_data(cls, attribute_value):
         """Determine if a key warning word is in the value of the attribute which may indicate environment data."""
-        WARNING_WORDS = ['dev', 'test', 'uat', 'prod', 'staging', 'sandbox', 'env']
-        attribute_value = attribute_value.lower()
         # Find if attribute contains word in the warning word list
-        if any(error_word in attribute_value for error_word in WARNING_WORDS):
-                return True
+        if cls.WARNING_WORDS.contains(attribute_value):
+            return True
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckTechnologySpecificAttributes(Consideration):
 
     CONSIDERATION_NAME = "All technology specific attributes have been checked / unchecked?"
@@ -766,7 +724,7 @@ class CheckTechnologySpecificAttributes(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         win32_attrs_disabled = ['X', 'Y', 'Width', 'Height', 'ScreenBounds', 'pCtrlID', 'pHeight', 'pWidth', 'pX', 'pY']
         html_attrs_disabled = ['X', 'Y', 'Width', 'Height', 'ScreenBounds', 'pURL', 'Link']
         java_attrs_disabled = ['X', 'Y', 'Width', 'Height', 'ScreenBounds']
@@ -778,13 +736,12 @@ class CheckTechnologySpecificAttributes(Consideration):
         aa_attrs_enabled = ['MatchIndex', 'Invisible']
         # Note: Doesn't do surface automation regions or region-containers
 
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             appdef = soup.find('appdef', recursive=False)
             inherits_app_model = soup.find('parentobject', recursive=False)
 
             if appdef:  # Ensure the base Object has an application model
                 if not inherits_app_model:
-                    elements = appdef.find_all('element')
                     application_type = appdef.find('apptypeinfo', recursive=False).find('id', recursive=False).string
                     application_type = application_type.replace('Launch', '').replace('Attach', '')
 
@@ -810,8 +767,8 @@ class CheckTechnologySpecificAttributes(Consideration):
 
                     # Ignore the root element and validate all elements' attributes
                     root_element_found = False
-                    for element in elements:
-                        element_basetype = element.find('basetype', recursive=False).string
+                    for element in context.stage_index.app_model.elements:
+                        element_basetype = element.basetype
                         if not root_element_found:
                             if element_basetype == 'Application':
                                 root_element_found = True
@@ -850,26 +807,26 @@ class CheckTechnologySpecificAttributes(Consideration):
         else:
             self._consideration_not_applicable()
 
-    def _check_element_attributes(self, element: Tag, element_basetype, attrs_disabled=None, attrs_enabled=None):
-        element_name = element.get('name')
+    def _check_element_attributes(self, element: AppModelElement, element_basetype, attrs_disabled=None,
+                                  attrs_enabled=None):
+        element_name = element.name
         # Find all attributes that are used to Match for this element
         attributes_in_use = []
-        attributes = element.find('attributes', recursive=False).contents
-        for attribute in attributes:
-            if attribute.get('inuse'):
+        for attribute in element.attributes:
+            if attribute.inuse:
                 attributes_in_use.append(attribute)
 
         attrs_not_disabled = []
         # Loop through all attributes that should or shouldn't be enabled
         # and add them ot a list
         for attribute_used in attributes_in_use:
-            attr_name = attribute_used.get('name')
+            attr_name = attribute_used.name
             if attrs_disabled:
                 if attr_name in attrs_disabled:
-                    if not attribute_used.get('comparisontype'):  # Attribute is dynamic / wildcard
+                    if not attribute_used.comparisontype:  # Attribute is dynamic / wildcard
                         # Don't add an error if Link or ParentURL are selected but have empty values
                         if attr_name == 'Link' or attr_name == 'pURL':
-                            if attribute_used.contents[0].get('value'):
+                            if attribute_used.value:
                                 attrs_not_disabled.append(attr_name)
                         else:
                             attrs_not_disabled.append(attr_name)
@@ -894,6 +851,7 @@ class CheckTechnologySpecificAttributes(Consideration):
             self.warning_list.append(warning_as_dict(warning_str, element_name))
 
 # Topic: Documentation
+@OBJECT_CONSIDERATIONS.register
 class CheckActionsDocumentation(Consideration):
     """Pre/Post conditions are only required for Base Objects.
 
@@ -907,52 +865,51 @@ class CheckActionsDocumentation(Consideration):
     INFREQUENTLY_HURDLE = 6
     MAX_SCORE = 5
 
+    BLACKLIST_ACTION_NAMES = KeywordMatcher(['attach', 'initialise', 'clean up', 'detach'])
+
     def __init__(self): super().__init__(self.MAX_SCORE)
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        BLACKLIST_ACTION_NAMES = ['attach', 'initialise', 'clean up', 'detach']
-        start_stages = soup.find_all('stage', type='Start', recursive=False)
-        end_stages = soup.find_all('stage', type='End', recursive=False)
-        action_subsheets = get_action_subsheets(soup)  # return list of tuple (id, name)
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        start_stages = context.stage_index.get_stages('Start')
+        end_stages = context.stage_index.get_stages('End')
+        action_resolver = context.stage_index.action_resolver
 
         # Find Subsheet Descriptions
-        subsheet_info_stages = soup.find_all('stage', type='SubSheetInfo')
+        subsheet_info_stages = context.stage_index.get_stages('SubSheetInfo')
         for subsheet_info_stage in subsheet_info_stages:
             action_description = subsheet_info_stage.narrative.string
             if action_description is None:
                 # Match the description stage with the Actions name and record the error
                 action_name = subsheet_info_stage.get('name')
-                if check_not_blacklisted(BLACKLIST_ACTION_NAMES, action_name):
+                if check_not_blacklisted(self.BLACKLIST_ACTION_NAMES, action_name):
                     self.errors_list.append(error_as_dict("Missing Action Description", action_name))
 
         # Find input and output param descriptions
         for start_stage in start_stages:
             if start_stage.inputs:
-                for input_param in start_stage.inputs.contents:
-                    if isinstance(input_param, Tag):
-                        if not input_param.get('narrative'):
-                            param_name = input_param.get('name')
-                            start_stage_id = start_stage.subsheetid.string
-                            action_name = subsheetid_to_action(start_stage_id, action_subsheets)
-                            error_str = "Missing input param description: {}".format(param_name)
-                            self.errors_list.append(error_as_dict(error_str, action_name))
+                for input_param in start_stage.inputs.find_all(True, recursive=False):
+                    if not input_param.get('narrative'):
+                        param_name = input_param.get('name')
+                        start_stage_id = start_stage.subsheetid.string
+                        action_name = action_resolver.get_action_name(start_stage_id)
+                        error_str = "Missing input param description: {}".format(param_name)
+                        self.errors_list.append(error_as_dict(error_str, action_name))
 
         for end_stage in end_stages:
             if end_stage.outputs:
-                for output_param in end_stage.outputs.contents:
-                    if isinstance(output_param, Tag):
-                        if not output_param.get('narrative'):
-                            param_name = output_param.get('name')
-                            end_stage_id = end_stage.subsheetid.string
-                            action_name = subsheetid_to_action(end_stage_id, action_subsheets)
-                            error_str = "Missing output param description: {}".format(param_name)
-                            self.errors_list.append(error_as_dict(error_str, action_name))
+                for output_param in end_stage.outputs.find_all(True, recursive=False):
+                    if not output_param.get('narrative'):
+                        param_name = output_param.get('name')
+                        end_stage_id = end_stage.subsheetid.string
+                        action_name = action_resolver.get_action_name(end_stage_id)
+                        error_str = "Missing output param description: {}".format(param_name)
+                        self.errors_list.append(error_as_dict(error_str, action_name))
 
         # Find pre and post conditions
         for start_stage in start_stages:
             if start_stage.subsheetid:  # Initialize's Start doesn't have subsheetid
-                action_name = subsheetid_to_action(start_stage.subsheetid.string, action_subsheets)
-                if check_not_blacklisted(BLACKLIST_ACTION_NAMES, action_name):
+                action_name = action_resolver.get_action_name(start_stage.subsheetid.string)
+                if action_resolver.not_blacklisted(self.BLACKLIST_ACTION_NAMES, start_stage.subsheetid.string):
                     conditions_documented = True
                     error_str = ""
                     if start_stage.preconditions is None:
@@ -969,14 +926,15 @@ class CheckActionsDocumentation(Consideration):
                     if not conditions_documented:
                         # If the Object is a Wrapper, flag a warning. If it's a Base Object, flag as an error.
                         # Base Surface Automation Objects don't require a pre/post condition due to their nature.
-                        if metadata['object type'] == Constants.OBJECT_TYPES['wrapper']:
+                        if context.object_type == Constants.OBJECT_TYPES['wrapper']:
                             error_str += ' in Wrapper'
                             self.warning_list.append(warning_as_dict(error_str, action_name))
-                        elif metadata['object type'] == Constants.OBJECT_TYPES['base']:
+                        elif context.object_type == Constants.OBJECT_TYPES['base']:
                             self.errors_list.append(error_as_dict(error_str, action_name))
 
 
 # Topic: Exposure
+@OBJECT_CONSIDERATIONS.register
 class CheckObjectExposureValid(Consideration):
     """Check the current Object exposure is valid.
 
@@ -991,7 +949,7 @@ class CheckObjectExposureValid(Consideration):
 
     def __init__(self): super().__init__(self.MAX_SCORE)
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         object_run_mode = soup.get('runmode')
         application_modeller = soup.find('appdef', recursive=False)
         inherits_app_model = soup.find('parentobject', recursive=False)
@@ -1003,6 +961,7 @@ class CheckObjectExposureValid(Consideration):
 
 
 # Topic: Use of Attach
+@OBJECT_CONSIDERATIONS.register
 class CheckObjHasAttach(Consideration):
     """"Does the Business Object have an 'Attach' Action that reads the connected status before Attaching?
 
@@ -1010,17 +969,18 @@ class CheckObjHasAttach(Consideration):
     """
     CONSIDERATION_NAME = "Does the Business Object have an 'Attach' Action " \
                          "that reads the connected status before Attaching?"
+    USES_OBJECT_MODEL = True
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, object_model: ObjectModel, context: ReviewContext):
         """Go through an object and ensure at least one page contains the word 'Attach'."""
         # Wrapper Objects do not require an Attach
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             attach_found = False
-            subsheets = soup.find_all('subsheet', recursive=False)  # Find all page names
+            subsheets = object_model.subsheets  # Find all page names
             for subsheet in subsheets:
-                if subsheet.next_element.string.lower().find("attach") >= 0:  # A page has the word 'Attach' in it
+                if subsheet.name.lower().find("attach") >= 0:  # A page has the word 'Attach' in it
                     attach_found = True
                     # TODO: Ensure this page also has a read attached stage (maybe)
                     break
@@ -1033,6 +993,7 @@ class CheckObjHasAttach(Consideration):
             self._consideration_not_applicable()
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckActionsUseAttach(Consideration):
     CONSIDERATION_NAME = "Do all Actions start with an Attach page reference?"
     # Settings
@@ -1040,25 +1001,26 @@ class CheckActionsUseAttach(Consideration):
     FREQUENTLY_HURDLE = 2
     INFREQUENTLY_HURDLE = 3
 
+    BLACKLIST_ACTION_NAMES = KeywordMatcher(['launch', 'close', 'terminate', 'attach', 'initialise', 'clean up',
+                                             'detach', 'send key'])
+
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata) -> list:
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext) -> list:
         """Goes through all Actions to check if they start with an Attach stage."""
         # TODO: Ask Xave if close and terminate get to be skipped or are they needed?
-        BLACKLIST_ACTION_NAMES = ['launch', 'close', 'terminate', 'attach', 'initialise', 'clean up', 'detach',
-                                  'send key']
-
-        start_stages = soup.find_all('stage', type='Start', recursive=False)
-        action_pages = soup.find_all('subsheet', recursive=False)
-        page_reference_stages = soup.find_all('stage', type='SubSheet')
+        start_stages = context.stage_index.get_stages('Start')
+        action_pages = context.stage_index.subsheets
+        page_reference_stages = context.stage_index.get_stages('SubSheet')
 
         # Wrapper Actions do not require an Attach as the first stage.
         # Check the Action does not contain a word from the blacklist and ensure the first stage is a Attach.
         # TODO: check this works. 'metadata' got deleted and there were not flags for errors...
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             for action_page in action_pages:
                 action_name = action_page.next_element.string
-                if check_not_blacklisted(BLACKLIST_ACTION_NAMES, action_name):
+                action_subsheet_id = action_page.get('subsheetid')
+                if context.stage_index.action_resolver.not_blacklisted(self.BLACKLIST_ACTION_NAMES, action_subsheet_id):
                     if not self._action_begins_attach(action_page, start_stages, page_reference_stages):
                         error_str = "Action doesn't start with Attach stage"
                         self.errors_list.append(error_as_dict(error_str, action_name))
@@ -1085,6 +1047,7 @@ class CheckActionsUseAttach(Consideration):
 
 
 # Topic: Correct use of Wait Stages
+@OBJECT_CONSIDERATIONS.register
 class CheckActionStartWait(Consideration):
     CONSIDERATION_NAME = "Does each Action start with a Wait stage to verify the application is in the correct state?"
     # Settings
@@ -1092,32 +1055,32 @@ class CheckActionStartWait(Consideration):
     FREQUENTLY_HURDLE = 1
     INFREQUENTLY_HURDLE = 4
 
+    BLACKLIST_ACTION_NAMES = KeywordMatcher(['launch', 'close', 'terminate', 'attach', 'initialise', 'clean up',
+                                             'detach', 'send key'])
+
     def __init__(self):
         super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Check if each Action starts with an Attach page reference followed by a Wait 'Check Exists' stage."""
-        BLACKLIST_ACTION_NAMES = ['launch', 'close', 'terminate', 'attach', 'initialise', 'clean up', 'detach',
-                                  'send key']
-
-        action_pages = soup.find_all('subsheet', recursive=False)
-        start_stages = soup.find_all('stage', type='Start', recursive=False)
+        action_pages = context.stage_index.subsheets
+        start_stages = context.stage_index.get_stages('Start')
 
         # Wrapper Actions do not require an Attach as the first stage as each contained Action will have an Attach
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
             # Iterate over all Actions in the Object
             for action_page in action_pages:
                 action_name = action_page.next_element.string
-                if check_not_blacklisted(BLACKLIST_ACTION_NAMES, action_name):
-                    action_subsheet_id = action_page.get('subsheetid')
+                action_subsheet_id = action_page.get('subsheetid')
+                if context.stage_index.action_resolver.not_blacklisted(self.BLACKLIST_ACTION_NAMES, action_subsheet_id):
                     # Goes through all start stages in the Object
                     for start_stage in start_stages:
                         # Finds the start stage of the current Action
                         if start_stage.subsheetid:
                             if start_stage.subsheetid.string == action_subsheet_id:
-                                success_stage = get_onsuccess_tag(start_stage, soup)
+                                success_stage = get_onsuccess_tag(start_stage, context.stage_index)
                                 if success_stage.get('type') == 'SubSheet':  # Next stage a subsheet (Attach)
-                                    success_stage = get_onsuccess_tag(success_stage, soup)
+                                    success_stage = get_onsuccess_tag(success_stage, context.stage_index)
                                     if success_stage.get('type') == 'WaitStart':  # Following stage a Wait
                                         if len(success_stage.choices.contents) > 0:  # Wait has conditions
                                             check_exists = False
@@ -1144,6 +1107,7 @@ class CheckActionStartWait(Consideration):
             self._consideration_not_applicable()
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckGlobalTimeoutUsedWaits(Consideration):
     """Checks that Global timeout data items exist on the Initialise page and ensure that they are used for
     all Wait stages within the Object.
@@ -1159,12 +1123,12 @@ class CheckGlobalTimeoutUsedWaits(Consideration):
 
     def __init__(self): super().__init__(self.MAX_SCORE)
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         # Don't check wait stages if Surface Automation used
         # TODO: In future, go through all the 'Sleep' Actions and ensure they use global timeouts too
 
-        data_stages = soup.find_all('stage', type='Data')
-        wait_stages = soup.find_all('stage', type='WaitStart')
+        data_stages = context.stage_index.get_stages('Data')
+        wait_stages = context.stage_index.get_stages('WaitStart')
 
         init_data_items = []
         for data_stage in data_stages:
@@ -1176,16 +1140,17 @@ class CheckGlobalTimeoutUsedWaits(Consideration):
             self._force_result(Result.NO, 0)  # hard fail the entire consideration
             return
 
+        init_data_item_matcher = KeywordMatcher(init_data_items)
         for wait_stage in wait_stages:
             timeout = wait_stage.timeout.string
-            if not any(init_data_item in timeout for init_data_item in init_data_items):
-                action_subsheets = get_action_subsheets(soup)
-                action_name = subsheetid_to_action(wait_stage.subsheetid.string, action_subsheets)
+            if not init_data_item_matcher.contains(timeout):
+                action_name = context.stage_index.action_resolver.get_action_name(wait_stage.subsheetid.string)
                 wait_stage_name = wait_stage.get('name')
                 error_string = "Wait stage '{}' has timeout value: {}".format(wait_stage_name, timeout, action_name)
                 self.errors_list.append(error_as_dict(error_string, action_name))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckWaitNotArbitrary(Consideration):
     CONSIDERATION_NAME = "Do Wait stages have conditions (i.e. not arbitrary)? " \
                          "Do not include arbitrary Waits if used for Surface Automation purposes only."
@@ -1196,26 +1161,23 @@ class CheckWaitNotArbitrary(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Check that all Wait stages have at least one condition (no arbitrary Waits).
 
         If 'Surface Automation Used?' in the configuration settings form is TRUE, this check will be ignored.
         """
         # TODO: Make sure an exception is made for Java automaiton, where arbitrary waits are acceptable
         # Don't check wait stages if Surface Automation used
-        if metadata['additional info']['Surface Automation Used?'] == 'TRUE':
+        if context.metadata['additional info']['Surface Automation Used?'] == 'TRUE':
             self._consideration_not_applicable()
             return
 
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
-            action_subsheets = None
-            wait_stages = soup.find_all('stage', type='WaitStart', recursive=False)
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
+            wait_stages = context.stage_index.get_stages('WaitStart')
             if wait_stages:
                 for wait_stage in wait_stages:
                     if len(wait_stage.choices) == 0:
-                        if not action_subsheets:
-                            action_subsheets = get_action_subsheets(soup)
-                        action_name = subsheetid_to_action(wait_stage.subsheetid.string, action_subsheets)
+                        action_name = context.stage_index.action_resolver.get_action_name(wait_stage.subsheetid.string)
                         error_str = "Wait stage has no condition: '{}'".format(wait_stage.get('name'))
                         self.errors_list.append(error_as_dict(error_str, action_name))
 
@@ -1228,6 +1190,7 @@ class CheckWaitNotArbitrary(Consideration):
             self._consideration_not_applicable()
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckNavigateFollowedByWait(Consideration):
     CONSIDERATION_NAME = "Are Navigation stages between application screens followed by a Wait stage to verify success?"
     # Settings
@@ -1235,12 +1198,12 @@ class CheckNavigateFollowedByWait(Consideration):
     FREQUENTLY_HURDLE = 3
     INFREQUENTLY_HURDLE = 6
 
-    ACTION_BLACKLIST = ['attach', 'detach', 'terminate', 'close']
+    ACTION_BLACKLIST = KeywordMatcher(['attach', 'detach', 'terminate', 'close'])
     ELEMENT_BASETYPE_WHITELIST = ['HTMLCombo', 'HTMLRadioButton']  # TODO: This is just HTML, need to do other modes
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Check all navigate stages to ensure they are followed by a Wait or End stage.
 
         If the Navigate uses a 'Pause between each step' value, this will be accepted as a wait. This check will also
@@ -1249,35 +1212,31 @@ class CheckNavigateFollowedByWait(Consideration):
 
         This check is only applicable to normal base Objects.
         """
-        if metadata['object type'] == Constants.OBJECT_TYPES['base']:
-            action_subsheets = None
-            navigate_stages = soup.find_all('stage', type='Navigate', recursive=False)
+        if context.object_type == Constants.OBJECT_TYPES['base']:
+            action_resolver = context.stage_index.action_resolver
+            navigate_stages = context.stage_index.get_stages('Navigate')
 
             if navigate_stages:
-                if not action_subsheets:
-                    action_subsheets = get_action_subsheets(soup)
                 for navigate_stage in navigate_stages:
                     if navigate_stage.onsuccess is not None:
-                        action_name = subsheetid_to_action(navigate_stage.subsheetid.string, action_subsheets)
-                        if check_not_blacklisted(self.ACTION_BLACKLIST, action_name):
-                            current_stage = navigate_stage
-                            # Keep going through success stages while they are Anchors
-                            while True:
-                                success_stage = soup.find('stage', stageid=current_stage.onsuccess.string,
-                                                          recursive=False)
-                                success_type = success_stage.get('type')
-                                if not success_type == 'Anchor':
-                                    break
-                                else:
-                                    current_stage = success_stage
+                        action_name = action_resolver.get_action_name(navigate_stage.subsheetid.string)
+                        if action_resolver.not_blacklisted(self.ACTION_BLACKLIST, navigate_stage.subsheetid.string):
+                            # Skip over any Anchors following the Navigate
+                            success_stage = context.stage_index.flow_graph.get_next_non_anchor_stage(navigate_stage)
+                            if success_stage is None:
+                                error_str = "Navigate stage isn't connected to another stage"
+                                self.errors_list.append(error_as_dict(error_str, action_name))
+                                continue
+                            success_type = success_stage.get('type')
 
                             # Check if the next stage isn't a Wait or an End
                             if success_type != 'WaitStart' and success_type != 'End':
                                 # Accept a 'Pause after each step' as a Wait
                                 if navigate_stage.get('interval') is None:
-                                    self._check_element_is_selectable(navigate_stage, action_name, soup)
+                                    self._check_element_is_selectable(navigate_stage, action_name,
+                                                                      context.stage_index.app_model)
                     else:
-                        action_name = subsheetid_to_action(navigate_stage.subsheetid.string, action_subsheets)
+                        action_name = action_resolver.get_action_name(navigate_stage.subsheetid.string)
                         error_str = "Navigate stage isn't connected to another stage"
                         self.errors_list.append(error_as_dict(error_str, action_name))
             # Consideration not applicable if no navigate stages
@@ -1287,7 +1246,7 @@ class CheckNavigateFollowedByWait(Consideration):
         else:
             self._consideration_not_applicable()
 
-    def _check_element_is_selectable(self, navigate_stage, action_name, soup):
+    def _check_element_is_selectable(self, navigate_stage, action_name, app_model: AppModel):
         """Check each step in a Navigate stage to see if any application elements are selectable."""
         navigate_steps = navigate_stage.find_all('step', recursive=False)
         error_str, warning_str = '', ''
@@ -1296,14 +1255,14 @@ class CheckNavigateFollowedByWait(Consideration):
             # Find the element being used by the Navigate so that it can be determined if  combo box is being selected
             element_id = navigate_step.element.get('id')
             if element_id:
-                element = soup.find('id', text=element_id)
-                if element:  # element wont be found if App Model is inherited
-                    element_datatype = element.parent.datatype.string
-                    element_basetype = element.parent.basetype
+                element = app_model.get_element(element_id)
+                if element:  # element wont be found if App Model is inherited from an Object that isn't linked
+                    element_datatype = element.datatype
+                    element_basetype = element.basetype
                     # Navigate is changing value of flag, so is acceptable without Wait
                     if element_datatype == 'flag':
                         return
-                    elif any(basetype in element_basetype for basetype in self.ELEMENT_BASETYPE_WHITELIST):
+                    elif element_basetype in self.ELEMENT_BASETYPE_WHITELIST:
                         # print("PASS basetype: '{}', datatype '{}'".format(element_basetype, element_datatype))
                         return
                     else:
@@ -1320,12 +1279,12 @@ class CheckNavigateFollowedByWait(Consideration):
         self.errors_list.append(error_as_dict(error_str, action_name))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckWaitTimeoutToException(Consideration):
     """Checks if a Wait stage times out to an Exception or End stage.
 
     It will allow a single Calc stage before either the Exception or the End to pass on information from the Object.
-    If a Wait stage times out to an Anchor stage, it will keep following the successive anchors until it reaches
-    a non-anchor stage.
+    If a Wait stage times out to an Anchor stage, the successive anchors are skipped using the Object's FlowGraph.
     """
     CONSIDERATION_NAME = "Do Wait stages timeout to an exception?"
     # Settings
@@ -1335,68 +1294,29 @@ class CheckWaitTimeoutToException(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
-            wait_end_stages = soup.find_all('stage', type='WaitEnd', recursive=False)
-            exception_stages = soup.find_all('stage', type='Exception', recursive=False)
-            end_stages = soup.find_all('stage', type='End', recursive=False)
-            calc_stages = soup.find_all('stage', type='Calculation', recursive=False)
-
-            # Extracting the End and Exception stage id's as its faster to check the onsuccess against a python list
-            # rather then searching through the full bs4 soup for a the next stage
-            exception_stage_ids = []
-            for exception_stage in exception_stages:
-                exception_stage_ids.append(exception_stage.get('stageid'))
-
-            end_stage_ids = []
-            for end_stage in end_stages:
-                end_stage_ids.append(end_stage.get('stageid'))
-
-            calc_stage_ids = []
-            for calc_stage in calc_stages:
-                calc_stage_ids.append(calc_stage.get('stageid'))
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        if context.object_type != Constants.OBJECT_TYPES['wrapper']:
+            wait_end_stages = context.stage_index.get_stages('WaitEnd')
+            flow_graph = context.stage_index.flow_graph
 
             for wait_end_stage in wait_end_stages:
-                onsucccess_id = wait_end_stage.onsuccess
-                previously_found_calc = False
-                if onsucccess_id:
-                    # This will follow Anchor stages until an end stage is found
-                    while True:
-                        # Check next stage isn't an Exception stage
-                        if not any(exception_id in onsucccess_id.string for exception_id in exception_stage_ids):
-                            # Check next isn't an End stage
-                            if not any(end_id in onsucccess_id.string for end_id in end_stage_ids):
-                                # Check next is a Calc stage
-                                if any(calc_id in onsucccess_id.string for calc_id in calc_stage_ids):
-                                    if not previously_found_calc:
-                                        previously_found_calc = True
-                                    else:
-                                        # Second calc after found so fail
-                                        onsuccess_type = 'Calculation'
-                                        break
-                                onsuccess_stage = soup.find('stage', stageid=onsucccess_id.string, recursive=False)
-                                onsuccess_type = onsuccess_stage.get('type')
-                                onsucccess_id = onsuccess_stage.onsuccess
-                                if onsuccess_type not in ['Anchor', 'Calculation']:
-                                    break
-                            else:
-                                onsuccess_type = 'End'
-                                break
-                        else:
-                            onsuccess_type = 'Exception'
-                            break
+                onsuccess_stage = flow_graph.get_next_non_anchor_stage(wait_end_stage)
+                # Allow a single Calc stage (and any Anchors after it) before the End or Exception
+                if onsuccess_stage is not None and onsuccess_stage.get('type') == 'Calculation':
+                    onsuccess_stage = flow_graph.get_next_non_anchor_stage(onsuccess_stage)
 
+                if onsuccess_stage is not None:
+                    onsuccess_type = onsuccess_stage.get('type')
                     if not (onsuccess_type == 'End' or onsuccess_type == 'Exception'):
                         wait_name = wait_end_stage.get('name')
-                        action_subsheets = get_action_subsheets(soup)
-                        action_name = subsheetid_to_action(wait_end_stage.subsheetid.string, action_subsheets)
+                        action_name = context.stage_index.action_resolver.get_action_name(
+                            wait_end_stage.subsheetid.string)
                         error_str = "'{}' timed out to a {} stage".format(wait_name, onsuccess_type)
                         self.errors_list.append(error_as_dict(error_str, action_name))
 
                 else:
                     wait_name = wait_end_stage.get('name')
-                    action_subsheets = get_action_subsheets(soup)
-                    action_name = subsheetid_to_action(wait_end_stage.subsheetid.string, action_subsheets)
+                    action_name = context.stage_index.action_resolver.get_action_name(wait_end_stage.subsheetid.string)
                     error_str = "'{}' timeout has no connection".format(wait_name)
                     self.errors_list.append(error_as_dict(error_str, action_name))
 
@@ -1406,6 +1326,7 @@ class CheckWaitTimeoutToException(Consideration):
 
 
 # Topic: Re-usable Actions
+@OBJECT_CONSIDERATIONS.register
 class CheckActionsReusable(Consideration):
         CONSIDERATION_NAME = "Are the Actions re-useable?"
         # Settings
@@ -1415,19 +1336,19 @@ class CheckActionsReusable(Consideration):
 
         def __init__(self): super().__init__()
 
-        def check_consideration(self, soup: BeautifulSoup, metadata):
+        def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
             """Check to ensure a base Action uses only all reads, all writes or all navigates."""
-            if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+            if context.object_type != Constants.OBJECT_TYPES['wrapper']:
                 NAVIGATE_ACTION_WHITELIST = ['DetachApplication', 'ActivateApp', 'AttachApplication']
 
                 read_subsheetids = []
                 write_subsheetids = []
                 navigate_subsheetids = []
 
-                read_stages = soup.find_all('stage', type='Read', recursive=False)
-                write_stages = soup.find_all('stage', type='Write', recursive=False)
-                navigate_stages = soup.find_all('stage', type='Navigate', recursive=False)
-                action_subsheets = get_action_subsheets(soup)
+                read_stages = context.stage_index.get_stages('Read')
+                write_stages = context.stage_index.get_stages('Write')
+                navigate_stages = context.stage_index.get_stages('Navigate')
+                action_resolver = context.stage_index.action_resolver
 
                 # Get all subsheetids
                 for read_stage in read_stages:
@@ -1472,34 +1393,35 @@ class CheckActionsReusable(Consideration):
 
                 # Create errors for Actions with more than read, write or nav
                 for duplicate_subsheetid in read_and_write:
-                    action_name = subsheetid_to_action(duplicate_subsheetid, action_subsheets)
+                    action_name = action_resolver.get_action_name(duplicate_subsheetid)
                     error_str = "Action contains both a Read and a Write stage. " \
                                 "\nBase Actions should only have one form of interaction for reusability."
                     self.errors_list.append(error_as_dict(error_str, action_name))
 
                 for duplicate_subsheetid in read_and_navigate:
-                    action_name = subsheetid_to_action(duplicate_subsheetid, action_subsheets)
+                    action_name = action_resolver.get_action_name(duplicate_subsheetid)
                     error_str = "Action contains both a Read and a Navigate stage. " \
                                 "\nBase Actions should only have one form of interaction for reusability."
                     self.errors_list.append(error_as_dict(error_str, action_name))
 
                 for duplicate_subsheetid in navigate_and_write:
-                    action_name = subsheetid_to_action(duplicate_subsheetid, action_subsheets)
+                    action_name = action_resolver.get_action_name(duplicate_subsheetid)
                     error_str = "Action contains both a Navigate and a Write stage. " \
                                 "\nBase Actions should only have one form of interaction for reusability."
                     self.errors_list.append(error_as_dict(error_str, action_name))
 
                 for subsheet_with_all in read_write_navigate:
-                    action_name = subsheetid_to_action(subsheet_with_all, action_subsheets)
+                    action_name = action_resolver.get_action_name(subsheet_with_all)
                     error_str = "Action contains Read, Write and Navigate stages. " \
                                 "\nBase Actions should only have one form of interaction for reusability."
                     self.errors_list.append(error_as_dict(error_str, action_name))
 
             # Unable to check reusability of wrappers due to complexity
-            elif metadata['object type'] == Constants.OBJECT_TYPES['wrapper']:
+            elif context.object_type == Constants.OBJECT_TYPES['wrapper']:
                 self._force_result(Result.NO, 0, 0)
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckObjectsNoBusinessLogic(Consideration):
     CONSIDERATION_NAME = "Is there no Business Logic in any Actions that should be at the Process level?"
     # Settings
@@ -1507,24 +1429,24 @@ class CheckObjectsNoBusinessLogic(Consideration):
     FREQUENTLY_HURDLE = 4
     INFREQUENTLY_HURDLE = 7
 
+    LOOP_COUNTER_WHITELIST = KeywordMatcher(['retry', 'retries', 'loop', 'count'])
+    BASE_ACTION_DECISION_WHITELIST = KeywordMatcher(['attach', 'detach', 'launch', 'terminate'])
+    FLAG_COMPARISON_SHAPES = ('[]=[]', '[]<>[]')
+
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        decision_stages = soup.find_all('stage', type='Decision', recursive=False)
-        choice_stages = soup.find_all('stage', type='ChoiceStart', recursive=False)
-        action_subsheets = None
-        LOOP_COUNTER_WHITELIST = ['retry', 'retries', 'loop', 'count']
-        BASE_ACTION_DECISION_WHITELIST = ['attach', 'detach', 'launch', 'terminate']
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        decision_stages = context.stage_index.get_stages('Decision')
+        choice_stages = context.stage_index.get_stages('ChoiceStart')
+        action_resolver = context.stage_index.action_resolver
 
         # Ensure there are no choice or decision stages in base Objects,
         # except for Attach and Detach Actions
-        if metadata['object type'] == Constants.OBJECT_TYPES['base']:
+        if context.object_type == Constants.OBJECT_TYPES['base']:
             if choice_stages:
                 for choice_stage in choice_stages:
-                    if not action_subsheets:
-                        action_subsheets = get_action_subsheets(soup)
                     subsheetid = choice_stage.subsheetid.string
-                    action_name = subsheetid_to_action(subsheetid, action_subsheets)
+                    action_name = action_resolver.get_action_name(subsheetid)
                     stage_name = choice_stage.get('name')
                     error_str = "Choice stage '{}' in a base Object".format(stage_name)
                     self.errors_list.append(error_as_dict(error_str, action_name))
@@ -1533,12 +1455,9 @@ class CheckObjectsNoBusinessLogic(Consideration):
 
             if decision_stages:
                 for decision_stage in decision_stages:
-                    if not action_subsheets:
-                        action_subsheets = get_action_subsheets(soup)
                     subsheetid = decision_stage.subsheetid.string
-                    action_name = subsheetid_to_action(subsheetid, action_subsheets)
-                    if not any(whitelist_action in action_name.lower()
-                               for whitelist_action in BASE_ACTION_DECISION_WHITELIST):
+                    action_name = action_resolver.get_action_name(subsheetid)
+                    if not action_resolver.action_name_contains(subsheetid, self.BASE_ACTION_DECISION_WHITELIST):
                         stage_name = decision_stage.get('name')
                         expression = decision_stage.decision.get('expression')
                         error_str = "Decision stage '{}' in a base Object\nExpression: '{}'"\
@@ -1550,10 +1469,8 @@ class CheckObjectsNoBusinessLogic(Consideration):
         # For wrapper Objects and Surface Automation Base Objects
         # ensure that any decision/choice stages are numerical comparisons or checking flags
         # Otherwise, may indicate business logic
-        elif metadata['object type'] != Constants.OBJECT_TYPES['base']:
+        elif context.object_type != Constants.OBJECT_TYPES['base']:
             if choice_stages:
-                if not action_subsheets:
-                    action_subsheets = get_action_subsheets(soup)
                 for choice_stage in choice_stages:
                     choices = choice_stage.choices
                     # Checks all the choices in Multi-Choice stage to see if all of them use flags.
@@ -1561,9 +1478,9 @@ class CheckObjectsNoBusinessLogic(Consideration):
                         expression = choice.get('expression')
                         stage_name = choice_stage.get('name')
                         subsheetid = choice_stage.subsheetid.string
-                        action_name = subsheetid_to_action(subsheetid, action_subsheets)
+                        action_name = action_resolver.get_action_name(subsheetid)
                         if not self._expression_uses_flag(expression):
-                            if not self.expression_compares_with_flag(expression, soup):
+                            if not self.expression_compares_with_flag(expression, context.stage_index):
                                 warning_str = "\nChoice stage '{}' has decision not based on a flag Data item. " \
                                               "This could suggest Process logic in a Business Object." \
                                               "\nExpression '{}"\
@@ -1574,18 +1491,16 @@ class CheckObjectsNoBusinessLogic(Consideration):
                                 break
 
             if decision_stages:
-                if not action_subsheets:
-                    action_subsheets = get_action_subsheets(soup)
                 for decision_stage in decision_stages:
                     decision_name = decision_stage.get('name').lower()
                     # Decision name doesn't demonstrate that it is a loop
-                    if not any(loop_string in decision_name for loop_string in LOOP_COUNTER_WHITELIST):
+                    if not self.LOOP_COUNTER_WHITELIST.contains(decision_name):
                         expression = decision_stage.decision.get('expression')
                         stage_name = decision_stage.get('name')
                         subsheetid = decision_stage.subsheetid.string
-                        action_name = subsheetid_to_action(subsheetid, action_subsheets)
+                        action_name = action_resolver.get_action_name(subsheetid)
                         if not self._expression_uses_flag(expression):
-                            if not self.expression_compares_with_flag(expression, soup):
+                            if not self.expression_compares_with_flag(expression, context.stage_index):
                                 warning_str = "\nDecision could potentially indicate Business logic " \
                                               "appropriate for the Process level. \nDecision name: '{}' \nExpression: '{}'"\
                                     .format(stage_name, expression)
@@ -1607,27 +1522,23 @@ class CheckObjectsNoBusinessLogic(Consideration):
             bool: True for success, False otherwise.
 
         """
-        COMPARISON_SIGNS = ['=', '<>', '>', '>=', '<', '<=']
         # Checks for 'foo = True', if not then checks for '[foo]'
-        if 'True' in expression or 'False' in expression:
+        analysis = analyse_expression(expression)
+        if analysis.has_boolean:
             return True
-        elif any(comparison in expression for comparison in COMPARISON_SIGNS):
+        elif analysis.has_comparison_sign:
             return False
         else:
             return True
 
-    @staticmethod
-    def expression_compares_with_flag(expression, soup: BeautifulSoup):
+    @classmethod
+    def expression_compares_with_flag(cls, expression, stage_index: StageIndex):
         """Check if the expression is a comparison of two Data items of type Flag."""
-        # Removes all text within the brackets
-        removed_dataitems = re.sub('\[.*?\]', '[]', expression).replace(' ', '')
-        if removed_dataitems == '[]=[]' or removed_dataitems == '[]<>[]':
-            # Extract last Data item in expression to check if its a flag
-            data_item_name = expression[expression.rfind("[") + 1:expression.rfind("]")]
-            data_item = soup.find('stage', {'name': data_item_name}, type='Data', recursive=False)
-            if data_item:
-                if data_item.datatype.string == 'flag':
-                    return True
+        analysis = analyse_expression(expression)
+        if analysis.shape in cls.FLAG_COMPARISON_SHAPES:
+            # Check the last Data item in the expression is a flag
+            data_item = stage_index.data_items.get(analysis.last_data_item)
+            return data_item is not None and data_item.datatype == 'flag'
         return False
 
     def evaluate_score_and_result(self, forced_score_scale=None, forced_result=None):
@@ -1678,6 +1589,7 @@ class CheckObjectsNoBusinessLogic(Consideration):
 
 
 # Topic: Action Size
+@OBJECT_CONSIDERATIONS.register
 class CheckNoActionCalledInAction(Consideration):
     CONSIDERATION_NAME = "No Actions call other published Actions?"
     # Settings
@@ -1687,17 +1599,17 @@ class CheckNoActionCalledInAction(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Go through all stages in an Object and check that none are Action stages.
 
         Wrapper objects and Surface Automation Base objects are allowed to call Actions. Will show uses of the
         'Sleep' Action as a warning.
         """
-        action_subsheets = get_action_subsheets(soup)
-        action_stages = soup.find_all('stage', type='Action', recursive=False)
+        action_resolver = context.stage_index.action_resolver
+        action_stages = context.stage_index.get_stages('Action')
 
         # Consideration not applicable to wrappers
-        if metadata['object type'] == Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type == Constants.OBJECT_TYPES['wrapper']:
             self._consideration_not_applicable()
 
         if action_stages:
@@ -1706,10 +1618,10 @@ class CheckNoActionCalledInAction(Consideration):
                 if action_stage.next_element.name == 'subsheetid':
                     action_stage_subsheetid = action_stage.next_element.string
                     # Find the subsheet name from the subsheetid
-                    action_name = subsheetid_to_action(action_stage_subsheetid, action_subsheets)
+                    action_name = action_resolver.get_action_name(action_stage_subsheetid)
                     error_str = "Action '{}' called in Object".format(action_stage.get('name'))
                     # Actions in the Base level are errors
-                    if metadata['object type'] == Constants.OBJECT_TYPES['base']:
+                    if context.object_type == Constants.OBJECT_TYPES['base']:
                         self.errors_list.append(error_as_dict(error_str, action_name))
                     else:
                         # If its a Wrapper or Surface Automation Base, consideration is not applicable
@@ -1720,6 +1632,7 @@ class CheckNoActionCalledInAction(Consideration):
                             self.warning_list.append(warning_as_dict(error_str, action_name))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckNoOverlyComplexActions(Consideration):
     CONSIDERATION_NAME = "Checked there are no overly complex pages that could be broken up?"
     # Settings
@@ -1732,23 +1645,18 @@ class CheckNoOverlyComplexActions(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         """Check that amount of stages per page does not exceed the limits."""
         IGNORE_TYPES = ['SubSheetInfo', 'ProcessInfo', 'Note', 'Data', 'Collection', 'Block',
                         'Anchor', 'WaitEnd', 'Start']
 
-        action_subsheets = get_action_subsheets(soup)
-        all_stages = soup.find_all('stage', recursive=False)
-
-        for action_id, action_name in action_subsheets:
-            current_action_stages = []
-            # Get all applicable stages that exist in that Action page
-            for stage in all_stages:
-                if stage.get('type') not in IGNORE_TYPES:
-                    if stage.subsheetid and action_id == stage.subsheetid.string:
-                        current_action_stages.append(stage)
+        action_resolver = context.stage_index.action_resolver
+        stage_table = context.stage_index.stage_table
+        # Count all applicable stages on each Action page
+        stage_counts = stage_table.count_by_page(stage_table.mask_not(stage_table.type_mask(IGNORE_TYPES)))
 
-            action_stages_count = len(current_action_stages)
+        for action_id, action_name in action_resolver.items():
+            action_stages_count = stage_counts.get(action_id, 0)
             if action_stages_count > self.MAX_STAGES_PER_PAGE:
                 error_str = "Action has more than {} stages ({})"\
                     .format(self.MAX_STAGES_PER_PAGE, action_stages_count)
@@ -1761,29 +1669,30 @@ class CheckNoOverlyComplexActions(Consideration):
 
 
 # Topic: Exception Handling
+@OBJECT_CONSIDERATIONS.register
 class CheckExceptionDetails(Consideration):
     CONSIDERATION_NAME = "Do all Exception stages have an exception detail?"
     # Settings
     PASS_HURDLE = 0
     FREQUENTLY_HURDLE = 1
     INFREQUENTLY_HURDLE = 4
+    USES_OBJECT_MODEL = True
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, object_model: ObjectModel, context: ReviewContext):
         """Find all exception stages with empty an exception detail field."""
         logging.info("'CheckExceptionDetail method called")
-        exception_stages = soup.find_all('exception')
-        for exception_stage in exception_stages:
+        for exception_stage, exception in object_model.get_exceptions():
             # Exception has no detail and is not a preserve
-            if not exception_stage.get('detail') and not exception_stage.get('usecurrent'):
-                exception_name = exception_stage.parent.get('name')
-                parent_subsheet_id = exception_stage.parent.subsheetid.string
-                exception_page = soup.find('subsheet', {'subsheetid': parent_subsheet_id}).next_element.string
+            if not exception.detail and not exception.usecurrent:
+                exception_name = exception_stage.name
+                exception_page = object_model.get_action_name(exception_stage.subsheetid)
 
                 self.errors_list.append(error_as_dict(exception_name, exception_page))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckExceptionAppropriateTypeDetail(Consideration):
     CONSIDERATION_NAME = "Do Exceptions provide appropriate Type and Detail?"
     # Settings
@@ -1794,55 +1703,45 @@ class CheckExceptionAppropriateTypeDetail(Consideration):
     FREQUENTLY_HURDLE = 1
     INFREQUENTLY_HURDLE = 4
     MAX_SCORE = 5  # Almost all Objects should pass this easy check
+    USES_OBJECT_MODEL = True
 
     def __init__(self): super().__init__(self.MAX_SCORE)
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, object_model: ObjectModel, context: ReviewContext):
         """Ensure Exception details are of appropriate length and flags warnings for Business Excep in Base Objects."""
-        exception_stages = soup.find_all('exception')
-        action_subsheets = None
-
-        for exception_stage in exception_stages:
+        for exception_stage, exception in object_model.get_exceptions():
             # Exception is not a preserve
-            if not exception_stage.get('usecurrent'):
-                if metadata['object type'] != Constants.OBJECT_TYPES['wrapper']:
+            if not exception.usecurrent:
+                if context.object_type != Constants.OBJECT_TYPES['wrapper']:
                     # If Business Exception in a Base Object, mark as an error
-                    if 'Business' in exception_stage.get('type'):
-                        if not action_subsheets:
-                            action_subsheets = get_action_subsheets(soup)
-                        exception_name = exception_stage.parent.get('name')
-                        parent_subsheet_id = exception_stage.parent.subsheetid.string
-                        exception_page_name = subsheetid_to_action(parent_subsheet_id, action_subsheets)
+                    if 'Business' in exception.type:
+                        exception_name = exception_stage.name
+                        exception_page_name = object_model.get_action_name(exception_stage.subsheetid)
                         error_str = "Business Exception in a Base Object: '{}'".format(exception_name)
                         self.errors_list.append(error_as_dict(error_str, exception_page_name))
 
                 # If Exception detail length not adequate
-                detail_length = len(exception_stage.get('detail'))
+                detail_length = len(exception.detail)
                 if detail_length < self.MIN_DETAIL_LENGTH:
                     # Flag an error
-                    if not action_subsheets:
-                        action_subsheets = get_action_subsheets(soup)
-                    exception_name = exception_stage.parent.get('name')
-                    exception_detail = exception_stage.get('detail')
-                    parent_subsheet_id = exception_stage.parent.subsheetid.string
-                    exception_page_name = subsheetid_to_action(parent_subsheet_id, action_subsheets)
+                    exception_name = exception_stage.name
+                    exception_detail = exception.detail
+                    exception_page_name = object_model.get_action_name(exception_stage.subsheetid)
                     error_str = "Exception '{}' has less than {} characters ({}) - {}" \
                         .format(exception_name, self.MIN_DETAIL_LENGTH, detail_length, exception_detail)
                     self.errors_list.append(error_as_dict(error_str, exception_page_name))
 
                 # Flag a Warning
                 elif detail_length < self.WARNING_DETAIL_LENGTH:
-                    if not action_subsheets:
-                        action_subsheets = get_action_subsheets(soup)
-                    exception_name = exception_stage.parent.get('name')
-                    exception_detail = exception_stage.get('detail')
-                    parent_subsheet_id = exception_stage.parent.subsheetid.string
-                    exception_page_name = subsheetid_to_action(parent_subsheet_id, action_subsheets)
+                    exception_name = exception_stage.name
+                    exception_detail = exception.detail
+                    exception_page_name = object_model.get_action_name(exception_stage.subsheetid)
                     warning_str = "Exception '{}' has less than {} characters ({}) - {}"\
                         .format(exception_name, self.WARNING_DETAIL_LENGTH, detail_length, exception_detail)
                     self.warning_list.append(warning_as_dict(warning_str, exception_page_name))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckExceptionType(Consideration):
     CONSIDERATION_NAME = "Do Exception Types follow Best Practice?"
     # Settings
@@ -1850,34 +1749,32 @@ class CheckExceptionType(Consideration):
     FREQUENTLY_HURDLE = 1
     INFREQUENTLY_HURDLE = 3
 
+    EXCEPTION_TYPE_WHITELIST = KeywordMatcher(['system exception', 'business exception'], ignore_case=True)
+    USES_OBJECT_MODEL = True
+
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, object_model: ObjectModel, context: ReviewContext):
         """Check Exception type is either System or Business exception."""
-        EXCEPTION_TYPE_WHITELIST = ['system exception', 'business exception']
-        exception_stages = soup.find_all('exception')
-        for exception_stage in exception_stages:
+        for exception_stage, exception in object_model.get_exceptions():
             # Ignore preserve exceptions
-            if not exception_stage.get('usecurrent'):
-                exception_name = exception_stage.parent.get('name')
-                exception_type = exception_stage.get('type')
+            if not exception.usecurrent:
+                exception_name = exception_stage.name
+                exception_type = exception.type
 
                 if not exception_type:
-                    parent_subsheet_id = exception_stage.parent.subsheetid.string
-                    action_subsheets = get_action_subsheets(soup)
-                    exception_page = subsheetid_to_action(parent_subsheet_id, action_subsheets)
+                    exception_page = object_model.get_action_name(exception_stage.subsheetid)
                     error_str = "'{}' has no Exception Type".format(exception_name)
                     self.errors_list.append(error_as_dict(error_str, exception_page))
 
                 else:
-                    if not any(correct_type in exception_type.lower() for correct_type in EXCEPTION_TYPE_WHITELIST):
-                        parent_subsheet_id = exception_stage.parent.subsheetid.string
-                        action_subsheets = get_action_subsheets(soup)
-                        exception_page = subsheetid_to_action(parent_subsheet_id, action_subsheets)
+                    if not self.EXCEPTION_TYPE_WHITELIST.contains(exception_type):
+                        exception_page = object_model.get_action_name(exception_stage.subsheetid)
                         error_str = "'{}' has Exception Type of '{}'".format(exception_name, exception_type)
                         self.errors_list.append(error_as_dict(error_str, exception_page))
 
 
+@OBJECT_CONSIDERATIONS.register
 class CheckObjectsNotRecoverExceptions(Consideration):
     CONSIDERATION_NAME = "Objects do not try to recover exceptions (should be Process logic)?"
     # Settings
@@ -1885,45 +1782,43 @@ class CheckObjectsNotRecoverExceptions(Consideration):
     FREQUENTLY_HURDLE = 1
     INFREQUENTLY_HURDLE = 2
 
+    ACTIONS_WHITELIST = KeywordMatcher(['attach', 'detach'])
+
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        ACTIONS_WHITELIST = ['attach', 'detach']
-        recover_stages = soup.find_all('stage', type='Recover', recursive=False)
-        action_subsheets = None
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        recover_stages = context.stage_index.get_stages('Recover')
+        action_resolver = context.stage_index.action_resolver
         errored_subsheetids = []  # Ensure same error doesn't appear multiple times for a single Action
 
         for recover_stage in recover_stages:
             # Flag a warning for Recovers in wrappers
-            if metadata['object type'] == Constants.OBJECT_TYPES['wrapper']:
-                if not action_subsheets:
-                    action_subsheets = get_action_subsheets(soup)
+            if context.object_type == Constants.OBJECT_TYPES['wrapper']:
                 action_subsheetid = recover_stage.subsheetid.string
                 if action_subsheetid not in errored_subsheetids:
                     errored_subsheetids.append(action_subsheetid)
-                    action_name = subsheetid_to_action(recover_stage.subsheetid.string, action_subsheets)
+                    action_name = action_resolver.get_action_name(recover_stage.subsheetid.string)
                     warning_str = "Exception handling (Recover stage) in a wrapper Object"
                     self.warning_list.append(warning_as_dict(warning_str, action_name))
 
             # Flag errors for Recovers in base Objects
             else:
-                if not action_subsheets:
-                    action_subsheets = get_action_subsheets(soup)
                 action_subsheetid = recover_stage.subsheetid.string
                 if action_subsheetid not in errored_subsheetids:
                     errored_subsheetids.append(action_subsheetid)
-                    action_name = subsheetid_to_action(recover_stage.subsheetid.string, action_subsheets)
+                    action_name = action_resolver.get_action_name(recover_stage.subsheetid.string)
                     # Attach and Detach actions are allowed to have some basic exceptions handling
-                    if not any(whitelist_word in action_name.lower() for whitelist_word in ACTIONS_WHITELIST):
+                    if not action_resolver.action_name_contains(action_subsheetid, self.ACTIONS_WHITELIST):
                         error_str = "Exception handling (Recover stage) in base Object"
                         self.errors_list.append(error_as_dict(error_str, action_name))
 
-        if metadata['object type'] == Constants.OBJECT_TYPES['wrapper']:
+        if context.object_type == Constants.OBJECT_TYPES['wrapper']:
             # Consideration scoring not applicable to wrappers
             self._consideration_not_applicable()
 
 
 # Topic: Logging
+@OBJECT_CONSIDERATIONS.register
 class CheckLoggingAdhereToPolicy(Consideration):
     """Checks if any stages have logging turned on when Process is in production,
 
@@ -1936,101 +1831,67 @@ class CheckLoggingAdhereToPolicy(Consideration):
     FREQUENTLY_HURDLE = 4
     INFREQUENTLY_HURDLE = 7
 
-    LOGGING_MODE = {
-        'disabled': 1,
-        'errors only': 2,
-        'enabled': 3
-    }
+    LOGGING_MODE = LOGGING_MODES
+    # TODO: This data needs to come from metadata
+    ALL_DISABLED = False
+    ALL_ERRORS_ONLY = False
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
         NO_LOGGING_TYPES = ['SubSheetInfo', 'ProcessInfo', 'Note', 'Data', 'Collection', 'Block', 'Anchor']
 
-        # TODO: This data needs to come from metadata
-        all_disabled = False
-        all_errors_only = False
+        all_disabled = self.ALL_DISABLED
+        all_errors_only = self.ALL_ERRORS_ONLY
         allowed_logging_stage_types = ['Exception', 'Calculation', 'Decision']
         allowed_logging_mode = self.LOGGING_MODE['errors only']
 
         # TODO: Have metadata override if this check is to be done in testing or UAT
-        if metadata['additional info']['Delivery Stage'] == 'Production':
-            action_subsheets = get_action_subsheets(soup)
-            all_stages = soup.find_all('stage', recursive=False)
-
-            for stage in all_stages:
-                stage_name = stage.get('name')
-                stage_type = stage.get('type')
-
-                if stage_type not in NO_LOGGING_TYPES:
-                    stage_logging_mode = self._get_stage_logging(stage)
-
-                    if all_disabled:
-                        if not stage_logging_mode <= self.LOGGING_MODE['disabled']:
-                            # Current stage type isn't valid
-                            if stage_type not in allowed_logging_stage_types:
-                                if stage.subsheetid:  # Skips stages on initialise page
-                                    action_name = subsheetid_to_action(stage.subsheetid.string, action_subsheets)
-                                    error_str = "Logging is not disabled: {} stage '{}'".format(stage_type, stage_name)
-                                    self.errors_list.append(error_as_dict(error_str, action_name))
-                                    print(error_str)
-                                    print(action_name + '\n')
-                            # Current stage type is valid
-                            else:
-                                # Current stages logging mode is less strict than the allowed logging mode
-                                if not stage_logging_mode <= allowed_logging_mode:
-                                    if stage.subsheetid:  # Skips stages on initialise page
-                                        action_name = subsheetid_to_action(stage.subsheetid.string, action_subsheets)
-                                        error_str = "Stage's type is in the logging exception list, " \
-                                                    "but logging type is less strict than the allowed mode: " \
-                                                    "{} stage '{}'".format(stage_type, stage_name)
-                                        self.errors_list.append(error_as_dict(error_str, action_name))
-                                        print(error_str)
-                                        print(action_name + '\n')
-
-                    elif all_errors_only:
-                        if not stage_logging_mode <= self.LOGGING_MODE['errors only']:
-                            # Current stage type isn't valid
-                            if stage_type not in allowed_logging_stage_types:
-                                if stage.subsheetid:  # Skips stages on initialise page
-                                    action_name = subsheetid_to_action(stage.subsheetid.string, action_subsheets)
-                                    error_str = "Logging should not be enabled: {} stage '{}'"\
-                                        .format(stage_type, stage_name)
-                                    self.errors_list.append(error_as_dict(error_str, action_name))
-                                    print(error_str)
-                                    print(action_name + '\n')
-
-                            # Current stage type is valid
-                            else:
-                                # Current stages logging mode is less strict than the allowed logging mode
-                                if not stage_logging_mode <= allowed_logging_mode:
-                                    if stage.subsheetid:  # Skips stages on initialise page
-                                        action_name = subsheetid_to_action(stage.subsheetid.string, action_subsheets)
-                                        error_str = "Stage's type in logging exception list, " \
-                                                    "but logging type is less strict than the allowed mode: " \
-                                                    "{} stage '{}'".format(stage_type, stage_name)
-                                        self.errors_list.append(error_as_dict(error_str, action_name))
-                                        print(error_str)
-                                        print(action_name + '\n')
+        if context.metadata['additional info']['Delivery Stage'] == 'Production':
+            if all_disabled or all_errors_only:
+                policy_logging_mode = self.LOGGING_MODE['disabled' if all_disabled else 'errors only']
+                action_resolver = context.stage_index.action_resolver
+                stage_table = context.stage_index.stage_table
+
+                # Skips stages on initialise page, and stages without logging
+                logged_stages = stage_table.mask_and(stage_table.page_mask(),
+                                                     stage_table.mask_not(stage_table.type_mask(NO_LOGGING_TYPES)))
+                allowed_type_stages = stage_table.type_mask(allowed_logging_stage_types)
+                # Current stage type isn't valid, and its logging is less strict than the policy
+                invalid_stages = stage_table.mask_and(logged_stages, stage_table.mask_not(allowed_type_stages),
+                                                      stage_table.logging_mask(policy_logging_mode))
+                # Current stage type is valid, but its logging is less strict than the allowed logging mode
+                allowed_stages = stage_table.mask_and(logged_stages, allowed_type_stages,
+                                                      stage_table.logging_mask(allowed_logging_mode))
+
+                for row in stage_table.rows(stage_table.mask_or(invalid_stages, allowed_stages)):
+                    stage_name = stage_table.names[row]
+                    stage_type = stage_table.get_type(row)
+                    action_name = action_resolver.get_action_name(stage_table.get_subsheetid(row))
+                    if stage_type not in allowed_logging_stage_types:
+                        if all_disabled:
+                            error_str = "Logging is not disabled: {} stage '{}'".format(stage_type, stage_name)
+                        else:
+                            error_str = "Logging should not be enabled: {} stage '{}'".format(stage_type, stage_name)
+                    elif all_disabled:
+                        error_str = "Stage's type is in the logging exception list, " \
+                                    "but logging type is less strict than the allowed mode: " \
+                                    "{} stage '{}'".format(stage_type, stage_name)
+                    else:
+                        error_str = "Stage's type in logging exception list, " \
+                                    "but logging type is less strict than the allowed mode: " \
+                                    "{} stage '{}'".format(stage_type, stage_name)
+                    self.errors_list.append(error_as_dict(error_str, action_name))
+                    print(error_str)
+                    print(action_name + '\n')
 
         # Consideration not applicable when in Dev or Testing
         else:
             self._consideration_not_applicable()
 
-    def _get_stage_logging(self, stage):
-        """Return the logging status of the current stage."""
-        # Logging is off
-        if stage.loginhibit:
-            if stage.loginhibit.get('onsuccess'):
-                return self.LOGGING_MODE['errors only']
-            else:
-                return self.LOGGING_MODE['disabled']
-        # Logging is on
-        else:
-            return self.LOGGING_MODE['enabled']
-
 
 # Topic: Images
+@OBJECT_CONSIDERATIONS.register
 class CheckImageDefinitionsEfficient(Consideration):
     """Checks if a Wait stage times out to an Exception or End stage.
 
@@ -2050,9 +1911,9 @@ class CheckImageDefinitionsEfficient(Consideration):
 
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
-        data_stages = soup.find_all('stage', type='Data', recursive=False)
-        action_subsheets = None
+    def check_consideration(self, soup: BeautifulSoup, context: ReviewContext):
+        data_stages = context.stage_index.get_stages('Data')
+        action_resolver = context.stage_index.action_resolver
         image_found = False
         for data_stage in data_stages:
             if data_stage.datatype.string == 'image':
@@ -2077,9 +1938,7 @@ class CheckImageDefinitionsEfficient(Consideration):
 
                     # Flag error for image being too big
                     if int(width) > self.MAX_IMAGE_WIDTH or int(height) > self.MAX_IMAGE_HEIGHT:
-                        if not action_subsheets:
-                            action_subsheets = get_action_subsheets(soup)
-                        action_name = subsheetid_to_action(data_stage.subsheetid.string, action_subsheets)
+                        action_name = action_resolver.get_action_name(data_stage.subsheetid.string)
                         error_str = "Data Item '{}' larger than recommended {} x {} ({} x {})"\
                             .format(data_stage.get('name'), self.MAX_IMAGE_WIDTH, self.MAX_IMAGE_HEIGHT,
                                     height, width)
@@ -2087,9 +1946,7 @@ class CheckImageDefinitionsEfficient(Consideration):
 
                     # Flag warning for image being too big
                     if int(width) > self.WARNING_IMAGE_WIDTH or int(height) > self.WARNING_IMAGE_HEIGHT:
-                        if not action_subsheets:
-                            action_subsheets = get_action_subsheets(soup)
-                        action_name = subsheetid_to_action(data_stage.subsheetid.string, action_subsheets)
+                        action_name = action_resolver.get_action_name(data_stage.subsheetid.string)
                         warning_str = "Data Item '{}' size above warning threshold {} x {} ({} x {})" \
                             .format(data_stage.get('name'), self.WARNING_IMAGE_WIDTH, self.WARNING_IMAGE_HEIGHT,
                                     height, width)
@@ -2100,6 +1957,7 @@ class CheckImageDefinitionsEfficient(Consideration):
 
 
 # Topic: Application Focus
+@OBJECT_CONSIDERATIONS.register
 class CheckFocusUsedForGlobals(Consideration):
     CONSIDERATION_NAME = "Is Focus ensured when required? For using Globals and Image Recognition?"
     # Settings
@@ -2107,47 +1965,43 @@ class CheckFocusUsedForGlobals(Consideration):
     FREQUENTLY_HURDLE = 2
     INFREQUENTLY_HURDLE = 3
 
+    GLOBAL_NAV_STEPS = KeywordMatcher(Constants.GLOBAL_NAV_STEPS)
+    GLOBAL_READ_STEPS = KeywordMatcher(Constants.GLOBAL_READ_STEPS)
+    USES_OBJECT_MODEL = True
+
     def __init__(self): super().__init__()
 
-    def check_consideration(self, soup: BeautifulSoup, metadata):
+    def check_consideration(self, object_model: ObjectModel, context: ReviewContext):
         global_nav_subsheetids = []
         global_read_subsheetids = []
         activate_app_subsheetids = []
         aafocus_subsheetids = []
         global_stage_found = False
 
-        navigate_stages = soup.find_all('stage', type='Navigate', recursive=False)
-        read_stages = soup.find_all('stage', type='Read', recursive=False)
-        action_subsheets = get_action_subsheets(soup)
+        navigate_stages = object_model.get_stages('Navigate')
+        read_stages = object_model.get_stages('Read')
 
         # Check if any Navigate stages contain steps requiring application at forefront
         for navigate_stage in navigate_stages:
-            stage_name = navigate_stage.get('name')
-            steps = navigate_stage.find_all('step', recursive=False)
-            for step in steps:
-                step_name = step.action.id.string
+            for step in navigate_stage.steps:
+                step_name = step.action_id
                 if step_name == 'ActivateApp':
-                    subsheetid = step.parent.subsheetid.string
-                    activate_app_subsheetids.append(subsheetid)
+                    activate_app_subsheetids.append(navigate_stage.subsheetid)
 
-                elif any(global_nav in step_name for global_nav in Constants.GLOBAL_NAV_STEPS):
+                elif self.GLOBAL_NAV_STEPS.contains(step_name):
                     global_stage_found = True
-                    subsheetid = step.parent.subsheetid.string
-                    global_nav_subsheetids.append(subsheetid)
+                    global_nav_subsheetids.append(navigate_stage.subsheetid)
 
                 elif step_name == 'AAFocus':
-                    subsheetid = step.parent.subsheetid.string
-                    aafocus_subsheetids.append(subsheetid)
+                    aafocus_subsheetids.append(navigate_stage.subsheetid)
 
         # Check if any Read stages contain steps requiring application at forefront
         for read_stage in read_stages:
-            steps = read_stage.find_all('step', recursive=False)
-            for step in steps:
-                step_name = step.action.id.string
-                if any(global_read in step_name for global_read in Constants.GLOBAL_READ_STEPS):
+            for step in read_stage.steps:
+                step_name = step.action_id
+                if self.GLOBAL_READ_STEPS.contains(step_name):
                     global_stage_found = True
-                    subsheetid = step.parent.subsheetid.string
-                    global_read_subsheetids.append(subsheetid)
+                    global_read_subsheetids.append(read_stage.subsheetid)
 
         # Removes duplicate subsheetids from lists
         global_nav_subsheetids = list(dict.fromkeys(global_nav_subsheetids))
@@ -2167,18 +2021,18 @@ class CheckFocusUsedForGlobals(Consideration):
                 # If Action has global nav, no activate app stage but has a FocusAA stage, add it to the warning list
                 if subsheet_using_focusaa in navs_with_no_activateapp:
                     navs_with_no_activateapp.remove(subsheet_using_focusaa)
-                    action_name = subsheetid_to_action(subsheet_using_focusaa, action_subsheets)
+                    action_name = object_model.get_action_name(subsheet_using_focusaa)
                     warning_str = "Global click or send key with a 'FocusAA' but no 'Activate Application' stage"
                     self.warning_list.append(warning_as_dict(warning_str, action_name))
 
             for nav_with_no_activate in navs_with_no_activateapp:
-                action_name = subsheetid_to_action(nav_with_no_activate, action_subsheets)
+                action_name = object_model.get_action_name(nav_with_no_activate)
                 error_str = "Global click or send key in Action without an 'Activate Application' stage"
                 self.errors_list.append(error_as_dict(error_str, action_name))
 
         if reads_with_no_activateapp:
             for read_with_no_activateapp in reads_with_no_activateapp:
-                action_name = subsheetid_to_action(read_with_no_activateapp, action_subsheets)
+                action_name = object_model.get_action_name(read_with_no_activateapp)
                 error_str = "Global Read stage within Action without an 'Activate Application' stage"
                 self.errors_list.append(error_as_dict(error_str, action_name))
 
@@ -2187,61 +2041,58 @@ class CheckFocusUsedForGlobals(Consideration):
 
 
 # -------------------------------------------------- Utility functions
-def get_object_consideration_module_classes() -> list:
+def check_not_blacklisted(blacklist: KeywordMatcher, check_str)->bool:
     """
-    Return all consideration classes in this module as a list.
-
-    This list can later be iterated over and a instance of each class can easily be generated. This makes it agnostic of
-    how many considerations are contained in this module or their name.
+    Check a name isn't contain with a blacklist of titles.
 
-    :return: (list) Each element is a (name, value) tuple of a class in this module.
+    :param blacklist: (KeywordMatcher) Lower case blacklisted words (usually titles like Action names).
+    :param check_str: String that's check if it's in the blacklist
+    :return: (bool) True if check_str is not contained in the list.
     """
-    class_objects = []
-    clsmembers = inspect.getmembers(sys.modules[__name__], inspect.isclass)  # Returns name, value tuple
-    irrelevant_classes = ['Consideration', 'ReportPageHelper', 'Result', 'SoupStrainer', 'Sub_Soup', 'BeautifulSoup',
-                          'Tag']
-    for consideration_class in clsmembers:
-        if consideration_class[0] not in irrelevant_classes:
-            try:
-                consideration_class[1].CONSIDERATION_NAME
-            except AttributeError:
-                print(consideration_class[0] + " class does not have a consideration_name value")
-            else:
-                class_objects.append(consideration_class)
+    return not blacklist.contains(check_str.lower())
 
-    return class_objects
 
+@lru_cache(maxsize=ATTRIBUTE_VALUE_CACHE_SIZE)
+def is_useless_attribute_value(attribute_value):
+    """Determine if the attribute value is empty or contains no useful information.
 
-def check_not_blacklisted(blacklist, check_str)->bool:
-    """
-    Check a name isn't contain with a blacklist of titles.
-
-    :param blacklist: (list) Blacklisted words (usually titles like Action names).
-    :param check_str: String that's check if it's in the blacklist
-    :return: (bool) True if check_str is not contained in the list.
+    dateutil only parses values that could_be_date can't rule out, which gives the same result as parsing every value.
+    App Models repeat the same values, so the result for each value is cached.
     """
-    check_str = check_str.lower()
-    if not any(blacklist_word.lower() in check_str for blacklist_word in blacklist):
+    attribute_value_stripped = ''.join(char for char in attribute_value if char not in '(){}<>,./ ')
+    # Don't care about single characters
+    if len(attribute_value_stripped) <= 1:
         return True
-    else:
-        return False
+    # Value equal to number 0
+    try:
+        if float(attribute_value_stripped) == 0:
+            return True
+    except ValueError:
+        pass
 
+    # Check if value is just a date
+    if could_be_date(attribute_value):
+        try:
+            dateparse(attribute_value)
+            return True
+        except ValueError:
+            pass
 
-def get_action_subsheets(object_soup: BeautifulSoup):
-    """
-    Return a list of tuples containing (subsheetid, subsheetname) for all Actions in a BP Object.
 
-    Subsheetname is the BP release XML equivalent of an Action name within a BP Object.
+def could_be_date(attribute_value) -> bool:
+    """Return False if dateutil's parser is certain to reject the value, without running the parser.
 
-    :param object_soup: (bs4) Soup of a single BP Object.
-    :return: (tuple) The (subsheetid, subsheetname) of all Actions within the BP Object.
+    The parser raises a ValueError for any word it doesn't know, unless the word could be a timezone name.
     """
-    subsheets = object_soup.find_all('subsheet', recursive=False)
-    subsheets_info = [(subsheet.get('subsheetid'), subsheet.next_element.string) for subsheet in subsheets]
-    return subsheets_info
+    for word in WORD_PATTERN.findall(attribute_value):
+        if not word.isalpha():
+            return True  # Not split into words the same way as the parser, so leave it to the parser
+        if word.lower() not in DATE_WORDS and not TIMEZONE_NAME_PATTERN.fullmatch(word):
+            return False
+    return True
 
 
-def get_onsuccess_tag(stage: Tag, object_soup: BeautifulSoup) -> Tag:
+def get_onsuccess_tag(stage: Tag, stage_index: StageIndex) -> Tag:
     """
     Return the BP stage that follows the current BP stage.
 
@@ -2249,22 +2100,7 @@ def get_onsuccess_tag(stage: Tag, object_soup: BeautifulSoup) -> Tag:
     following stages is of type 'Decision').
 
     :param stage: (bs4.Tag) Tag of the current BP stage.
-    :param object_soup: (bs4) Soup of the full Object that the stage is contained within.
+    :param stage_index: (StageIndex) Index of the full Object that the stage is contained within.
     :return: (bs4.Tag) Tag of the following (onsuccess) stage.
     """
-    if stage.onsuccess:
-        onsuccess = stage.onsuccess.string
-        success_stage = object_soup.find('stage', stageid=onsuccess, recursive=False)
-        return success_stage
-
-
-def subsheetid_to_action(stage_subsheetid, action_subsheets)->str:
-    """Return the containing Action's name from a stage's subsheetid.
-
-    action_subsheets will be the return value of the funtion get_action_subsheets().
-    """
-    for action_subsheet in action_subsheets:
-        action_subsheet_id = action_subsheet[0]
-        if action_subsheet_id == stage_subsheetid:
-            action_name = action_subsheet[1]
-            return action_name
+    return stage_index.flow_graph.get_next_stage(stage)
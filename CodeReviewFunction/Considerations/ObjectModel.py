@@ -0,0 +1,189 @@
+"""
+This module contains the ObjectModel, the fields of a single BP Object that the considerations read, as plain records.
+
+A bs4 Tag, or an XmlTag, for every node of the release makes an Object's soup many times the size of its XML, while the
+considerations only read a small, known set of its fields. The ObjectModel reads those fields once, into records that
+hold plain strings and use __slots__, so the soup can be freed as soon as the model is read. The elements and
+attributes of the App Model are the AppModel's own records.
+
+A consideration that only needs the ObjectModel sets USES_OBJECT_MODEL, and is given the ObjectModel instead of the
+soup. See make_report_object.
+"""
+
+from collections import namedtuple
+from .AppModel import AppModel
+from .AppModelRegistry import AppModelRegistry, get_parent_object_name
+from ..SoupUtilities import iter_child_tags, read_string
+
+INDEXED_STAGE_TYPES = ('Navigate', 'Read', 'Write', 'Exception')
+"""Stage types an ObjectModel read from a StageIndex holds, the only ones the considerations using it read."""
+
+
+class Subsheet(namedtuple('Subsheet', 'subsheetid, name, type, published')):
+    """A single page of the Object.
+
+    subsheetid (str): The page's subsheetid, which every stage on the page holds.
+    name (str): The page's name, which is the Action's name for a published Action page.
+    type (str): The page's type, e.g. 'Normal' or 'CleanUp'.
+    published (str): 'True' if the page is a published Action.
+    """
+    __slots__ = ()
+
+
+class Step(namedtuple('Step', 'action_id, element_id')):
+    """A single step of a Navigate, Read or Write stage.
+
+    action_id (str): The id of the step's action, e.g. 'Launch' or 'ActivateApp'. None for a Write stage's step.
+    element_id (str): The id of the App Model element the step uses, or None if it doesn't have one.
+    """
+    __slots__ = ()
+
+
+class ExceptionDetail(namedtuple('ExceptionDetail', 'type, detail, usecurrent')):
+    """The <exception> of an Exception stage. Each field is the XML attribute's value, or None if it isn't set.
+
+    type (str): The exception's type, e.g. 'System Exception'.
+    detail (str): The exception's detail.
+    usecurrent (str): Set when the stage preserves the current exception, rather than raising a new one.
+    """
+    __slots__ = ()
+
+
+class Stage(namedtuple('Stage', 'stageid, name, type, subsheetid, onsuccess, steps, exception')):
+    """A single stage of the Object.
+
+    stageid (str): The stage's stageid.
+    name (str): The stage's name.
+    type (str): The BP stage type, e.g. 'Navigate'.
+    subsheetid (str): subsheetid of the page the stage is on, or None for the Initialise page.
+    onsuccess (str): stageid of the stage it links to, or None if it isn't linked.
+    steps (tuple): The Steps of a Navigate, Read or Write stage. Empty for any other stage.
+    exception (ExceptionDetail): The exception an Exception stage raises. None for any other stage.
+    """
+    __slots__ = ()
+
+
+class ObjectModel:
+    """The stages, pages and App Model of a single BP Object, read in a single pass over the Object's soup."""
+
+    __slots__ = ('name', 'runmode', 'parent_object', 'stages', 'subsheets', 'app_model', '_stages_by_type',
+                 '_action_names')
+
+    def __init__(self, name, runmode, parent_object, stages, subsheets, app_model: AppModel):
+        """
+        :param name: (str) The Object's name.
+        :param runmode: (str) The Object's run mode, e.g. 'Exclusive'. None if it isn't set.
+        :param parent_object: (str) Name of the Object whose App Model it inherits, or None.
+        :param stages: (tuple) The Object's Stages, in the order they appear in the Object.
+        :param subsheets: (tuple) The Object's Subsheets, in the order they appear in the Object.
+        :param app_model: (AppModel) The Object's AppModel.
+        """
+        self.name = name
+        self.runmode = runmode
+        self.parent_object = parent_object
+        self.stages = stages
+        self.subsheets = subsheets
+        self.app_model = app_model
+        self._stages_by_type = {}
+        for stage in stages:
+            self._stages_by_type.setdefault(stage.type, []).append(stage)
+        self._action_names = {}
+        for subsheet in subsheets:
+            self._action_names.setdefault(subsheet.subsheetid, subsheet.name)
+
+    @classmethod
+    def from_soup(cls, object_soup, app_model_registry: AppModelRegistry = None, app_model: AppModel = None):
+        """Read the ObjectModel of an Object's soup. The model keeps no reference to the soup.
+
+        :param object_soup: (bs4.Tag or XmlTag) Soup of a single BP Object.
+        :param app_model_registry: (AppModelRegistry) The release's registry, which links the Object's AppModel to the
+        one it inherits. None only gives the Object's own App Model.
+        :param app_model: (AppModel) The Object's AppModel, if it has already been scanned.
+        """
+        stages = []
+        subsheets = []
+        appdef = None
+        for child in iter_child_tags(object_soup):
+            if child.name == 'stage':
+                stages.append(_read_stage(child))
+            elif child.name == 'subsheet':
+                subsheets.append(_read_subsheet(child))
+            elif child.name == 'appdef' and appdef is None:
+                appdef = child
+
+        if app_model is None:
+            if app_model_registry is not None:
+                app_model = app_model_registry.get_app_model(object_soup)
+            else:
+                app_model = AppModel(appdef)
+        return cls(object_soup.get('name'), object_soup.get('runmode'), get_parent_object_name(object_soup),
+                   tuple(stages), tuple(subsheets), app_model)
+
+    @classmethod
+    def from_stage_index(cls, stage_index, stage_types=INDEXED_STAGE_TYPES):
+        """Read the ObjectModel from a StageIndex already built over the Object's soup, for when the soup is kept for
+        the considerations that need it. Only the stages of the stage types are read, which the StageIndex has already
+        found, so the Object's soup isn't passed over a second time.
+
+        :param stage_index: (StageIndex) The Object's StageIndex.
+        :param stage_types: (tuple) BP stage types of the stages the model holds.
+        """
+        stage_types = frozenset(stage_types)
+        stages = tuple(_read_stage(stage) for stage in stage_index.stages if stage.get('type') in stage_types)
+        subsheets = tuple(_read_subsheet(subsheet) for subsheet in stage_index.subsheets)
+        object_soup = stage_index.object_soup
+        return cls(object_soup.get('name'), object_soup.get('runmode'), get_parent_object_name(object_soup), stages,
+                   subsheets, stage_index.app_model)
+
+    def get_stages(self, stage_type) -> list:
+        """Return all Stages of a BP stage type (e.g. 'Navigate'), in the order they appear in the Object."""
+        return self._stages_by_type.get(stage_type, [])
+
+    def get_action_name(self, subsheetid) -> str:
+        """Return the name of the page with the given subsheetid, or None if there isn't one."""
+        return self._action_names.get(subsheetid)
+
+    def get_exceptions(self) -> list:
+        """Return (Stage, ExceptionDetail) for each Exception stage with an exception, in the order they appear."""
+        return [(stage, stage.exception) for stage in self.get_stages('Exception') if stage.exception is not None]
+
+
+def _read_stage(stage_tag) -> Stage:
+    """Return the record of a <stage>, read in a single pass over its child tags."""
+    subsheetid, onsuccess, exception = None, None, None
+    steps = []
+    for child in iter_child_tags(stage_tag):
+        if child.name == 'subsheetid' and subsheetid is None:
+            subsheetid = read_string(child)
+        elif child.name == 'onsuccess' and onsuccess is None:
+            onsuccess = read_string(child)
+        elif child.name == 'step':
+            steps.append(_read_step(child))
+        elif child.name == 'exception' and exception is None:
+            exception = ExceptionDetail(child.get('type'), child.get('detail'), child.get('usecurrent'))
+    return Stage(stage_tag.get('stageid'), stage_tag.get('name'), stage_tag.get('type'), subsheetid, onsuccess,
+                 tuple(steps), exception)
+
+
+def _read_step(step_tag) -> Step:
+    """Return the record of a stage's <step>."""
+    action_id, element_id = None, None
+    for child in iter_child_tags(step_tag):
+        if child.name == 'element' and element_id is None:
+            element_id = child.get('id')
+        elif child.name == 'action' and action_id is None:
+            for action_child in iter_child_tags(child):
+                if action_child.name == 'id':
+                    action_id = read_string(action_child)
+                    break
+    return Step(action_id, element_id)
+
+
+def _read_subsheet(subsheet_tag) -> Subsheet:
+    """Return the record of a <subsheet>."""
+    name = None
+    for child in iter_child_tags(subsheet_tag):
+        if child.name == 'name':
+            name = read_string(child)
+            break
+    return Subsheet(subsheet_tag.get('subsheetid'), name, subsheet_tag.get('type'), subsheet_tag.get('published'))
@@ -1,20 +1,4 @@
-import inspect
-import sys
+from .ConsiderationRegistry import ConsiderationRegistry
 
-
-def process_consideration_module_classes() -> list:
-    """Retrieve a tuple containing all process consideration class names' and their metaclass'"""
-    process_classes = []
-    clsmembers = inspect.getmembers(sys.modules[__name__], inspect.isclass)
-    irrelevant_classes = ['Consideration', 'ReportPageHelper', 'Result', 'SoupStrainer', 'Sub_Soup', 'BeautifulSoup',
-                          'Tag']
-    for consideration_class in clsmembers:
-        if consideration_class[0] not in irrelevant_classes:
-            try:
-                consideration_class[1].CONSIDERATION_NAME
-            except AttributeError:
-                print(consideration_class[0] + " class does not have a consideration value")
-            else:
-                process_classes.append(consideration_class)
-
-    return process_classes
+PROCESS_CONSIDERATIONS = ConsiderationRegistry('Process')
+"""Every Process consideration class, added by the register decorator on each class."""
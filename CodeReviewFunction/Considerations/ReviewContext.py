@@ -0,0 +1,37 @@
+"""
+This module contains the ReviewContext, everything an Object consideration needs to know about the Object it is checking
+other than the Object's soup.
+
+A ReviewContext is created for each Object and can't be changed once created, so Objects can be reviewed at the same
+time in different threads or processes without one Object's review affecting another's.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+
+class ReviewContext(namedtuple('ReviewContext', 'object_name, object_type, evaluated, stage_index, metadata')):
+    """Immutable information about a single BP Object under review.
+
+    object_name (str): The Object's name.
+    object_type (str): Type of Object from Constants.OBJECT_TYPES.
+    evaluated (bool): True if the object type was estimated because it isn't given in the Object's name.
+    stage_index (StageIndex): Index of the Object's stages, shared by every consideration. None if every
+    consideration checking the Object uses its ObjectModel.
+    metadata (MappingProxyType): Read only view of the release metadata from CodeReview.extract_metadata.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, object_name, object_type, evaluated, stage_index, metadata: dict):
+        """Create the context for an Object, taking a read only copy of the release metadata."""
+        return cls(object_name, object_type, evaluated, stage_index, read_only_metadata(metadata))
+
+
+def read_only_metadata(value):
+    """Return a read only copy of the metadata, with every dict made a MappingProxyType and every list a tuple."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: read_only_metadata(item) for key, item in value.items()})
+    elif isinstance(value, (list, tuple)):
+        return tuple(read_only_metadata(item) for item in value)
+    return value
@@ -0,0 +1,102 @@
+"""
+This module contains the StageIndex, a lookup of the stages and Action pages of a single BP Object.
+
+make_report_object builds one StageIndex per Object before running the Object considerations and passes it to each of
+them, so a consideration can look up the stages it needs rather than searching the full Object's soup again.
+"""
+
+from .ActionResolver import ActionResolver
+from .AppModel import AppModel
+from .AppModelRegistry import AppModelRegistry
+from .DataItemIndex import DataItemIndex
+from .FlowGraph import FlowGraph
+from .StageTable import StageTable
+
+
+class StageIndex:
+    """Index of a single BP Object's stages by stageid, stage type and subsheetid, along with its Action pages.
+
+    Stages on the Initialise page have no subsheetid, so they are indexed under None.
+    """
+
+    def __init__(self, object_soup, app_model_registry: AppModelRegistry = None):
+        """Build every lookup in a single pass over the Object's stages.
+
+        :param object_soup: (bs4.Tag or XmlTag) Soup of a single BP Object.
+        :param app_model_registry: (AppModelRegistry) The release's registry, which links the Object's AppModel to the
+        one it inherits. None only gives the Object's own App Model.
+        """
+        self.stages = object_soup.find_all('stage', recursive=False)
+        self.stages_by_id = {}
+        self.stages_by_type = {}
+        self.stages_by_subsheetid = {}
+        for stage in self.stages:
+            self.stages_by_id.setdefault(stage.get('stageid'), stage)
+            self.stages_by_type.setdefault(stage.get('type'), []).append(stage)
+            subsheetid = stage.subsheetid
+            subsheetid = subsheetid.string if subsheetid else None
+            self.stages_by_subsheetid.setdefault(subsheetid, []).append(stage)
+
+        # Action pages, and the map of their subsheetid to Action name
+        self.subsheets = object_soup.find_all('subsheet', recursive=False)
+        self.action_resolver = ActionResolver(self.subsheets)
+
+        # The <exception> tag of each Exception stage, holding the exception's type and detail
+        self.exceptions = []
+        for exception_stage in self.get_stages('Exception'):
+            exception = exception_stage.find('exception', recursive=False)
+            if exception:
+                self.exceptions.append(exception)
+
+        self.object_soup = object_soup
+        self._app_model_registry = app_model_registry
+        self._flow_graph = None
+        self._app_model = None
+        self._data_items = None
+        self._stage_table = None
+
+    @property
+    def flow_graph(self) -> FlowGraph:
+        """The FlowGraph of the Object's onsuccess links, compiled the first time a consideration needs it."""
+        if self._flow_graph is None:
+            self._flow_graph = FlowGraph(self)
+        return self._flow_graph
+
+    @property
+    def app_model(self) -> AppModel:
+        """The AppModel of the Object's own App Model, scanned the first time a consideration needs it.
+
+        Its parent is the AppModel the Object inherits, when the Object has a parentobject in the release's registry.
+        """
+        if self._app_model is None:
+            if self._app_model_registry is not None:
+                self._app_model = self._app_model_registry.get_app_model(self.object_soup)
+            else:
+                self._app_model = AppModel(self.object_soup.find('appdef', recursive=False))
+        return self._app_model
+
+    @property
+    def data_items(self) -> DataItemIndex:
+        """The DataItemIndex of the Object's Data stages, read the first time a consideration needs it."""
+        if self._data_items is None:
+            self._data_items = DataItemIndex(self.get_stages('Data'))
+        return self._data_items
+
+    @property
+    def stage_table(self) -> StageTable:
+        """The StageTable of the Object's stages as columns, read the first time a consideration needs it."""
+        if self._stage_table is None:
+            self._stage_table = StageTable(self.stages)
+        return self._stage_table
+
+    def get_stage(self, stageid):
+        """Return the stage with the given stageid, or None if the Object doesn't have one."""
+        return self.stages_by_id.get(stageid)
+
+    def get_stages(self, stage_type) -> list:
+        """Return all stages of a BP stage type (e.g. 'Navigate'), in the order they appear in the Object."""
+        return self.stages_by_type.get(stage_type, [])
+
+    def get_subsheet_stages(self, subsheetid) -> list:
+        """Return all stages on a page of the Object. None returns the stages on the Initialise page."""
+        return self.stages_by_subsheetid.get(subsheetid, [])
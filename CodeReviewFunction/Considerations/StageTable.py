@@ -0,0 +1,143 @@
+"""
+This module contains the StageTable, the stages of a single BP Object stored as columns rather than as soup.
+
+Many of the Object considerations filter and count the stages by their type, page and logging. The StageTable reads
+those fields from every stage once, into one column each, so a consideration can ask for the matching rows with a few
+operations over whole columns rather than walking the soup of each stage in Python.
+
+A mask is a bytes object with one byte per stage, 1 where the stage matches and 0 where it doesn't. Masks are built with
+bytes.translate and combined as integers, so each runs in C over the whole column. The columns use the standard
+library's bytes and array, so the table needs nothing more than the rest of the review.
+"""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from ..SoupUtilities import iter_child_tags, read_string
+
+LOGGING_MODES = {
+    'disabled': 1,
+    'errors only': 2,
+    'enabled': 3
+}
+MAX_CODES = 256
+"""Codes of the byte columns. BP has a few dozen stage types, and only three logging modes. A release with more stage
+types than this has its type codes kept in an array instead, whose masks are built in Python."""
+
+
+class StageTable:
+    """Columns of a single BP Object's stages, with a row for each stage in the order of StageIndex.stages.
+
+    stage_types (list): The stage type of each type code.
+    subsheetids (list): The subsheetid of each page code. Code 0 is the Initialise page, whose subsheetid is None.
+    types (bytes): Type code of each stage. An array if there are more than MAX_CODES stage types.
+    pages (array): Page code of each stage.
+    logging_modes (bytes): LOGGING_MODES value of each stage, from its <loginhibit>.
+    names (list): Name of each stage.
+    """
+
+    def __init__(self, stages):
+        """Read the columns in a single pass over the stages.
+
+        :param stages: (list) The stages of a single BP Object, in the order they appear in the Object.
+        """
+        self.stages = stages
+        self.names = []
+        self.stage_types = []
+        self.subsheetids = [None]
+        self._type_codes = {}
+        self._page_codes = {None: 0}
+        type_codes = []
+        page_codes = array('L')
+        on_pages = bytearray()
+        logging_modes = bytearray()
+
+        for stage in stages:
+            stage_type = stage.get('type')
+            subsheetid, logging_mode = None, LOGGING_MODES['enabled']
+            for child in iter_child_tags(stage):
+                if child.name == 'subsheetid' and subsheetid is None:
+                    subsheetid = read_string(child)
+                elif child.name == 'loginhibit' and logging_mode == LOGGING_MODES['enabled']:
+                    logging_mode = LOGGING_MODES['errors only' if child.get('onsuccess') else 'disabled']
+
+            type_codes.append(self._get_code(self._type_codes, self.stage_types, stage_type))
+            page_codes.append(self._get_code(self._page_codes, self.subsheetids, subsheetid))
+            on_pages.append(subsheetid is not None)
+            logging_modes.append(logging_mode)
+            self.names.append(stage.get('name'))
+
+        self.types = bytes(type_codes) if len(self.stage_types) <= MAX_CODES else array('H', type_codes)
+        self.pages = page_codes
+        self._on_pages = bytes(on_pages)
+        self.logging_modes = bytes(logging_modes)
+
+    @staticmethod
+    def _get_code(codes, values, value) -> int:
+        """Return the code of the value, giving it the next code if it doesn't have one."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.stages)
+
+    def type_mask(self, stage_types) -> bytes:
+        """Return the mask of the stages whose type is one of the stage types."""
+        codes = {self._type_codes[stage_type] for stage_type in stage_types if stage_type in self._type_codes}
+        if not isinstance(self.types, bytes):
+            return bytes(code in codes for code in self.types)
+        table = bytearray(MAX_CODES)
+        for code in codes:
+            table[code] = 1
+        return self.types.translate(table)
+
+    def logging_mask(self, more_than_mode) -> bytes:
+        """Return the mask of the stages whose logging is less strict than the LOGGING_MODES value."""
+        table = bytes(int(mode > more_than_mode) for mode in range(MAX_CODES))
+        return self.logging_modes.translate(table)
+
+    def page_mask(self) -> bytes:
+        """Return the mask of the stages on an Action page, rather than the Initialise page."""
+        return self._on_pages
+
+    @staticmethod
+    def mask_and(*masks) -> bytes:
+        """Return the mask of the stages matching all of the masks."""
+        length = len(masks[0])
+        combined = int.from_bytes(masks[0], 'little')
+        for mask in masks[1:]:
+            combined &= int.from_bytes(mask, 'little')
+        return combined.to_bytes(length, 'little')
+
+    @staticmethod
+    def mask_or(*masks) -> bytes:
+        """Return the mask of the stages matching any of the masks."""
+        length = len(masks[0])
+        combined = 0
+        for mask in masks:
+            combined |= int.from_bytes(mask, 'little')
+        return combined.to_bytes(length, 'little')
+
+    @staticmethod
+    def mask_not(mask) -> bytes:
+        """Return the mask of the stages that don't match the mask."""
+        return mask.translate(b'\x01\x00' + bytes(MAX_CODES - 2))
+
+    def rows(self, mask) -> list:
+        """Return the rows of the stages matching the mask, in order."""
+        return list(compress(range(len(self.stages)), mask))
+
+    def count_by_page(self, mask) -> dict:
+        """Return the number of stages matching the mask on each page, by subsheetid. Pages without one are left out."""
+        return {self.subsheetids[page]: count for page, count in Counter(compress(self.pages, mask)).items()}
+
+    def get_type(self, row) -> str:
+        """Return the BP stage type of the stage in the row, e.g. 'Navigate'."""
+        return self.stage_types[self.types[row]]
+
+    def get_subsheetid(self, row) -> str:
+        """Return the subsheetid of the page the stage in the row is on, or None for the Initialise page."""
+        return self.subsheetids[self.pages[row]]
@@ -2,6 +2,9 @@
 This module should contain any process wide settings or constants consolidated into one file.
 """
 
+import os
+import tempfile
+
 # -------------------------------------------------- Object Settings
 
 OBJECT_TYPES = {
@@ -57,6 +60,10 @@ BLACKLIST_OBJECT_NAMES = [
     'Webservices - REST',
     'Utility - XML'
 ]
+"""Stock Objects that are never reviewed, along with the blacklist in the release's header."""
+
+BLACKLISTED_OBJECT_TYPE = 'Blacklisted Object'
+"""Object type on the report page of a blacklisted Object, which is given no considerations."""
 
 # -------------------------------------------------- Process Settings
 
@@ -64,3 +71,93 @@ BLACKLIST_OBJECT_NAMES = [
 
 
 
+# -------------------------------------------------- Review Settings
+
+REVIEW_MODES = {
+    'standard': 'standard',
+    'streaming': 'streaming',
+    'parallel': 'parallel',
+    'diff': 'diff'
+}
+"""Ways a release can be reviewed, chosen with the 'mode' parameter of the HTTP request."""
+
+DEFAULT_REVIEW_MODE = REVIEW_MODES['standard']
+"""Review mode used when the HTTP request doesn't give one."""
+
+PARALLEL_MAX_WORKERS = None
+"""Worker processes used by the parallel review mode, unless the 'workers' parameter of the HTTP request gives one.
+None uses one worker per CPU core."""
+
+PARALLEL_MIN_OBJECTS = 4
+"""Releases with fewer Objects than this are reviewed serially by the parallel review mode, as starting the worker
+processes would take longer than reviewing the Objects."""
+
+PARSER_BACKENDS = {
+    'bs4': 'bs4',
+    'xml': 'xml'
+}
+"""Parsers the release can be read with, chosen with the 'parser' parameter of the HTTP request.
+
+'bs4' builds BeautifulSoup trees with lxml's HTML parser. 'xml' keeps lxml's native XML tree and wraps it in
+XmlSoup.XmlTag, which gives the considerations the same find/find_all interface.
+"""
+
+DEFAULT_PARSER_BACKEND = PARSER_BACKENDS['bs4']
+"""Parser backend used when the HTTP request doesn't give one."""
+
+REVIEW_CACHE_ENABLED = True
+"""Keep the report page of each reviewed Object so a resubmitted release only reviews the Objects that have changed."""
+
+REVIEW_CACHE_VERSION = 2
+"""Version of the Object considerations, part of every review cache key. Increase it whenever a consideration changes
+what it reports, so pages cached by the old code aren't returned."""
+
+REVIEW_CACHE_MAX_PAGES = 512
+"""Most Object report pages held in memory by the review cache, the least recently used are dropped first."""
+
+REVIEW_CACHE_DIRECTORY = None
+"""Local directory the review cache also keeps its pages in, so they outlive the function's process. None keeps pages
+in memory only."""
+
+REVIEW_CACHE_MAX_DISK_BYTES = 100 * 1024 * 1024
+"""Most bytes of pages kept in REVIEW_CACHE_DIRECTORY, the least recently used are deleted first."""
+
+REVIEW_TIME_BUDGET = 200
+"""Seconds a review has to finish within, unless the 'budget' parameter of the HTTP request gives one. Kept under the
+230 second limit of an HTTP triggered Function, leaving time for a consideration already running at the deadline and
+for the report to be sent."""
+
+NOT_EVALUATED_TYPE = 'Not Evaluated - Time Budget'
+"""Object type on the report page of an Object or Process that wasn't started before the review's time budget ran
+out, which is given no considerations. Also the Result of a consideration that wasn't checked in time."""
+
+RELEASE_MANIFEST_DIRECTORY = os.path.join(tempfile.gettempdir(), 'code review manifests')
+"""Local directory the diff review mode keeps release manifests in. A manifest holds the fingerprint and report page
+of every Object in a reviewed release, so the next version of the release only reviews the Objects that changed."""
+
+# -------------------------------------------------- Review Job Settings
+
+JOB_ACTIONS = {
+    'submit': 'submit',
+    'status': 'status',
+    'report': 'report'
+}
+"""Calls of the review job API, chosen with the 'job' parameter of the HTTP request. See ReviewJobs."""
+
+JOB_DIRECTORY = os.path.join(tempfile.gettempdir(), 'code review jobs')
+"""Local directory the default job queue and blob store keep submitted jobs, their releases and their reports in."""
+
+JOB_DATABASE_PATH = os.path.join(JOB_DIRECTORY, 'jobs.sqlite3')
+"""SQLite database of the default job queue."""
+
+JOB_LEASE_SECONDS = 60 * 60
+"""Longest a review job can run. A job still running after this is marked as failed, as its worker is assumed to have
+stopped, e.g. with the function's host recycled, so callers polling it aren't left waiting forever."""
+
+JOB_RETENTION_SECONDS = 24 * 60 * 60
+"""How long a finished review job and its report are kept. Older jobs are removed whenever a job is submitted, so the
+job database and report blobs don't grow without bound."""
+
+JOB_WORKER_THREAD = True
+"""Review submitted jobs on a background thread of the function's process. Set to False when a separate worker, such
+as a queue triggered function calling ReviewJobs.run_next_job, reviews them."""
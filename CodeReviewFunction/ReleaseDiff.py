@@ -0,0 +1,160 @@
+"""
+This module contains the ReleaseDiff, used by the diff review mode to find which Objects and Processes of a release
+have changed since a baseline release so only those are reviewed.
+
+The baseline is given as a release manifest, a JSON dict made when the baseline was reviewed:
+{'Manifest Version': int, 'objects': {name: item}, 'processes': {name: item}}
+where each item is {'Fingerprint': str, 'Actions': {Action or page name: str}, 'Report Page': dict}.
+A fingerprint is the ReviewCache key of the item's XML, so an item is also treated as changed if the review config or
+the considerations have changed since the baseline.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from lxml import etree
+from . import Constants
+from . import ReviewCache
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE_EXTENSION = '.json'
+RELEASE_NAME_PATTERN = re.compile(r'\w[\w\-. ]*')
+
+
+class ReleaseDiff:
+    """Compares the items of a release against a baseline release manifest, building the release's own manifest."""
+
+    def __init__(self, baseline_manifest: dict = None):
+        """
+        :param baseline_manifest: (dict) Manifest of the baseline release. None treats every item as changed.
+        """
+        self.baseline_manifest = _new_manifest()
+        if baseline_manifest and baseline_manifest.get('Manifest Version') == MANIFEST_VERSION:
+            self.baseline_manifest = baseline_manifest
+        self.manifest = _new_manifest()
+        self.changed_items = []
+        self.changed_actions = {}
+
+    def add_item(self, section, element, metadata: dict, inherited_key='') -> dict:
+        """Add an Object or Process to the release's manifest, recording what has changed since the baseline.
+
+        Must be given the element before it is converted into a soup, as the XML backend changes the element.
+
+        :param section: (str) The Sub_Soup field the element is from, 'objects' or 'processes'.
+        :param element: The lxml element of the item from SoupUtilities.iter_release_elements.
+        :param metadata: (dict) Metadata from CodeReview.extract_metadata.
+        :param inherited_key: (str) For an Object, AppModelRegistry.get_inherited_key of its parentobject.
+        :return: (dict) The baseline's report page if the item hasn't changed. Otherwise None, and the item must be
+        reviewed and its page given to set_report_page.
+        """
+        item_name = element.get('name')
+        fingerprint = get_fingerprint(section, element, metadata, inherited_key)
+        baseline_item = self.baseline_manifest[section].get(item_name, {})
+        if baseline_item.get('Fingerprint') == fingerprint:
+            self.manifest[section][item_name] = baseline_item
+            return baseline_item['Report Page']
+
+        action_fingerprints = get_action_fingerprints(element)
+        baseline_actions = baseline_item.get('Actions', {})
+        self.changed_items.append(item_name)
+        self.changed_actions[item_name] = [action_name for action_name, action_fingerprint
+                                           in action_fingerprints.items()
+                                           if baseline_actions.get(action_name) != action_fingerprint]
+        logging.info("Changed Actions in {}: {}".format(item_name, self.changed_actions[item_name]))
+
+        self.manifest[section][item_name] = {'Fingerprint': fingerprint, 'Actions': action_fingerprints,
+                                             'Report Page': None}
+        return None
+
+    def set_report_page(self, section, item_name, report_page: dict):
+        """Add the report page of a changed item to the release's manifest."""
+        self.manifest[section][item_name]['Report Page'] = report_page
+
+    def discard_item(self, section, item_name):
+        """Leave a changed item out of the release's manifest, so it is reviewed again by the next diff against it."""
+        del self.manifest[section][item_name]
+
+
+def _new_manifest() -> dict:
+    return {'Manifest Version': MANIFEST_VERSION, 'objects': {}, 'processes': {}}
+
+
+def get_fingerprint(section, element, metadata: dict, inherited_key='') -> str:
+    """Return the fingerprint of an Object or Process's lxml element, a hash of its XML and the review config.
+
+    Processes are also fingerprinted with the Process consideration config, which isn't part of a ReviewCache key.
+    """
+    item_xml = etree.tostring(element)
+    if section == 'processes':
+        item_xml = json.dumps(metadata['active considerations process'], sort_keys=True).encode() + item_xml
+    return ReviewCache.make_cache_key(item_xml, metadata, inherited_key)
+
+
+def get_action_fingerprints(element) -> dict:
+    """Return a hash of each Action (or Process page) of an lxml element, made from its subsheet and its stages.
+
+    :return: (dict) Action name to hex digest, in the order the Actions appear in the Object.
+    """
+    action_names = {}
+    action_hashes = {}
+    for child in element:
+        if child.tag is etree.Comment:
+            continue
+        tag_name = etree.QName(child).localname
+        if tag_name == 'subsheet':
+            subsheetid = child.get('subsheetid')
+            action_names[subsheetid] = _get_child_text(child, 'name')
+        elif tag_name == 'stage':
+            subsheetid = _get_child_text(child, 'subsheetid')
+        else:
+            continue
+        action_hashes.setdefault(subsheetid, hashlib.sha256()).update(etree.tostring(child))
+
+    return {action_name: action_hashes[subsheetid].hexdigest() for subsheetid, action_name in action_names.items()}
+
+
+def get_parent_object_name(element):
+    """Return the <parentobject> of an Object's lxml element, the Object whose App Model it inherits, or None."""
+    return _get_child_text(element, 'parentobject')
+
+
+def _get_child_text(element, tag_name):
+    """Return the text of the element's first child with the tag name, ignoring namespaces, or None."""
+    for child in element:
+        if child.tag is not etree.Comment and etree.QName(child).localname == tag_name:
+            return child.text
+    return None
+
+
+def is_valid_release_name(release_name) -> bool:
+    """Return True if the name can be used as a manifest's file name as it is: letters, digits, '_', '-', '.' and
+    spaces, starting with a letter, digit or '_', so it can't name a path outside the manifest directory."""
+    return RELEASE_NAME_PATTERN.fullmatch(release_name) is not None
+
+
+def _get_manifest_path(release_name, directory):
+    """Return the path of the release's manifest. Raises ValueError if the release name isn't valid."""
+    if not is_valid_release_name(release_name):
+        raise ValueError("Invalid release name " + repr(release_name))
+    return os.path.join(directory, release_name + MANIFEST_FILE_EXTENSION)
+
+
+def load_manifest(release_name, directory=Constants.RELEASE_MANIFEST_DIRECTORY) -> dict:
+    """Return the stored manifest of a release, or None if there isn't one."""
+    try:
+        with open(_get_manifest_path(release_name, directory), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        logging.warning("Unable to load a release manifest for " + release_name)
+        return None
+
+
+def save_manifest(release_name, manifest: dict, directory=Constants.RELEASE_MANIFEST_DIRECTORY):
+    """Store a release's manifest so later versions of the release can be diffed against it. Raises ValueError if the
+    release name isn't valid."""
+    manifest_path = _get_manifest_path(release_name, directory)
+    os.makedirs(directory, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file)
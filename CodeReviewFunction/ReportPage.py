@@ -1,5 +1,6 @@
 from bs4 import BeautifulSoup
 import logging
+from . import Constants
 
 class ReportPage:
     """"Class to manage information within a single report page.
@@ -66,4 +67,5 @@ class Result:
     FREQUENTLY = 'Frequently'
     INFREQUENTLY = 'Infrequently'
     NOT_APPLICABLE = 'Not Applicable'
+    NOT_EVALUATED = Constants.NOT_EVALUATED_TYPE
 
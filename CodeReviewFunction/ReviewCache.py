@@ -0,0 +1,161 @@
+"""
+This module contains the ReviewCache, which keeps the report pages of Objects that have already been reviewed so a
+resubmitted release only reviews the Objects that have changed.
+
+Each page is stored against a hash of everything the Object's review depends on: the Object's XML, the parts of the
+release metadata the Object considerations read and Constants.REVIEW_CACHE_VERSION.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from . import Constants
+
+CACHE_FILE_EXTENSION = '.json'
+
+_shared_cache = None
+
+
+class ReviewCache:
+    """Two tier cache of Object report pages. An in memory LRU, backed by an optional directory of JSON files.
+
+    Pages are held as JSON rather than dicts. Every hit returns a new dict that the caller is free to change, and the
+    cache doesn't keep the bs4 soups alive through the NavigableStrings in a page.
+    """
+
+    def __init__(self, max_pages=Constants.REVIEW_CACHE_MAX_PAGES, directory=None,
+                 max_disk_bytes=Constants.REVIEW_CACHE_MAX_DISK_BYTES):
+        """
+        :param max_pages: (int) Most pages held in memory.
+        :param directory: (str) Directory to also keep the pages in. None keeps pages in memory only.
+        :param max_disk_bytes: (int) Most bytes of pages kept in the directory.
+        """
+        self.max_pages = max_pages
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._pages = OrderedDict()
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for path, size, mtime in self._get_disk_entries())
+
+    def get(self, cache_key) -> dict:
+        """Return the cached report page for the key, or None if it isn't cached."""
+        page_json = self._pages.get(cache_key)
+        if page_json is not None:
+            self._pages.move_to_end(cache_key)
+        elif self.directory is not None:
+            page_json = self._read_from_disk(cache_key)
+            if page_json is not None:
+                self._set_in_memory(cache_key, page_json)
+
+        if page_json is None:
+            return None
+        return json.loads(page_json)
+
+    def set(self, cache_key, report_page: dict):
+        """Cache a report page against its key."""
+        page_json = json.dumps(report_page)
+        self._set_in_memory(cache_key, page_json)
+        if self.directory is not None:
+            self._write_to_disk(cache_key, page_json)
+
+    def _set_in_memory(self, cache_key, page_json):
+        self._pages[cache_key] = page_json
+        self._pages.move_to_end(cache_key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+    def _get_path(self, cache_key):
+        return os.path.join(self.directory, cache_key + CACHE_FILE_EXTENSION)
+
+    def _read_from_disk(self, cache_key):
+        """Return the page JSON from the directory, or None if it isn't there. A hit marks the file as recently used."""
+        path = self._get_path(cache_key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                page_json = file.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return page_json
+
+    def _write_to_disk(self, cache_key, page_json):
+        """Write the page to the directory, then delete the least recently used pages if it is over its size limit.
+
+        The file is written under a temporary name and renamed, so another process never reads half a page.
+        """
+        path = self._get_path(cache_key)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                file.write(page_json)
+            os.replace(temp_path, path)
+            self._disk_bytes += os.path.getsize(path) - old_size
+        except OSError:
+            logging.warning("Unable to write review cache file " + path)
+            return
+
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_from_disk()
+
+    def _get_disk_entries(self) -> list:
+        """Return (path, size, last used time) of every page in the directory."""
+        disk_entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_FILE_EXTENSION):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Deleted by another process since the scan
+                disk_entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return disk_entries
+
+    def _evict_from_disk(self):
+        """Delete the least recently used pages until the directory is back under max_disk_bytes."""
+        disk_entries = sorted(self._get_disk_entries(), key=lambda disk_entry: disk_entry[2])
+        self._disk_bytes = sum(size for path, size, mtime in disk_entries)
+        for path, size, mtime in disk_entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._disk_bytes -= size
+
+
+def make_cache_key(object_xml: str, metadata: dict, inherited_key='') -> str:
+    """Return the cache key of an Object's report page.
+
+    :param object_xml: (str or bytes) The Object's XML.
+    :param metadata: (dict) Metadata from CodeReview.extract_metadata. Only the parts that change an Object's page are
+    used: the Object consideration config (active, force result and score scale), the blacklist and the additional
+    release information.
+    :param inherited_key: (str) AppModelRegistry.get_inherited_key of the Object's parentobject, so the page is
+    reviewed again when the App Model it inherits changes.
+    :return: (str) Hex digest of the hash.
+    """
+    review_config = [metadata['active considerations object'], metadata['blacklist'], metadata['additional info']]
+    key_hash = hashlib.sha256(str(Constants.REVIEW_CACHE_VERSION).encode())
+    key_hash.update(json.dumps(review_config, sort_keys=True).encode())
+    if isinstance(object_xml, str):
+        object_xml = object_xml.encode()
+    key_hash.update(object_xml)
+    if inherited_key:
+        key_hash.update(inherited_key.encode())
+    return key_hash.hexdigest()
+
+
+def get_shared_cache():
+    """Return the review cache shared by every request the function's process handles, or None if it is disabled."""
+    global _shared_cache
+    if not Constants.REVIEW_CACHE_ENABLED:
+        return None
+    if _shared_cache is None:
+        _shared_cache = ReviewCache(Constants.REVIEW_CACHE_MAX_PAGES, Constants.REVIEW_CACHE_DIRECTORY,
+                                    Constants.REVIEW_CACHE_MAX_DISK_BYTES)
+    return _shared_cache
@@ -0,0 +1,86 @@
+"""
+This module contains the ReviewDeadline, the time budget a release's review has to finish within.
+
+The HTTP trigger is stopped once it runs past the Function's time limit, and the caller is then given no report at all.
+The review checks the deadline before it starts each Object, Process and consideration. Once the deadline has passed,
+the rest are given a 'not evaluated' page or result rather than reviewed, so the pages finished in time are still
+returned, and the Settings page records how much of the release was covered.
+"""
+
+import time
+from collections import Counter
+from . import Constants
+from .ReportPage import ReportPage, Result
+
+COVERAGE_SETTING_NAME = 'Review Coverage'
+PAGE_COVERAGE = {
+    'reviewed': 'Pages Reviewed',
+    'partial': 'Pages Partially Reviewed',
+    'not evaluated': 'Pages Not Evaluated'
+}
+
+
+class ReviewDeadline:
+    """The time a review started and the time it has to stop by, and the coverage of the pages it has made.
+
+    The deadline is a wall clock time, so a copy sent to a worker process of the parallel review mode stops at the
+    same time as the review that made it.
+    """
+
+    def __init__(self, time_budget=Constants.REVIEW_TIME_BUDGET):
+        """
+        :param time_budget: (float) Seconds from now the review has to finish within.
+        """
+        self.time_budget = time_budget
+        self.deadline = time.time() + time_budget
+        self.page_coverage = Counter()
+
+    def expired(self) -> bool:
+        """Return True once the deadline has passed, and nothing else should be started."""
+        return time.time() >= self.deadline
+
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline, or 0 once it has passed."""
+        return max(self.deadline - time.time(), 0)
+
+    def record_page(self, report_page_dict: dict):
+        """Count a finished Object or Process page towards the coverage on the Settings page."""
+        self.page_coverage[get_page_coverage(report_page_dict)] += 1
+
+    def record_pages(self, report_pages):
+        for report_page_dict in report_pages:
+            self.record_page(report_page_dict)
+
+    def get_coverage_setting(self) -> dict:
+        """Return the Settings page entry recording the time budget and how many pages were reviewed within it."""
+        reviewed_pages = self.page_coverage[PAGE_COVERAGE['reviewed']]
+        coverage_setting = {'Settings': COVERAGE_SETTING_NAME, 'Active': True, 'Time Budget': self.time_budget,
+                            'Timed Out': reviewed_pages < sum(self.page_coverage.values())}
+        for coverage in PAGE_COVERAGE.values():
+            coverage_setting[coverage] = self.page_coverage[coverage]
+        return coverage_setting
+
+
+def get_page_coverage(report_page_dict: dict) -> str:
+    """Return the PAGE_COVERAGE of an Object or Process page: reviewed, partially reviewed or not evaluated."""
+    if report_page_dict['Object Type'] == Constants.NOT_EVALUATED_TYPE:
+        return PAGE_COVERAGE['not evaluated']
+    if any(consideration['Result'] == Result.NOT_EVALUATED
+           for consideration in report_page_dict['Report Considerations']):
+        return PAGE_COVERAGE['partial']
+    return PAGE_COVERAGE['reviewed']
+
+
+def is_fully_reviewed(report_page_dict: dict) -> bool:
+    """Return True if none of the page was cut short by the deadline, so it can be cached or kept in a manifest."""
+    return get_page_coverage(report_page_dict) == PAGE_COVERAGE['reviewed']
+
+
+def is_expired(review_deadline: ReviewDeadline) -> bool:
+    """Return True if there is a deadline and it has passed. None is a review without a time budget."""
+    return review_deadline is not None and review_deadline.expired()
+
+
+def make_not_evaluated_page(page_name, page_type) -> dict:
+    """Return the report page of an Object or Process that wasn't started before the deadline."""
+    return ReportPage(page_name, page_type, Constants.NOT_EVALUATED_TYPE, []).get_page_as_dict()
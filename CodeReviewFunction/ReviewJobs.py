@@ -0,0 +1,333 @@
+"""
+This module contains the review job API, which reviews a release in the background rather than within the HTTP request
+that sends it, for releases too large to review inside the HTTP timeout.
+
+A release is submitted as a job and given a job id, and a worker reviews it with the same pipeline as the synchronous
+review. The caller polls the job's status with its id, and fetches the report once the job is complete.
+
+Jobs are kept in a JobQueue, and the releases and reports in a BlobStore. Both are abstract, so a deployment can swap in
+a hosted queue and blob storage with set_job_backends. The defaults, a SQLite database and a local directory, only use
+the standard library, so the whole flow runs offline.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from contextlib import closing
+from . import Constants
+
+JOB_STATUSES = {
+    'queued': 'Queued',
+    'running': 'Running',
+    'complete': 'Complete',
+    'failed': 'Failed'
+}
+JOB_EXPIRED_ERROR = "The job ran for longer than its lease, so its worker is assumed to have stopped"
+RELEASE_BLOB_SUFFIX = '.release.xml'
+REPORT_BLOB_SUFFIX = '.report.json'
+
+_job_queue = None
+_blob_store = None
+_worker_lock = threading.Lock()
+
+
+class Job(namedtuple('Job', 'job_id, status, params, submitted, updated, error')):
+    """A single submitted review job.
+
+    job_id (str): The id the job is polled and fetched with.
+    status (str): One of JOB_STATUSES.
+    params (dict): Parameters of the submit request, which the release is reviewed with, e.g. 'mode'.
+    submitted (float): Time the job was submitted, in seconds since the epoch.
+    updated (float): Time the job's status last changed, in seconds since the epoch.
+    error (str): Why the job failed, or None.
+    """
+    __slots__ = ()
+
+    def as_dict(self) -> dict:
+        """Return the job as it is sent to the caller. The parameters aren't included."""
+        return {'Job Id': self.job_id, 'Status': self.status, 'Submitted': self.submitted, 'Updated': self.updated,
+                'Error': self.error}
+
+
+class JobQueue(ABC):
+    """Abstract class for the store of review jobs and their statuses, which workers claim jobs from in order."""
+
+    @abstractmethod
+    def add(self, job_id, params: dict) -> Job:
+        """Add a queued job, and return it."""
+        pass
+
+    @abstractmethod
+    def claim(self) -> Job:
+        """Mark the oldest queued job as running and return it, or return None if no job is queued. A job is only
+        ever claimed by one worker."""
+        pass
+
+    @abstractmethod
+    def expire(self):
+        """Mark every job that has been running for longer than its lease as failed."""
+        pass
+
+    @abstractmethod
+    def remove_finished(self, before) -> list:
+        """Remove every complete or failed job that finished before the time, in seconds since the epoch, and return
+        their ids."""
+        pass
+
+    @abstractmethod
+    def set_status(self, job_id, status, error=None):
+        """Change the status of a job, with why it failed for JOB_STATUSES['failed']."""
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id) -> Job:
+        """Return the job with the id, or None if there isn't one."""
+        pass
+
+
+class BlobStore(ABC):
+    """Abstract class for the store of submitted releases and finished reports, each kept as bytes under a name."""
+
+    @abstractmethod
+    def put(self, name, data: bytes):
+        pass
+
+    @abstractmethod
+    def get(self, name) -> bytes:
+        """Return the bytes stored under the name, or None if there aren't any."""
+        pass
+
+    @abstractmethod
+    def delete(self, name):
+        """Delete the bytes stored under the name, if there are any."""
+        pass
+
+
+class SqliteJobQueue(JobQueue):
+    """JobQueue kept in a SQLite database, which every worker thread and process on the machine can share.
+
+    A new connection is opened for each call, as a SQLite connection can't be shared between threads.
+    """
+
+    def __init__(self, database_path=Constants.JOB_DATABASE_PATH, lease_seconds=Constants.JOB_LEASE_SECONDS):
+        """
+        :param database_path: (str) Path of the database file, which is created if it doesn't exist.
+        :param lease_seconds: (float) Longest a job can run before it is marked as failed.
+        """
+        self.database_path = database_path
+        self.lease_seconds = lease_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL, '
+                               'params TEXT NOT NULL, submitted REAL NOT NULL, updated REAL NOT NULL, error TEXT)')
+            connection.execute('CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, submitted)')
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit, so claim can take the write lock itself with BEGIN IMMEDIATE
+        return sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+
+    def add(self, job_id, params: dict) -> Job:
+        job = Job(job_id, JOB_STATUSES['queued'], params, time.time(), time.time(), None)
+        with closing(self._connect()) as connection:
+            connection.execute('INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?)',
+                               (job.job_id, job.status, json.dumps(params), job.submitted, job.updated, job.error))
+        return job
+
+    def claim(self) -> Job:
+        with closing(self._connect()) as connection:
+            # The write lock is held from the select to the update, so two workers can't claim the same job
+            connection.execute('BEGIN IMMEDIATE')
+            row = connection.execute('SELECT job_id FROM jobs WHERE status = ? ORDER BY submitted LIMIT 1',
+                                     (JOB_STATUSES['queued'],)).fetchone()
+            if row is not None:
+                connection.execute('UPDATE jobs SET status = ?, updated = ? WHERE job_id = ?',
+                                   (JOB_STATUSES['running'], time.time(), row[0]))
+            connection.execute('COMMIT')
+        return self.get_job(row[0]) if row is not None else None
+
+    def expire(self):
+        # A job's updated time is when it was claimed, for as long as it is running
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute('UPDATE jobs SET status = ?, updated = ?, error = ? WHERE status = ? AND updated < ?',
+                               (JOB_STATUSES['failed'], now, JOB_EXPIRED_ERROR, JOB_STATUSES['running'],
+                                now - self.lease_seconds))
+
+    def remove_finished(self, before) -> list:
+        finished_statuses = (JOB_STATUSES['complete'], JOB_STATUSES['failed'])
+        with closing(self._connect()) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            job_ids = [row[0] for row in connection.execute(
+                'SELECT job_id FROM jobs WHERE status IN (?, ?) AND updated < ?', finished_statuses + (before,))]
+            connection.executemany('DELETE FROM jobs WHERE job_id = ?', [(job_id,) for job_id in job_ids])
+            connection.execute('COMMIT')
+        return job_ids
+
+    def set_status(self, job_id, status, error=None):
+        with closing(self._connect()) as connection:
+            connection.execute('UPDATE jobs SET status = ?, updated = ?, error = ? WHERE job_id = ?',
+                               (status, time.time(), error, job_id))
+
+    def get_job(self, job_id) -> Job:
+        with closing(self._connect()) as connection:
+            row = connection.execute('SELECT job_id, status, params, submitted, updated, error FROM jobs '
+                                     'WHERE job_id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        return Job(row[0], row[1], json.loads(row[2]), row[3], row[4], row[5])
+
+
+class LocalBlobStore(BlobStore):
+    """BlobStore kept as files in a local directory."""
+
+    def __init__(self, directory=Constants.JOB_DIRECTORY):
+        """
+        :param directory: (str) Directory the files are kept in, which is created if it doesn't exist.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, name):
+        return os.path.join(self.directory, os.path.basename(name))
+
+    def put(self, name, data: bytes):
+        # Written to a temporary file first, so a reader never sees a partly written blob
+        temp_path = self._get_path(name) + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, self._get_path(name))
+
+    def get(self, name) -> bytes:
+        try:
+            with open(self._get_path(name), 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def delete(self, name):
+        try:
+            os.remove(self._get_path(name))
+        except OSError:
+            pass
+
+
+def get_release_blob_name(job_id) -> str:
+    return job_id + RELEASE_BLOB_SUFFIX
+
+
+def get_report_blob_name(job_id) -> str:
+    return job_id + REPORT_BLOB_SUFFIX
+
+
+def submit_job(xml_string, params: dict, job_queue: JobQueue, blob_store: BlobStore) -> Job:
+    """Store a release and queue it to be reviewed.
+
+    :param xml_string: (str or bytes) The full xml of the release.
+    :param params: (dict) Parameters to review the release with, as main would read them from an HTTP request.
+    :return: (Job) The queued job.
+    """
+    job_id = uuid.uuid4().hex
+    if isinstance(xml_string, str):
+        xml_string = xml_string.encode('utf-8')
+    # The release is stored before the job is queued, so a worker never claims a job without its release
+    blob_store.put(get_release_blob_name(job_id), xml_string)
+    job = job_queue.add(job_id, params)
+    logging.info("Submitted review job {}, {} bytes of XML".format(job_id, len(xml_string)))
+    return job
+
+
+def run_next_job(job_queue: JobQueue, blob_store: BlobStore, review_release) -> Job:
+    """Claim the oldest queued job, review its release and store the report.
+
+    Jobs that have run out their lease are expired first. The release is deleted once the job has finished, whether or
+    not it failed. A worker that finishes after its job expired still completes the job.
+
+    :param review_release: (function) Called with the release's XML and the job's parameters, returning the report as
+    a JSON str. See CodeReview.review_job_release.
+    :return: (Job) The finished job, or None if no job is queued.
+    """
+    job_queue.expire()
+    job = job_queue.claim()
+    if job is None:
+        return None
+
+    logging.info("Running review job " + job.job_id)
+    release_blob_name = get_release_blob_name(job.job_id)
+    try:
+        xml_string = blob_store.get(release_blob_name)
+        if xml_string is None:
+            raise ValueError("The job's release is missing from the blob store")
+        blob_store.put(get_report_blob_name(job.job_id), review_release(xml_string, job.params).encode('utf-8'))
+        job_queue.set_status(job.job_id, JOB_STATUSES['complete'])
+    except Exception as error:
+        logging.exception("Review job {} failed".format(job.job_id))
+        job_queue.set_status(job.job_id, JOB_STATUSES['failed'], '{}: {}'.format(type(error).__name__, error))
+    finally:
+        blob_store.delete(release_blob_name)
+    return job_queue.get_job(job.job_id)
+
+
+def prune_jobs(job_queue: JobQueue, blob_store: BlobStore, retention_seconds=Constants.JOB_RETENTION_SECONDS) -> list:
+    """Remove the jobs that finished more than retention_seconds ago, with their reports and any release left behind.
+
+    :return: (list) Ids of the removed jobs.
+    """
+    job_ids = job_queue.remove_finished(time.time() - retention_seconds)
+    for job_id in job_ids:
+        blob_store.delete(get_report_blob_name(job_id))
+        blob_store.delete(get_release_blob_name(job_id))
+    if job_ids:
+        logging.info("Removed {} finished review jobs".format(len(job_ids)))
+    return job_ids
+
+
+def run_queued_jobs(job_queue: JobQueue, blob_store: BlobStore, review_release):
+    """Run jobs until none are queued. Only one thread of the process runs jobs at a time, so large releases aren't
+    held in memory together."""
+    with _worker_lock:
+        while run_next_job(job_queue, blob_store, review_release) is not None:
+            pass
+
+
+def start_worker(job_queue: JobQueue, blob_store: BlobStore, review_release) -> threading.Thread:
+    """Run the queued jobs on a background thread, as the local stand-in for a queue triggered worker.
+
+    Called after each submit. A thread waiting for the lock runs any job queued after the running thread finished.
+
+    :return: (threading.Thread) The started thread.
+    """
+    worker = threading.Thread(target=run_queued_jobs, args=(job_queue, blob_store, review_release), daemon=True)
+    worker.start()
+    return worker
+
+
+def get_job_queue() -> JobQueue:
+    """Return the job queue shared by every request the function's process handles."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = SqliteJobQueue(Constants.JOB_DATABASE_PATH)
+    return _job_queue
+
+
+def get_blob_store() -> BlobStore:
+    """Return the blob store shared by every request the function's process handles."""
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = LocalBlobStore(Constants.JOB_DIRECTORY)
+    return _blob_store
+
+
+def set_job_backends(job_queue: JobQueue = None, blob_store: BlobStore = None):
+    """Replace the shared job queue and blob store, e.g. with ones backed by hosted services. None keeps the current
+    one."""
+    global _job_queue, _blob_store
+    if job_queue is not None:
+        _job_queue = job_queue
+    if blob_store is not None:
+        _blob_store = blob_store
@@ -4,35 +4,164 @@ out of individual soup objects.
 
 """
 
+import html
+import logging
 import pickle
+import re
 import time
 from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from . import Constants
+from .XmlSoup import XmlTag, normalize_element
 from collections import namedtuple
 Sub_Soup = namedtuple('Sub_Soup', 'processes, objects, queues, metadata')
+SECTION_TAG_NAMES = ['process', 'work-queue', 'header']
+"""Tag names of the top level elements that make up each section of a Sub_Soup."""
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Number of bytes of the release fed to the incremental parser at a time."""
+RELEASE_ITEM_DEPTH = 3
+"""Depth of the Processes, Objects and Queues in a release (bpr:release > bpr:contents > item)."""
+OBJECT_START_TAG_PATTERN = re.compile(rb'<process\b(?:[^>"]|"[^"]*")*>')
+"""Opening tag of a <process>, allowing for '>' inside its quoted attribute values."""
+OBJECT_TYPE_PATTERN = re.compile(rb'\stype="object"')
+OBJECT_NAME_PATTERN = re.compile(rb'\sname="([^"]*)"')
+PROCESS_TAG_PATTERN = re.compile(rb'</?process[\s/>]')
+"""Opening or closing <process> tag, but not tags such as <processid>."""
+PARENT_OBJECT_PATTERN = re.compile(rb'<parentobject>([^<]+)</parentobject>')
+"""An Object's <parentobject>, the name of the Object whose App Model it inherits."""
 
 
-def extract_soups(xml_string) -> namedtuple:
+def extract_soups(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND) -> namedtuple:
     """Turn the xml into a tuple of soups containing processes, objects, queues and the metadata.
 
+    The release is only tokenized once. A single SoupStrainer keeps every element that could belong to a section, then
+    each kept element is moved into the soup of the section it belongs to.
+
     :param xml_string: The full xml from the HTTP request.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS. The 'xml' backend returns XmlTag soups instead.
     :return: Sub_Soup object containing a individual soup for each section of the BP release.
     """
+    if parser_backend == Constants.PARSER_BACKENDS['xml']:
+        return _extract_xml_soups(xml_string)
+
+    print("Extracting xml in a single pass")
+    start = time.perf_counter()
+    release_soup = BeautifulSoup(xml_string, 'lxml', parse_only=SoupStrainer(SECTION_TAG_NAMES))
+
+    section_soups = {section: BeautifulSoup('', 'lxml') for section in Sub_Soup._fields}
+    for tag in list(release_soup.contents):
+        section = _get_release_section(tag)
+        if section:
+            section_soups[section].append(tag)
+    end = time.perf_counter()
+    print('Time to extract all xml in a single pass: ' + str(end - start))
+
+    return Sub_Soup(**section_soups)
+
+
+def _get_release_section(tag):
+    """Return the Sub_Soup field that a top level tag of the release belongs to, or None if it isn't used.
+
+    Mirrors the strainers in _extract_single_soup: Objects are <process type="object"> tags, while Processes and
+    Queues are the <process> and <work-queue> tags carrying the release's xmlns.
+    """
+    if tag.name == 'process':
+        if tag.get('type') == 'object':
+            return 'objects'
+        elif tag.has_attr('xmlns'):
+            return 'processes'
+    elif tag.name == 'work-queue':
+        if tag.has_attr('xmlns'):
+            return 'queues'
+    elif tag.name == 'header':
+        return 'metadata'
+
+
+def _extract_xml_soups(xml_string) -> namedtuple:
+    """Split the release into sections using lxml's XML parser, keeping the native tree rather than building bs4 Tags.
+
+    Each section is an XmlTag wrapping a container element, with the section's items as its children. Tag and
+    attribute names are normalized to match the bs4 soups, so the considerations can't tell the two apart.
+    """
+    print("Extracting xml with the XML parser")
+    start = time.perf_counter()
+    xml_bytes = _as_bytes(xml_string)
+    header_start, header_end = _find_header(xml_bytes)
+    parser = etree.XMLParser(huge_tree=True, recover=True)
+    for chunk in _iter_release_chunks(xml_bytes, header_start, header_end):
+        parser.feed(chunk)
+    try:
+        release_root = parser.close()
+    except etree.XMLSyntaxError:
+        release_root = None  # Nothing readable was sent, so give back empty sections as the bs4 backend does
+
+    section_elements = {section: etree.Element(section) for section in Sub_Soup._fields}
+    if release_root is not None:
+        for section, element in list(_iter_release_items(release_root)):
+            element.tail = None
+            normalize_element(element)
+            section_elements[section].append(element)
+
+    header_element = _parse_xml_header(xml_bytes[header_start:header_end])
+    if header_element is not None:
+        section_elements['metadata'].append(header_element)
+    end = time.perf_counter()
+    print('Time to extract all xml with the XML parser: ' + str(end - start))
+
+    return Sub_Soup(**{section: XmlTag(element) for section, element in section_elements.items()})
+
+
+def _iter_release_items(element):
+    """Yield (section, element) for the outermost Processes, Objects and Queues below an element, in document order.
+
+    Like a SoupStrainer, nothing inside a matched item is matched again.
+    """
+    for child in element.iterchildren(etree.Element):
+        section = _get_xml_release_section(child)
+        if section:
+            yield section, child
+        else:
+            yield from _iter_release_items(child)
+
+
+def _get_xml_release_section(element):
+    """Return the Sub_Soup field an lxml element of the release belongs to, or None. See _get_release_section."""
+    tag_name = etree.QName(element).localname.lower()
+    if tag_name == 'process':
+        if element.get('type') == 'object':
+            return 'objects'
+        elif _declares_default_namespace(element):
+            return 'processes'
+    elif tag_name == 'work-queue':
+        if _declares_default_namespace(element):
+            return 'queues'
 
-    print("Extracting without multi-processing xml")
-    start = time.clock()
-    results = []
-    strainers = ['process', 'object', 'work-queue', 'header']
-    for strainer in strainers:
-        results.append(_extract_single_soup(strainer, xml_string))
-    end = time.clock()
-    print('Time to extract without multi-processing all xmls: ' + str(end - start))
 
-    return Sub_Soup(results[0], results[1], results[2], results[3])
+def _declares_default_namespace(element) -> bool:
+    """Return if the element has its own xmlns attribute, as the XML parser doesn't keep it as an attribute."""
+    parent = element.getparent()
+    inherited_namespace = parent.nsmap.get(None) if parent is not None else None
+    return None in element.nsmap and element.nsmap[None] != inherited_namespace
+
+
+def _parse_xml_header(header_bytes):
+    """Return the normalized SAM header element, or None if the release doesn't have one.
+
+    The header's xmlns is not a valid URI, so it is only readable by a recovering parser.
+    """
+    if not header_bytes:
+        return None
+    header_element = etree.fromstring(header_bytes, etree.XMLParser(huge_tree=True, recover=True))
+    if header_element is not None:
+        normalize_element(header_element)
+    return header_element
 
 
 def _extract_single_soup(strainer_param, xml_string):
-    """Return a single soup object from the full xml_string."""
+    """Return a single soup object from the full xml_string.
+
+    Each call parses the whole release. Kept as the reference for the single pass in extract_soups and its benchmark.
+    """
     if strainer_param == 'header':
         soup_strainer = SoupStrainer(strainer_param)
         individual_soup = BeautifulSoup(xml_string, 'lxml', parse_only=soup_strainer)
@@ -48,6 +177,212 @@ def _extract_single_soup(strainer_param, xml_string):
     return individual_soup
 
 
+def extract_header_soup(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND):
+    """Return a soup of only the SAM header, sliced out of the raw release instead of parsing the whole release."""
+    xml_bytes = _as_bytes(xml_string)
+    header_start, header_end = _find_header(xml_bytes)
+    if parser_backend == Constants.PARSER_BACKENDS['xml']:
+        header_container = etree.Element('metadata')
+        header_element = _parse_xml_header(xml_bytes[header_start:header_end])
+        if header_element is not None:
+            header_container.append(header_element)
+        return XmlTag(header_container)
+    return BeautifulSoup(xml_bytes[header_start:header_end], 'lxml', parse_only=SoupStrainer('header'))
+
+
+def iter_release_soups(xml_string, parser_backend=Constants.DEFAULT_PARSER_BACKEND):
+    """Parse the release incrementally, yielding each Object and Process as a soup as soon as its closing tag is read.
+
+    Only the element currently being yielded is held as a tree. Once the caller has finished with it, the element is
+    cleared and removed from the partially built release so memory scales with the largest single Object rather than
+    the whole release. The SAM header is skipped as it is not part of the release XML (see extract_header_soup).
+
+    :param xml_string: The full xml from the HTTP request.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS. The 'xml' backend yields the parsed element
+        wrapped in an XmlTag rather than re-parsing it with bs4.
+    :return: Generator of (section, tag) where section is the Sub_Soup field ('objects' or 'processes') and tag is
+        the bs4 Tag of that single Object or Process.
+    """
+    for section, element in iter_release_elements(xml_string):
+        yield section, release_element_to_soup(section, element, parser_backend)
+
+
+def iter_release_elements(xml_string):
+    """Parse the release incrementally, yielding the lxml element of each Object and Process once it is complete.
+
+    The same as iter_release_soups without converting the elements into soups, for when only some of the release's
+    items need to be reviewed. An element is only valid until the next one is requested.
+
+    :param xml_string: The full xml from the HTTP request.
+    :return: Generator of (section, element) where section is the Sub_Soup field ('objects' or 'processes').
+    """
+    xml_bytes = _as_bytes(xml_string)
+    header_start, header_end = _find_header(xml_bytes)
+    parser = etree.XMLPullParser(events=('start', 'end'), huge_tree=True, recover=True)
+    depth = 0
+
+    for chunk in _iter_release_chunks(xml_bytes, header_start, header_end):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == 'start':
+                depth += 1
+                continue
+
+            # Compared on the raw tag as building a QName for every element is slower than the parse itself
+            tag = element.tag
+            if isinstance(tag, str) and (tag == 'process' or tag.endswith('}process')):
+                if element.get('type') == 'object':
+                    yield 'objects', element
+                elif depth == RELEASE_ITEM_DEPTH:
+                    yield 'processes', element
+
+            # Release the finished release item, along with anything before it that is no longer needed. The root's
+            # siblings, e.g. a comment before it, aren't pruned as it has no parent to delete them from
+            if depth <= RELEASE_ITEM_DEPTH:
+                element.clear()
+                while element.getparent() is not None and element.getprevious() is not None:
+                    del element.getparent()[0]
+            depth -= 1
+    parser.close()
+
+
+def release_element_to_soup(section, element, parser_backend=Constants.DEFAULT_PARSER_BACKEND):
+    """Convert an element from iter_release_elements into the soup the considerations are given.
+
+    :param section: (str) The Sub_Soup field the element is from, 'objects' or 'processes'.
+    :param element: The lxml element of a single Object or Process.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS.
+    :return: bs4 Tag or XmlTag of the Object or Process.
+    """
+    if parser_backend == Constants.PARSER_BACKENDS['xml']:
+        normalize_element(element)
+        return XmlTag(element)
+    if section == 'objects':
+        return _element_to_tag(element, SoupStrainer('process', {"type": "object"}))
+    return _element_to_tag(element, SoupStrainer('process'))
+
+
+def skip_blacklisted_objects(xml_string, is_blacklisted_name):
+    """Empty every blacklisted Object in the raw release, so none of them are parsed into a tree.
+
+    Each blacklisted Object's <process type="object"> tag is found by its name attribute in the bytes of the release
+    and replaced with an empty tag, keeping its attributes. The empty tag keeps the Object's place in the release, so
+    every review mode still gives its page in the same order.
+
+    :param xml_string: The full xml from the HTTP request.
+    :param is_blacklisted_name: (function) Given an Object's name, returns True if the Object is blacklisted.
+    :return: (tuple) The release, of the same type as xml_string (unchanged if nothing was blacklisted), and the list
+    of names of the Objects emptied.
+    """
+    xml_bytes = _as_bytes(xml_string)
+    header_start, header_end = _find_header(xml_bytes)
+    release_end = header_start if header_end else len(xml_bytes)
+
+    release_parts = []
+    skipped_names = []
+    copied_to = 0
+    start_match = OBJECT_START_TAG_PATTERN.search(xml_bytes, 0, release_end)
+    while start_match:
+        start_tag = start_match.group()
+        next_search = start_match.end()
+        name_match = OBJECT_NAME_PATTERN.search(start_tag)
+        object_name = html.unescape(name_match.group(1).decode('utf-8')) if name_match else None
+        if object_name is not None and not start_tag.endswith(b'/>') and OBJECT_TYPE_PATTERN.search(start_tag) \
+                and is_blacklisted_name(object_name):
+            end_match = PROCESS_TAG_PATTERN.search(xml_bytes, next_search, release_end)
+            # Left as it is if the Object can't be cut out whole
+            if end_match and end_match.group() == b'</process>':
+                release_parts.append(xml_bytes[copied_to:start_match.start()])
+                release_parts.append(start_tag[:-1] + b'/>')
+                skipped_names.append(object_name)
+                copied_to = next_search = end_match.end()
+        start_match = OBJECT_START_TAG_PATTERN.search(xml_bytes, next_search, release_end)
+
+    if not skipped_names:
+        return xml_string, skipped_names
+    logging.info("Skipping the blacklisted Objects: {}".format(skipped_names))
+    release_parts.append(xml_bytes[copied_to:])
+    skipped_bytes = b''.join(release_parts)
+    if isinstance(xml_string, str):
+        return skipped_bytes.decode('utf-8'), skipped_names
+    return skipped_bytes, skipped_names
+
+
+def get_parent_object_names(xml_string) -> set:
+    """Return the names of the Objects that other Objects in the release inherit their App Model from.
+
+    Read from the raw release with a single search, so it can be known before the release is parsed which Objects'
+    App Models need to be kept for the AppModelRegistry.
+
+    :param xml_string: The full xml from the HTTP request.
+    :return: (set) Object names, which is empty if no Object inherits an App Model.
+    """
+    xml_bytes = _as_bytes(xml_string)
+    header_start, header_end = _find_header(xml_bytes)
+    release_end = header_start if header_end else len(xml_bytes)
+    return {html.unescape(parent_match.group(1).decode('utf-8'))
+            for parent_match in PARENT_OBJECT_PATTERN.finditer(xml_bytes, 0, release_end)}
+
+
+def _as_bytes(xml_string) -> bytes:
+    """Return the release as bytes, as the HTTP request body is bytes but local testing uses str."""
+    if isinstance(xml_string, str):
+        return xml_string.encode('utf-8')
+    return xml_string
+
+
+def _find_header(xml_bytes):
+    """Return the (start, end) index of the SAM header within the raw release, or (0, 0) if there isn't one."""
+    header_start = xml_bytes.rfind(b'<header')
+    if header_start == -1:
+        return 0, 0
+    header_end = xml_bytes.find(b'</header>', header_start)
+    if header_end == -1:
+        return 0, 0
+    return header_start, header_end + len(b'</header>')
+
+
+def _iter_release_chunks(xml_bytes, header_start, header_end):
+    """Yield the release in chunks of STREAM_CHUNK_SIZE, skipping over the SAM header."""
+    for section_start, section_end in [(0, header_start), (header_end, len(xml_bytes))]:
+        for chunk_start in range(section_start, section_end, STREAM_CHUNK_SIZE):
+            yield xml_bytes[chunk_start:min(chunk_start + STREAM_CHUNK_SIZE, section_end)]
+
+
+def _element_to_tag(element, soup_strainer):
+    """Convert a single lxml element into the same bs4 Tag extract_soups would produce for it.
+
+    lxml repeats every namespace in scope on the serialized element, so any xmlns attribute that wasn't declared on the
+    element itself in the release is removed again.
+    """
+    markup = etree.tostring(element, encoding='utf-8', with_tail=False)
+    tag = BeautifulSoup(markup, 'lxml', parse_only=soup_strainer).contents[0]
+
+    parent = element.getparent()
+    inherited_namespaces = parent.nsmap if parent is not None else {}
+    declared_attributes = ['xmlns:' + prefix if prefix else 'xmlns' for prefix, uri in element.nsmap.items()
+                           if inherited_namespaces.get(prefix) != uri]
+    for attribute_name in list(tag.attrs):
+        if attribute_name.startswith('xmlns') and attribute_name not in declared_attributes:
+            del tag[attribute_name]
+    return tag
+
+
+def parse_object_soup(object_xml, parser_backend=Constants.DEFAULT_PARSER_BACKEND):
+    """Parse the XML of a single Object, as given by str() of one of its soups, back into a soup.
+
+    Used to pass Objects to other processes, as the XML is much quicker to pickle than the soup's tree.
+
+    :param object_xml: (str) XML of the Object's <process type="object"> tag.
+    :param parser_backend: (str) One of Constants.PARSER_BACKENDS, the backend the XML came from.
+    :return: bs4 Tag or XmlTag of the Object.
+    """
+    if parser_backend == Constants.PARSER_BACKENDS['xml']:
+        # Tag and attribute names were already normalized before the XmlTag was converted to a string
+        return XmlTag(etree.fromstring(object_xml, etree.XMLParser(huge_tree=True, recover=True)))
+    return BeautifulSoup(object_xml, 'lxml', parse_only=SoupStrainer('process', {"type": "object"})).contents[0]
+
+
 def determine_object_type(object_name, soup_object: BeautifulSoup):
     """
     Determine if a Object is a Wrapper, Base, or Base for Surface Automation.
@@ -139,6 +474,22 @@ def get_object_actions(object_soup: BeautifulSoup):
     return object_actions
 
 
+def iter_child_tags(tag):
+    """Yield the child tags of a bs4 Tag or XmlTag, skipping strings. Quicker than a find for each child's name."""
+    for child in tag.contents:
+        if not isinstance(child, str):
+            yield child
+
+
+def read_string(tag):
+    """Return the tag's only string as a plain str, or None if it doesn't have one.
+
+    A bs4 NavigableString refers back to its tree, so it would keep the soup alive and pickle all of it.
+    """
+    string = tag.string
+    return None if string is None else str(string)
+
+
 # Only used for testing
 def pickle_and_dump(py_object):
     """Pickle and save and object to a file to speed up testing."""
@@ -0,0 +1,411 @@
+"""
+Timing comparisons for the performance sensitive parts of the code review.
+
+Run from the repository root with: python -m CodeReviewFunction.Testing.Benchmarks
+"""
+
+import copy
+import gc
+import io
+import pickle
+import re
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from .. import CodeReview
+from .. import Constants
+from .. import ReviewCache
+from .. import SoupUtilities
+from ..Considerations import ObjectConsiderations
+from ..Considerations.AppModel import AppModel
+from ..Considerations.ExpressionAnalysis import analyse_expression
+from ..Considerations.ObjectModel import ObjectModel
+from ..Considerations.StageIndex import StageIndex
+from ..Considerations.StageTable import StageTable, LOGGING_MODES
+from .FixtureLoader import fixture_release_xml, sam_package_release_xml, MERS_FIXTURE, MULTI_PROCESS_FIXTURE
+
+REPEATS = 3
+
+
+def get_benchmark_releases():
+    """Return a list of (release name, release xml) used by each benchmark."""
+    return [(MERS_FIXTURE, fixture_release_xml(MERS_FIXTURE)),
+            (MULTI_PROCESS_FIXTURE, fixture_release_xml(MULTI_PROCESS_FIXTURE))]
+
+
+def best_time(function, *args, repeats=REPEATS):
+    """Return the fastest wall time of running the function over a number of repeats.
+
+    The review prints as it goes, so stdout is swallowed while timing to keep the comparison readable.
+    """
+    times = []
+    for _ in range(repeats):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function(*args)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def print_comparison(title, release_name, baseline_time, new_time):
+    print("{} - {}\n    before: {:.3f}s  after: {:.3f}s  speed up: {:.1f}x"
+          .format(title, release_name, baseline_time, new_time, baseline_time / new_time))
+
+
+def _extract_soups_per_section(xml_string):
+    """The original extract_soups, which parses the full release once for every section."""
+    results = []
+    for strainer in ['process', 'object', 'work-queue', 'header']:
+        results.append(SoupUtilities._extract_single_soup(strainer, xml_string))
+    return SoupUtilities.Sub_Soup(*results)
+
+
+def benchmark_extract_soups(releases):
+    """Compare the four parse extract against the single pass release splitter."""
+    for release_name, xml_string in releases:
+        baseline_time = best_time(_extract_soups_per_section, xml_string)
+        new_time = best_time(SoupUtilities.extract_soups, xml_string)
+        print_comparison('extract_soups', release_name, baseline_time, new_time)
+
+
+def _review_objects(sub_soups, review_plan, metadata):
+    """Run make_report_object over every Object in an already extracted release."""
+    for object_tag in sub_soups.objects.contents:
+        CodeReview.make_report_object(object_tag, review_plan, metadata)
+
+
+def benchmark_parser_backends(releases):
+    """Compare the bs4 and XML parser backends, for splitting the release and for make_report_object on its Objects."""
+    for release_name, xml_string in releases:
+        extract_times, review_times = [], []
+        for parser_backend in [Constants.PARSER_BACKENDS['bs4'], Constants.PARSER_BACKENDS['xml']]:
+            extract_times.append(best_time(SoupUtilities.extract_soups, xml_string, parser_backend))
+
+            with redirect_stdout(io.StringIO()):
+                sub_soups = SoupUtilities.extract_soups(xml_string, parser_backend)
+                metadata = CodeReview.extract_metadata(sub_soups.metadata)
+                object_considerations, _ = CodeReview.get_active_considerations(metadata)
+                review_plan = CodeReview.make_review_plan(object_considerations, metadata)
+            review_times.append(best_time(_review_objects, sub_soups, review_plan, metadata))
+
+        print_comparison('extract_soups bs4 -> xml', release_name, *extract_times)
+        print_comparison('make_report_object bs4 -> xml', release_name, *review_times)
+
+
+def benchmark_parallel_review(releases, max_workers=None):
+    """Compare the standard review against the parallel review, which spreads the Objects across worker processes."""
+    for release_name, xml_string in releases:
+        baseline_time = best_time(CodeReview.review_release, xml_string)
+        new_time = best_time(CodeReview.review_release_parallel, xml_string, Constants.DEFAULT_PARSER_BACKEND,
+                             max_workers)
+        print_comparison('review_release_parallel', release_name, baseline_time, new_time)
+
+
+def benchmark_review_cache(releases):
+    """Compare the standard review against resubmitting the same release to a review cache that already holds it."""
+    for release_name, xml_string in releases:
+        review_cache = ReviewCache.ReviewCache()
+        with redirect_stdout(io.StringIO()):
+            CodeReview.review_release(xml_string, review_cache=review_cache)
+        baseline_time = best_time(CodeReview.review_release, xml_string)
+        new_time = best_time(CodeReview.review_release, xml_string, Constants.DEFAULT_PARSER_BACKEND, review_cache)
+        print_comparison('review_release resubmitted with review cache', release_name, baseline_time, new_time)
+
+
+def benchmark_release_diff(releases):
+    """Compare the standard review against the diff review of a release that hasn't changed since its baseline."""
+    for release_name, xml_string in releases:
+        with redirect_stdout(io.StringIO()):
+            report_pages, baseline_manifest = CodeReview.review_release_diff(xml_string)
+        baseline_time = best_time(CodeReview.review_release, xml_string)
+        new_time = best_time(CodeReview.review_release_diff, xml_string, baseline_manifest)
+        print_comparison('review_release_diff against an unchanged baseline', release_name, baseline_time, new_time)
+
+
+def _skip_and_extract_soups(xml_string, review_plan):
+    return SoupUtilities.extract_soups(CodeReview.skip_blacklisted_objects(xml_string, review_plan))
+
+
+def benchmark_skip_blacklisted_objects(releases):
+    """Compare parsing the whole release against emptying the blacklisted Objects before it is parsed."""
+    for release_name, xml_string in releases:
+        metadata = CodeReview.extract_metadata(SoupUtilities.extract_header_soup(xml_string))
+        review_plan = CodeReview.make_review_plan([], metadata)
+        with redirect_stdout(io.StringIO()):
+            baseline_time = best_time(SoupUtilities.extract_soups, xml_string)
+            new_time = best_time(_skip_and_extract_soups, xml_string, review_plan)
+        print_comparison('extract_soups with blacklisted Objects skipped', release_name, baseline_time, new_time)
+
+
+def get_attribute_values(xml_string) -> list:
+    """Return the value of every App Model attribute of every Object in the release, duplicates included."""
+    with redirect_stdout(io.StringIO()):
+        sub_soups = SoupUtilities.extract_soups(xml_string)
+    return [attribute.value for object_tag in sub_soups.objects.contents
+            for element in AppModel(object_tag.find('appdef', recursive=False)).elements
+            for attribute in element.attributes if attribute.value is not None]
+
+
+def _classify_attribute_values(classify_function, attribute_values):
+    if hasattr(classify_function, 'cache_clear'):
+        classify_function.cache_clear()  # Each run starts without any values cached
+    for attribute_value in attribute_values:
+        try:
+            classify_function(attribute_value)
+        except OverflowError:
+            pass  # dateutil reads numbers too large for a date, with or without the pre-filter
+
+
+def _classify_attribute_values_dateutil(attribute_values):
+    """Classify the values with the date pre-filter turned off, so dateutil parses every value, as it originally did."""
+    with patch.object(ObjectConsiderations, 'could_be_date', lambda attribute_value: True):
+        _classify_attribute_values(ObjectConsiderations.is_useless_attribute_value, attribute_values)
+
+
+def benchmark_useless_attribute_values(releases):
+    """Compare parsing every App Model attribute value with dateutil against the cached date pre-filter."""
+    for release_name, xml_string in releases:
+        attribute_values = get_attribute_values(xml_string)
+        baseline_time = best_time(_classify_attribute_values_dateutil, attribute_values)
+        new_time = best_time(_classify_attribute_values, ObjectConsiderations.is_useless_attribute_value,
+                             attribute_values)
+        print_comparison('is_useless_attribute_value over {} values'.format(len(attribute_values)), release_name,
+                         baseline_time, new_time)
+
+
+def _count_containing_any(keywords, strings):
+    return sum(1 for string in strings if any(keyword in string.lower() for keyword in keywords))
+
+
+def _count_containing_matcher(keyword_matcher, strings):
+    return sum(1 for string in strings if keyword_matcher.contains(string))
+
+
+def benchmark_keyword_matcher(releases):
+    """Compare testing each environment warning word against every App Model attribute value with the KeywordMatcher
+    compiled from them."""
+    keyword_matcher = ObjectConsiderations.CheckValuesContainEnvironmentData.WARNING_WORDS
+    for release_name, xml_string in releases:
+        attribute_values = [value for value in get_attribute_values(xml_string) if value]
+        baseline_time = best_time(_count_containing_any, keyword_matcher.keywords, attribute_values)
+        new_time = best_time(_count_containing_matcher, keyword_matcher, attribute_values)
+        print_comparison('Environment warning words in {} values'.format(len(attribute_values)), release_name,
+                         baseline_time, new_time)
+
+
+def _get_step_element_ids(soup_objects) -> list:
+    """Return (Object soup, the element id of each of its Navigate steps)."""
+    return [(soup_object, [step.element.get('id') for navigate_stage in soup_object.find_all('stage', type='Navigate')
+                           for step in navigate_stage.find_all('step', recursive=False) if step.element])
+            for soup_object in soup_objects]
+
+
+def _find_elements_soup(step_element_ids):
+    for soup_object, element_ids in step_element_ids:
+        for element_id in element_ids:
+            soup_object.find('id', text=element_id)
+
+
+def _find_elements_app_model(step_element_ids):
+    for soup_object, element_ids in step_element_ids:
+        app_model = AppModel(soup_object.find('appdef', recursive=False))
+        for element_id in element_ids:
+            app_model.get_element(element_id)
+
+
+def benchmark_element_lookup(releases):
+    """Compare searching each Object's soup for the element of every Navigate step against building the AppModel's
+    element id index and looking them up in it."""
+    for release_name, xml_string in releases:
+        step_element_ids = _get_step_element_ids(SoupUtilities.extract_soups(xml_string).objects.contents)
+        baseline_time = best_time(_find_elements_soup, step_element_ids)
+        new_time = best_time(_find_elements_app_model, step_element_ids)
+        print_comparison('Navigate step elements', release_name, baseline_time, new_time)
+
+
+def _get_flag_comparisons(soup_objects) -> list:
+    """Return (Object soup, comparisons of each pair of its first 60 Data items), as many expressions as a wrapper
+    Object with hundreds of Decision and Choice stages checks."""
+    object_expressions = []
+    for soup_object in soup_objects:
+        data_item_names = [data_stage.get('name') for data_stage in
+                           soup_object.find_all('stage', type='Data', recursive=False)][:60]
+        object_expressions.append((soup_object, ['[{}] = [{}]'.format(name, other_name) for name in data_item_names
+                                                 for other_name in data_item_names]))
+    return object_expressions
+
+
+def _compare_with_flag_search(object_expressions):
+    for soup_object, expressions in object_expressions:
+        data_stages = StageIndex(soup_object).get_stages('Data')
+        for expression in expressions:
+            removed_dataitems = re.sub(r'\[.*?\]', '[]', expression).replace(' ', '')
+            if removed_dataitems == '[]=[]' or removed_dataitems == '[]<>[]':
+                data_item_name = expression[expression.rfind("[") + 1:expression.rfind("]")]
+                for data_item in data_stages:
+                    if data_item.get('name') == data_item_name:
+                        break
+
+
+def _compare_with_flag_index(object_expressions):
+    analyse_expression.cache_clear()
+    for soup_object, expressions in object_expressions:
+        stage_index = StageIndex(soup_object)
+        for expression in expressions:
+            ObjectConsiderations.CheckObjectsNoBusinessLogic.expression_compares_with_flag(expression, stage_index)
+
+
+def benchmark_flag_comparisons(releases):
+    """Compare searching the Data stages for the Data item of every flag comparison against analysing each expression
+    once and looking its Data item up in the Object's DataItemIndex."""
+    for release_name, xml_string in releases:
+        object_expressions = _get_flag_comparisons(SoupUtilities.extract_soups(xml_string).objects.contents)
+        expression_count = sum(len(expressions) for soup_object, expressions in object_expressions)
+        baseline_time = best_time(_compare_with_flag_search, object_expressions)
+        new_time = best_time(_compare_with_flag_index, object_expressions)
+        print_comparison('{} flag comparisons'.format(expression_count), release_name, baseline_time, new_time)
+
+
+def _count_action_stages_nested(stage_indexes):
+    for stage_index in stage_indexes:
+        for action_id, action_name in stage_index.action_resolver.items():
+            len([stage for stage in stage_index.stages if stage.get('type') != 'Note'
+                 and stage.subsheetid and action_id == stage.subsheetid.string])
+
+
+def _count_action_stages_partitioned(object_soups):
+    for soup_object in object_soups:
+        stage_index = StageIndex(soup_object)
+        stage_table = stage_index.stage_table
+        stage_counts = stage_table.count_by_page(stage_table.mask_not(stage_table.type_mask(['Note'])))
+        for action_id, action_name in stage_index.action_resolver.items():
+            stage_counts.get(action_id, 0)
+
+
+def benchmark_action_stage_counts(releases):
+    """Compare scanning every stage of the Object for each of its Actions against building the StageIndex and
+    counting each page's stages with its StageTable."""
+    for release_name, xml_string in releases:
+        object_soups = SoupUtilities.extract_soups(xml_string).objects.contents
+        stage_indexes = [StageIndex(soup_object) for soup_object in object_soups]
+        baseline_time = best_time(_count_action_stages_nested, stage_indexes)
+        new_time = best_time(_count_action_stages_partitioned, object_soups)
+        print_comparison('Stages per Action', release_name, baseline_time, new_time)
+
+
+LOGGING_IGNORE_TYPES = ['SubSheetInfo', 'ProcessInfo', 'Note', 'Data', 'Collection', 'Block', 'Anchor']
+COMPLEXITY_IGNORE_TYPES = LOGGING_IGNORE_TYPES + ['WaitEnd', 'Start']
+
+
+def _make_large_object(soup_objects, copies):
+    """Return a copy of the Object with the most stages, with its stages repeated to make it many times larger."""
+    large_object = copy.copy(max(soup_objects, key=lambda soup_object: len(soup_object.find_all('stage'))))
+    stages = large_object.find_all('stage', recursive=False)
+    for _ in range(copies - 1):
+        for stage in stages:
+            large_object.append(copy.copy(stage))
+    return large_object
+
+
+def _query_stages_walking(stages):
+    """The logged stages and the stages per page, found by walking the soup of every stage."""
+    logged_stages = []
+    stage_counts = {}
+    for stage in stages:
+        stage_type = stage.get('type')
+        subsheetid = stage.subsheetid
+        if stage_type not in LOGGING_IGNORE_TYPES and subsheetid:
+            loginhibit = stage.loginhibit
+            if not loginhibit or loginhibit.get('onsuccess'):
+                logged_stages.append(stage)
+        if stage_type not in COMPLEXITY_IGNORE_TYPES and subsheetid:
+            stage_counts[subsheetid.string] = stage_counts.get(subsheetid.string, 0) + 1
+    return logged_stages, stage_counts
+
+
+def _query_stages_table(stage_table):
+    """The logged stages and the stages per page, found with masks over the StageTable's columns."""
+    logged_stages = stage_table.mask_and(stage_table.page_mask(),
+                                         stage_table.mask_not(stage_table.type_mask(LOGGING_IGNORE_TYPES)),
+                                         stage_table.logging_mask(LOGGING_MODES['disabled']))
+    stage_counts = stage_table.count_by_page(stage_table.mask_and(
+        stage_table.page_mask(), stage_table.mask_not(stage_table.type_mask(COMPLEXITY_IGNORE_TYPES))))
+    return [stage_table.stages[row] for row in stage_table.rows(logged_stages)], stage_counts
+
+
+def _build_and_query_stage_table(stages):
+    return _query_stages_table(StageTable(stages))
+
+
+def benchmark_stage_table(releases, copies=10):
+    """Compare the logging and complexity queries walking the soup of every stage against reading the stages once
+    into a StageTable and querying its columns. The StageTable is built once per Object and shared, so the time of the
+    queries alone is shown as well."""
+    for release_name, xml_string in releases:
+        large_object = _make_large_object(SoupUtilities.extract_soups(xml_string).objects.contents, copies)
+        stages = large_object.find_all('stage', recursive=False)
+        stage_table = StageTable(stages)
+        baseline_time = best_time(_query_stages_walking, stages)
+        title = 'Stage queries over {} stages'.format(len(stages))
+        print_comparison(title, release_name, baseline_time, best_time(_build_and_query_stage_table, stages))
+        print_comparison(title + ', table built', release_name, baseline_time,
+                         best_time(_query_stages_table, stage_table))
+
+
+def _traced_size(function, *args):
+    """Return (the function's result, the memory it still holds once the function has returned)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def _read_object_model(object_xml):
+    """Parse the Object's soup and read its ObjectModel, freeing the soup."""
+    soup_object = SoupUtilities.parse_object_soup(object_xml)
+    object_model = ObjectModel.from_soup(soup_object)
+    soup_object.decompose()
+    return object_model
+
+
+def benchmark_object_model_memory(releases):
+    """Compare the memory held by each Object's soup against the memory held by its ObjectModel once the soup is
+    freed, and the size of each when pickled to send to a worker process."""
+    for release_name, xml_string in releases:
+        object_xmls = [str(soup_object) for soup_object in SoupUtilities.extract_soups(xml_string).objects.contents]
+        soup_objects, soup_size = _traced_size(lambda: [SoupUtilities.parse_object_soup(object_xml)
+                                                        for object_xml in object_xmls])
+        object_models, model_size = _traced_size(lambda: [_read_object_model(object_xml)
+                                                          for object_xml in object_xmls])
+        print("Memory held by {} Objects - {}\n    soup: {:.2f} MB  ObjectModel: {:.2f} MB  smaller: {:.1f}x"
+              .format(len(object_xmls), release_name, soup_size / 2 ** 20, model_size / 2 ** 20,
+                      soup_size / model_size))
+        xml_size = sum(len(object_xml.encode()) for object_xml in object_xmls)
+        pickled_size = sum(len(pickle.dumps(object_model)) for object_model in object_models)
+        print("    Object XML sent to workers: {:.2f} MB  pickled ObjectModel: {:.2f} MB"
+              .format(xml_size / 2 ** 20, pickled_size / 2 ** 20))
+        for soup_object in soup_objects:
+            soup_object.decompose()
+
+
+if __name__ == '__main__':
+    benchmark_releases = get_benchmark_releases()
+    benchmark_releases.append(('SAM Package - v0.1', sam_package_release_xml()))
+    benchmark_extract_soups(benchmark_releases)
+    benchmark_parser_backends(get_benchmark_releases())
+    benchmark_parallel_review(get_benchmark_releases())
+    benchmark_review_cache(get_benchmark_releases())
+    benchmark_release_diff(get_benchmark_releases())
+    benchmark_skip_blacklisted_objects(benchmark_releases)
+    benchmark_useless_attribute_values(benchmark_releases)
+    benchmark_keyword_matcher(benchmark_releases)
+    benchmark_element_lookup(benchmark_releases)
+    benchmark_flag_comparisons(benchmark_releases)
+    benchmark_action_stage_counts(benchmark_releases)
+    benchmark_stage_table(benchmark_releases)
+    benchmark_object_model_memory(benchmark_releases)
@@ -0,0 +1,54 @@
+"""
+Helpers to rebuild SAM processed release XML from the files in Testing/Fixtures.
+
+The pickled fixtures hold the four sub-soups of a release as strings (processes, objects, queues, header). They are
+stitched back into a single release so tests and benchmarks can run the full extract and review path on them.
+"""
+
+import os
+import pickle
+import re
+
+TESTING_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(TESTING_DIR, 'Fixtures')
+MERS_FIXTURE = 'MERS_pickled_soup.txt'
+MULTI_PROCESS_FIXTURE = 'multi_process_pickled_soups.txt'
+SAM_PACKAGE_RELEASE = os.path.join(os.path.dirname(os.path.dirname(TESTING_DIR)), 'Blue Prism Release',
+                                   'SAM Package - v0.1.bprelease')
+
+RELEASE_START = '<?xml version="1.0" encoding="utf-8"?>\n' \
+                '<bpr:release xmlns:bpr="http://www.blueprism.co.uk/product/release">' \
+                '<bpr:name>{}</bpr:name><bpr:contents count="{}">'
+RELEASE_END = '</bpr:contents></bpr:release>\n'
+OBJECT_WRAPPER = '<object name="{}" xmlns="http://www.blueprism.co.uk/product/process">{}</object>'
+
+
+def get_pickled_results(fixture_name):
+    """Return the list of pickled sub-soup strings saved in a fixture file."""
+    with open(os.path.join(FIXTURES_DIR, fixture_name), 'rb') as file:
+        return pickle.load(file)
+
+
+def fixture_release_xml(fixture_name) -> str:
+    """Rebuild a SAM processed release (release XML followed by the SAM header) from a pickled fixture."""
+    processes, objects, queues, header = get_pickled_results(fixture_name)
+
+    # The object fixture only holds the inner <process type="object"> tags, so put back the release's <object> wrapper
+    object_strings = [object_string for object_string in re.split(r'(?=<process [^>]*type="object")', objects)
+                      if object_string]
+    wrapped_objects = []
+    for object_string in object_strings:
+        object_name = re.search(r'name="([^"]*)"', object_string).group(1)
+        wrapped_objects.append(OBJECT_WRAPPER.format(object_name, object_string))
+
+    contents_count = processes.count('xmlns=') + len(wrapped_objects) + queues.count('xmlns=')
+    return RELEASE_START.format(fixture_name, contents_count) + processes + ''.join(wrapped_objects) + queues \
+        + RELEASE_END + header
+
+
+def sam_package_release_xml() -> str:
+    """Return the SAM Package release with the MERS fixture's header appended, as SAM would send it."""
+    with open(SAM_PACKAGE_RELEASE, 'r', encoding='utf-8-sig') as file:
+        release_xml = file.read()
+    header = get_pickled_results(MERS_FIXTURE)[3]
+    return release_xml + '\n' + header
@@ -7,6 +7,8 @@ from .. import SoupUtilities
 import pickle
 from ..Considerations.ObjectConsiderations import *
 from ..Considerations.ProcessConsiderations import *
+from ..Considerations.ReviewContext import ReviewContext
+from ..Considerations.StageIndex import StageIndex
 from .. import SoupUtilities
 
 
@@ -102,16 +104,16 @@ if __name__ == '__main__':
         metadata = {}
         object_name = soup_object.get('name')
         object_type, estimated = SoupUtilities.determine_object_type(object_name.lower(), soup_object)
-        metadata['object type'] = object_type
 
         a = {'Delivery Stage': ''}
         metadata['additional info'] = a
         metadata['additional info']['Delivery Stage'] = 'Production'
+        context = ReviewContext.create(object_name, object_type, estimated, StageIndex(soup_object), metadata)
 
         print('\n=== Current Object: {} ({}) ==='.format(object_name, object_type))
 
         consideration = CheckValuesContainEnvironmentData()
-        consideration.check_consideration(soup_object, metadata)
+        consideration.check_consideration(soup_object, context)
     consid_end = time.clock()
 
     print("\nConsideration Time: " + str(consid_end - consid_start))
@@ -0,0 +1,37 @@
+from unittest import TestCase
+from ...Considerations.ActionResolver import ActionResolver
+from ...Considerations.KeywordMatcher import KeywordMatcher
+from bs4 import BeautifulSoup
+
+OBJECT_XML = '<process name="Test Object" type="object">' \
+             '<subsheet subsheetid="1"><name>Attach</name></subsheet>' \
+             '<subsheet subsheetid="2"><name>Get Customer Details</name></subsheet>' \
+             '<subsheet subsheetid="3"><name>Detach Application</name></subsheet>' \
+             '</process>'
+
+
+class TestActionResolver(TestCase):
+
+    def setUp(self):
+        subsheets = BeautifulSoup(OBJECT_XML, 'lxml').find_all('subsheet')
+        self.action_resolver = ActionResolver(subsheets)
+
+    def test_get_action_name(self):
+        self.assertEqual('Get Customer Details', self.action_resolver.get_action_name('2'))
+        self.assertIsNone(self.action_resolver.get_action_name('4'))
+        self.assertIsNone(self.action_resolver.get_action_name(None))
+
+    def test_get_lower_action_name(self):
+        self.assertEqual('get customer details', self.action_resolver.get_lower_action_name('2'))
+        self.assertEqual('', self.action_resolver.get_lower_action_name('4'))
+
+    def test_not_blacklisted(self):
+        blacklist = KeywordMatcher(['attach', 'detach'])
+        self.assertFalse(self.action_resolver.not_blacklisted(blacklist, '1'))
+        self.assertTrue(self.action_resolver.not_blacklisted(blacklist, '2'))
+        self.assertFalse(self.action_resolver.not_blacklisted(blacklist, '3'))
+        self.assertTrue(self.action_resolver.not_blacklisted(blacklist, '4'))
+
+    def test_items(self):
+        self.assertEqual([('1', 'Attach'), ('2', 'Get Customer Details'), ('3', 'Detach Application')],
+                         self.action_resolver.items())
@@ -0,0 +1,81 @@
+from unittest import TestCase
+from ... import SoupUtilities
+from ... import Constants
+from ...Considerations.AppModel import AppModel
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+
+def get_attribute_names(soup_object) -> list:
+    """Return (element name, basetype, attribute names) for each element in the Object's App Model."""
+    return [(element.name, element.basetype, [attribute.name for attribute in element.attributes])
+            for element in StageIndex(soup_object).app_model.elements]
+
+
+class TestAppModel(TestCase):
+    """Each record must hold the same values as reading the element's soup directly."""
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.objects = SoupUtilities.extract_soups(xml_string).objects.contents
+        self.xml_objects = SoupUtilities.extract_soups(xml_string, Constants.PARSER_BACKENDS['xml']).objects.contents
+
+    def test_elements_match_soup(self):
+        for soup_object in self.objects:
+            appdef = soup_object.find('appdef', recursive=False)
+            elements = appdef.find_all('element')
+            app_model = AppModel(appdef)
+            self.assertEqual(len(elements), len(app_model.elements))
+            for element, app_model_element in zip(elements, app_model.elements):
+                self.assertEqual(element.get('name'), app_model_element.name)
+                self.assertEqual(element.find('basetype', recursive=False).string, app_model_element.basetype)
+                attributes_tag = element.find('attributes', recursive=False)
+                attributes = attributes_tag.contents if attributes_tag else []
+                self.assertEqual([(attribute.get('name'), attribute.get('inuse'), attribute.get('comparisontype'),
+                                   attribute.find('processvalue', recursive=False).get('value'))
+                                  for attribute in attributes], list(app_model_element.attributes))
+
+    def test_get_element_matches_soup(self):
+        for soup_object in self.objects + self.xml_objects:
+            app_model = StageIndex(soup_object).app_model
+            element_ids = [step.element.get('id') for step in soup_object.find_all('step') if step.element]
+            element_ids += [app_model_element.id for app_model_element in app_model.elements]
+            for element_id in element_ids:
+                id_tag = soup_object.find('id', text=element_id)
+                app_model_element = app_model.get_element(element_id)
+                self.assertEqual(id_tag is None, app_model_element is None, element_id)
+                if id_tag is not None:
+                    element = id_tag.parent
+                    self.assertEqual(element.get('name'), app_model_element.name)
+                    # The root element's own datatype and basetype come after the elements nested in it
+                    self.assertEqual(element.find('datatype', recursive=False).string, app_model_element.datatype)
+                    self.assertEqual(element.find('basetype', recursive=False).string, app_model_element.basetype)
+
+    def test_group(self):
+        groups = {app_model_element.name: app_model_element.group
+                  for app_model_element in StageIndex(self.objects[1]).app_model.elements}
+        self.assertIsNone(groups['MERS Online General'])
+        self.assertEqual('Global Items', groups['Main Window (Win32)'])
+
+    def test_get_element_from_parent(self):
+        parent_app_model = StageIndex(self.objects[1]).app_model
+        app_model = AppModel(None)
+        element_id = parent_app_model.elements[1].id
+        self.assertIsNone(app_model.get_element(element_id))
+        app_model.parent = parent_app_model
+        self.assertEqual(parent_app_model.elements[1], app_model.get_element(element_id))
+        self.assertIsNone(app_model.get_element('Not An Element Id'))
+
+    def test_backends_match(self):
+        # The XML parser normalizes whitespace in XML attribute values, so only the names are compared
+        for soup_object, xml_object in zip(self.objects, self.xml_objects):
+            self.assertEqual(get_attribute_names(soup_object), get_attribute_names(xml_object))
+
+    def test_get_attribute(self):
+        app_model_element = StageIndex(self.objects[1]).app_model.elements[1]
+        first_attribute = app_model_element.attributes[0]
+        self.assertEqual(first_attribute, app_model_element.get_attribute(first_attribute.name))
+        self.assertIsNone(app_model_element.get_attribute('Not An Attribute'))
+
+    def test_no_app_model(self):
+        self.assertEqual([], AppModel(None).elements)
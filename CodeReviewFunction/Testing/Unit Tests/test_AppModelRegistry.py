@@ -0,0 +1,112 @@
+import re
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import SoupUtilities
+from ... import ReviewCache
+from ...Considerations import AppModelRegistry
+from ...Considerations import ObjectConsiderations
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+PARENT_NAME = 'Kwik Survey - General'
+CHILD_NAME = 'Kwik Survey - Child'
+
+
+def make_inheriting_release(xml_string, parent_name=PARENT_NAME, child_name=CHILD_NAME) -> str:
+    """Return the release with a copy of the parent Object added after it, that inherits the parent's App Model."""
+    if isinstance(xml_string, bytes):
+        xml_string = xml_string.decode('utf-8')
+    start = xml_string.index('<object name="{}"'.format(parent_name))
+    end = xml_string.index('</object>', start) + len('</object>')
+    child_xml = xml_string[start:end].replace(parent_name, child_name)
+    child_xml = re.sub(r'<appdef>.*?</appdef>',
+                       '<parentobject>{}</parentobject><appdef></appdef>'.format(parent_name), child_xml, flags=re.S)
+    return xml_string[:end] + child_xml + xml_string[end:]
+
+
+def get_step_element_ids(soup_object) -> list:
+    return [step.element.get('id') for step in soup_object.find_all('step') if step.element]
+
+
+class TestAppModelRegistry(TestCase):
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.xml_string = make_inheriting_release(xml_string)
+        self.objects = {object_tag.get('name'): object_tag
+                        for object_tag in SoupUtilities.extract_soups(self.xml_string).objects.contents}
+
+    def test_get_parent_object_names(self):
+        self.assertEqual({PARENT_NAME}, SoupUtilities.get_parent_object_names(self.xml_string))
+        self.assertEqual({PARENT_NAME}, SoupUtilities.get_parent_object_names(self.xml_string.encode()))
+        self.assertEqual(set(), SoupUtilities.get_parent_object_names(
+            FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)))
+
+    def test_inherited_elements_found(self):
+        child = self.objects[CHILD_NAME]
+        self.assertIsNone(StageIndex(child).app_model.get_element(get_step_element_ids(child)[0]))
+
+        app_model_registry = CodeReview.make_app_model_registry(self.xml_string,
+                                                                object_tags=list(self.objects.values()))
+        parent_app_model = StageIndex(self.objects[PARENT_NAME]).app_model
+        child_app_model = StageIndex(child, app_model_registry).app_model
+        self.assertEqual([], child_app_model.elements)
+        for element_id in get_step_element_ids(child):
+            self.assertEqual(parent_app_model.get_element(element_id), child_app_model.get_element(element_id))
+        # The parent's own review uses the registered AppModel rather than scanning it again
+        self.assertIs(child_app_model.parent, StageIndex(self.objects[PARENT_NAME], app_model_registry).app_model)
+
+    def test_navigate_check_uses_inherited_elements(self):
+        child = self.objects[CHILD_NAME]
+        navigate_stage = child.find('stage', type='Navigate')
+        app_model_registry = CodeReview.make_app_model_registry(self.xml_string,
+                                                                object_tags=list(self.objects.values()))
+        for stage_index, inherited_warnings in [(StageIndex(child), 1), (StageIndex(child, app_model_registry), 0)]:
+            consideration = ObjectConsiderations.CheckNavigateFollowedByWait()
+            consideration._check_element_is_selectable(navigate_stage, 'Action', stage_index.app_model)
+            self.assertEqual(inherited_warnings, len(consideration.warning_list))
+
+    def test_registry_from_release(self):
+        app_model_registry = CodeReview.make_app_model_registry(self.xml_string)
+        child = self.objects[CHILD_NAME]
+        element_id = get_step_element_ids(child)[0]
+        self.assertIsNotNone(StageIndex(child, app_model_registry).app_model.get_element(element_id))
+
+    def test_inheritance_cycle(self):
+        app_model_registry = AppModelRegistry.AppModelRegistry()
+        for object_name, parent_name in [('A', 'B'), ('B', 'A')]:
+            object_tag = self.objects[PARENT_NAME] if object_name == 'A' else self.objects['SAM Testing']
+            with patch.object(AppModelRegistry, 'get_parent_object_name', return_value=parent_name):
+                app_model_registry.add_object(object_tag)
+        app_model = app_model_registry.get_app_model(self.objects[PARENT_NAME])
+        self.assertIsNone(app_model.get_element('Not An Element Id'))
+        self.assertNotEqual('', app_model_registry.get_inherited_key(PARENT_NAME))
+
+    def test_review_modes_match(self):
+        report_pages = CodeReview.review_release(self.xml_string)
+        self.assertEqual([PARENT_NAME, CHILD_NAME, 'SAM Testing'],
+                         [report_page['Report Page Name'] for report_page in report_pages[1:4]])
+        self.assertEqual(report_pages, CodeReview.review_release_streaming(self.xml_string))
+        with patch.object(CodeReview.Constants, 'PARALLEL_MIN_OBJECTS', 1):  # Sends the registry to the workers
+            self.assertEqual(report_pages, CodeReview.review_release_parallel(self.xml_string, max_workers=2))
+        self.assertEqual(report_pages, CodeReview.review_release_diff(self.xml_string)[0])
+
+    def test_cache_key_follows_parent(self):
+        app_model_registry = CodeReview.make_app_model_registry(self.xml_string,
+                                                                object_tags=list(self.objects.values()))
+        changed_xml = self.xml_string.replace('Kwik Survey Window (Win32)', 'Kwik Survey - Window')
+        changed_objects = SoupUtilities.extract_soups(changed_xml).objects.contents
+        changed_registry = CodeReview.make_app_model_registry(changed_xml, object_tags=changed_objects)
+
+        inherited_key = app_model_registry.get_inherited_key(PARENT_NAME)
+        self.assertNotEqual('', inherited_key)
+        self.assertNotEqual(inherited_key, changed_registry.get_inherited_key(PARENT_NAME))
+        self.assertEqual('', app_model_registry.get_object_inherited_key(self.objects[PARENT_NAME]))
+        self.assertEqual(inherited_key, app_model_registry.get_object_inherited_key(self.objects[CHILD_NAME]))
+        self.assertNotEqual(ReviewCache.make_cache_key('<process/>', self.metadata(), inherited_key),
+                            ReviewCache.make_cache_key('<process/>', self.metadata()))
+
+    @staticmethod
+    def metadata() -> dict:
+        return {'active considerations object': [], 'blacklist': [], 'additional info': {}}
@@ -0,0 +1,66 @@
+from unittest import TestCase
+from ... import CodeReview
+from ... import SoupUtilities
+from ...Considerations.ConsiderationAbstract import Consideration
+from ...Considerations.ConsiderationRegistry import ConsiderationRegistry, normalize_consideration_name
+from ...Considerations.ObjectConsiderations import OBJECT_CONSIDERATIONS, CheckWaitTimeoutToException
+from .. import FixtureLoader
+
+
+class TestConsiderationRegistry(TestCase):
+
+    def setUp(self):
+        self.registry = ConsiderationRegistry('Test')
+
+        @self.registry.register
+        class CheckTest(Consideration):
+            CONSIDERATION_NAME = "Does the Object pass the test?"
+
+            def check_consideration(self, soup, context):
+                pass
+
+        self.consideration_class = CheckTest
+
+    def test_normalize_consideration_name(self):
+        self.assertEqual('do wait stages timeout to an exception?',
+                         normalize_consideration_name('  Do Wait Stages  timeout\nto an exception? '))
+
+    def test_get_consideration_class(self):
+        self.assertIs(self.consideration_class, self.registry.get_consideration_class("Does the Object pass the test?"))
+        self.assertIs(self.consideration_class,
+                      self.registry.get_consideration_class(" does the object  pass the TEST? "))
+        self.assertIsNone(self.registry.get_consideration_class("Does the Object fail the test?"))
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            @self.registry.register
+            class CheckTestAgain(self.consideration_class):
+                pass
+
+    def test_get_active_classes(self):
+        active_considerations = [{'Test Considerations': "Does the Object pass the test?", 'Active': True},
+                                 {'Test Considerations': "Inactive name without a class", 'Active': False},
+                                 {'Test Considerations': "Active name without a class", 'Active': True}]
+        self.assertEqual(([self.consideration_class], ["Active name without a class"]),
+                         self.registry.get_active_classes(active_considerations, 'Test Considerations'))
+
+
+class TestObjectConsiderations(TestCase):
+
+    def test_every_consideration_registered(self):
+        self.assertEqual(25, len(OBJECT_CONSIDERATIONS.consideration_classes))
+        self.assertIs(CheckWaitTimeoutToException,
+                      OBJECT_CONSIDERATIONS.get_consideration_class("Do Wait Stages timeout to an exception?"))
+
+    def test_get_active_considerations(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        metadata = CodeReview.extract_metadata(SoupUtilities.extract_soups(xml_string).metadata)
+        object_considerations, process_considerations = CodeReview.get_active_considerations(metadata)
+        active_names = [normalize_consideration_name(active_consideration['Object Considerations'])
+                        for active_consideration in metadata['active considerations object']
+                        if active_consideration['Active']]
+        self.assertEqual([normalize_consideration_name(object_consideration.CONSIDERATION_NAME)
+                          for object_consideration in object_considerations],
+                         [active_name for active_name in active_names
+                          if active_name in OBJECT_CONSIDERATIONS.consideration_classes])
+        self.assertEqual([], process_considerations)
@@ -0,0 +1,76 @@
+import re
+from unittest import TestCase
+from ... import SoupUtilities
+from ...Considerations import ObjectConsiderations
+from ...Considerations.ExpressionAnalysis import analyse_expression
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+
+def expression_compares_with_flag(expression, soup_object) -> bool:
+    """The flag comparison check before it used analyse_expression and the Object's DataItemIndex."""
+    removed_dataitems = re.sub(r'\[.*?\]', '[]', expression).replace(' ', '')
+    if removed_dataitems == '[]=[]' or removed_dataitems == '[]<>[]':
+        data_item_name = expression[expression.rfind("[") + 1:expression.rfind("]")]
+        data_item = soup_object.find('stage', {'name': data_item_name}, type='Data')
+        if data_item and data_item.datatype.string == 'flag':
+            return True
+    return False
+
+
+def expression_uses_flag(expression) -> bool:
+    """The flag check before it used analyse_expression."""
+    if 'True' in expression or 'False' in expression:
+        return True
+    return not any(sign in expression for sign in ['=', '<>', '>', '>=', '<', '<='])
+
+
+def get_expressions(soup_object) -> list:
+    """Return the expression of every Decision stage and choice in the Object."""
+    expressions = [stage.decision.get('expression') for stage in soup_object.find_all('stage', type='Decision')]
+    expressions += [choice.get('expression') for stage in soup_object.find_all('stage', type='ChoiceStart')
+                    for choice in stage.choices.find_all('choice')]
+    return expressions
+
+
+class TestExpressionAnalysis(TestCase):
+
+    def test_analyse_expression(self):
+        analysis = analyse_expression('[Count] >= [Max Count] AND [Found]<>True')
+        self.assertEqual('[]>=[]AND[]<>True', analysis.shape)
+        self.assertEqual('Found', analysis.last_data_item)
+        self.assertTrue(analysis.has_boolean)
+        self.assertTrue(analysis.has_comparison_sign)
+
+        analysis = analyse_expression('[Is Open]')
+        self.assertEqual(('[]', 'Is Open', False, False), analysis)
+        # Signs in a Data item's name are removed from the shape, but the flag check still counts them
+        analysis = analyse_expression('[Count > 5]')
+        self.assertEqual('[]', analysis.shape)
+        self.assertTrue(analysis.has_comparison_sign)
+
+    def test_results_cached(self):
+        analyse_expression.cache_clear()
+        for _ in range(3):
+            analyse_expression('[A] = [B]')
+        self.assertEqual(2, analyse_expression.cache_info().hits)
+
+    def test_fixture_expressions_match_soup_search(self):
+        consideration = ObjectConsiderations.CheckObjectsNoBusinessLogic
+        flag_expressions = 0
+        for fixture_name in [FixtureLoader.MERS_FIXTURE, FixtureLoader.MULTI_PROCESS_FIXTURE]:
+            for soup_object in SoupUtilities.extract_soups(
+                    FixtureLoader.fixture_release_xml(fixture_name)).objects.contents:
+                stage_index = StageIndex(soup_object)
+                expressions = get_expressions(soup_object)
+                data_item_names = [data_item.get('name') for data_item in stage_index.get_stages('Data')]
+                # Comparisons of every pair of the Object's Data items, which include its flags
+                expressions += ['[{}] = [{}]'.format(name, other_name) for name in data_item_names[:10]
+                                for other_name in data_item_names[:10]]
+                for expression in expressions:
+                    self.assertEqual(expression_uses_flag(expression), consideration._expression_uses_flag(expression))
+                    compares_with_flag = expression_compares_with_flag(expression, soup_object)
+                    self.assertEqual(compares_with_flag,
+                                     consideration.expression_compares_with_flag(expression, stage_index), expression)
+                    flag_expressions += compares_with_flag
+        self.assertGreater(flag_expressions, 0)
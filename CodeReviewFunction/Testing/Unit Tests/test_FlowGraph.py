@@ -0,0 +1,82 @@
+from unittest import TestCase
+from ... import Constants
+from ...Considerations.ReviewContext import ReviewContext
+from ...Considerations.StageIndex import StageIndex
+from ...Considerations.ObjectConsiderations import CheckWaitTimeoutToException, CheckNavigateFollowedByWait
+from bs4 import BeautifulSoup
+
+STAGE_XML = '<stage stageid="{}" name="{}" type="{}"><subsheetid>page</subsheetid>{}</stage>'
+ONSUCCESS_XML = '<onsuccess>{}</onsuccess>'
+
+
+def make_object_soup(stages):
+    """Return the soup of an Object with a single page of stages, given as (stageid, type, onsuccess stageid)."""
+    stages_xml = ''.join(STAGE_XML.format(stageid, stageid, stage_type,
+                                          ONSUCCESS_XML.format(onsuccess) if onsuccess else '')
+                         for stageid, stage_type, onsuccess in stages)
+    object_xml = '<process name="Test Object" type="object"><subsheet subsheetid="page"><name>Action</name>' \
+                 '</subsheet>{}</process>'.format(stages_xml)
+    return BeautifulSoup(object_xml, 'lxml').find('process')
+
+
+class TestFlowGraph(TestCase):
+
+    def setUp(self):
+        self.stage_index = StageIndex(make_object_soup([
+            ('wait', 'WaitEnd', 'anchor1'),
+            ('anchor1', 'Anchor', 'anchor2'),
+            ('anchor2', 'Anchor', 'end'),
+            ('end', 'End', None),
+            ('cycle_wait', 'WaitEnd', 'cycle1'),
+            ('cycle1', 'Anchor', 'cycle2'),
+            ('cycle2', 'Anchor', 'cycle1'),
+            ('dangling_wait', 'WaitEnd', 'dangling_anchor'),
+            ('dangling_anchor', 'Anchor', 'missing'),
+        ]))
+        self.flow_graph = self.stage_index.flow_graph
+
+    def test_get_next_stage(self):
+        self.assertEqual('anchor1', self.flow_graph.get_next_stage(self.stage_index.get_stage('wait')).get('stageid'))
+        self.assertIsNone(self.flow_graph.get_next_stage(self.stage_index.get_stage('end')))
+
+    def test_anchor_chain_collapsed(self):
+        self.assertEqual('end', self.flow_graph.anchor_targets['anchor1'])
+        self.assertEqual('end', self.flow_graph.anchor_targets['anchor2'])
+        next_stage = self.flow_graph.get_next_non_anchor_stage(self.stage_index.get_stage('wait'))
+        self.assertEqual('end', next_stage.get('stageid'))
+
+    def test_anchor_cycle(self):
+        self.assertEqual({'cycle1', 'cycle2'}, self.flow_graph.cyclic_anchors)
+        self.assertIsNone(self.flow_graph.get_next_non_anchor_stage(self.stage_index.get_stage('cycle_wait')))
+
+    def test_dangling_anchor(self):
+        self.assertIsNone(self.flow_graph.get_next_non_anchor_stage(self.stage_index.get_stage('dangling_wait')))
+
+    def test_flow_graph_built_once(self):
+        self.assertIs(self.flow_graph, self.stage_index.flow_graph)
+
+
+class TestConsiderationsWithAnchorCycles(TestCase):
+    """Considerations following links must finish and report the broken link when Anchors loop back on themselves."""
+
+    def setUp(self):
+        self.soup = make_object_soup([
+            ('navigate', 'Navigate', 'cycle1'),
+            ('wait', 'WaitEnd', 'cycle1'),
+            ('cycle1', 'Anchor', 'cycle2'),
+            ('cycle2', 'Anchor', 'cycle1'),
+        ])
+        self.context = ReviewContext.create('Test Object', Constants.OBJECT_TYPES['base'], False,
+                                            StageIndex(self.soup), {})
+
+    def test_wait_timeout_to_exception(self):
+        consideration = CheckWaitTimeoutToException()
+        consideration.check_consideration(self.soup, self.context)
+        self.assertEqual(["'wait' timeout has no connection"],
+                         [error['Error Name'] for error in consideration.errors_list])
+
+    def test_navigate_followed_by_wait(self):
+        consideration = CheckNavigateFollowedByWait()
+        consideration.check_consideration(self.soup, self.context)
+        self.assertEqual(["Navigate stage isn't connected to another stage"],
+                         [error['Error Name'] for error in consideration.errors_list])
@@ -0,0 +1,70 @@
+import random
+from unittest import TestCase
+from ...Considerations import ObjectConsiderations
+from ...Considerations.KeywordMatcher import KeywordMatcher
+from .. import FixtureLoader
+from .. import Benchmarks
+
+CUSTOMER_DATA_WORDS = ['username', 'password', 'billing', 'qty', 'quantity', 'code', 'name', 'account']
+
+
+def potential_customer_data(attribute_value) -> bool:
+    """The customer data check before it used a KeywordMatcher."""
+    attribute_value = attribute_value.lower()
+    for error_word in CUSTOMER_DATA_WORDS:
+        if error_word in attribute_value:
+            chars_after_error_word = len(attribute_value) - (attribute_value.find(error_word) + len(error_word))
+            if chars_after_error_word > 1:
+                return True
+    return False
+
+
+class TestKeywordMatcher(TestCase):
+
+    def setUp(self):
+        self.keyword_matcher = KeywordMatcher(['Code', 'qty', 'quantity', 'a.b', 'name', 'names'], ignore_case=True)
+
+    def test_search(self):
+        self.assertEqual('quantity', self.keyword_matcher.search('Order Quantity Code'))
+        self.assertEqual('names', self.keyword_matcher.search('user names'))
+        self.assertIsNone(self.keyword_matcher.search('Account'))
+        self.assertIsNone(self.keyword_matcher.search('aXb'))  # Keywords aren't patterns
+        self.assertIsNone(self.keyword_matcher.search('name', end=3))
+        self.assertIsNone(self.keyword_matcher.search('name', end=-1))
+
+    def test_case(self):
+        self.assertTrue(self.keyword_matcher.contains('CODE'))
+        self.assertFalse(KeywordMatcher(['Code']).contains('code'))
+        self.assertTrue(KeywordMatcher(['Code']).contains('Zip Code'))
+
+    def test_find_all(self):
+        self.assertEqual(['quantity', 'name', 'names', 'code'],
+                         self.keyword_matcher.find_all('Quantity of names in the Code, by name'))
+        self.assertEqual([], self.keyword_matcher.find_all('Account'))
+
+    def test_no_keywords(self):
+        keyword_matcher = KeywordMatcher([])
+        self.assertFalse(keyword_matcher.contains('anything'))
+        self.assertEqual([], keyword_matcher.find_all('anything'))
+
+    def test_contains_matches_any(self):
+        words = ['dev', 'test', 'uat', 'prod', 'staging', 'sandbox', 'env', 'de', 'v']
+        keyword_matcher = KeywordMatcher(words, ignore_case=True)
+        value_random = random.Random(0)
+        for _ in range(2000):
+            value = ''.join(value_random.choice(['dev', 'D', 'E', 'v', 'uat', 'prod', ' ', 'x', 'SANDBOX', 'İ'])
+                            for _ in range(value_random.randint(0, 6)))
+            self.assertEqual(any(word in value.lower() for word in words), keyword_matcher.contains(value), value)
+            self.assertEqual(sorted(word for word in set(words) if word in value.lower()),
+                             sorted(keyword_matcher.find_all(value)), value)
+
+    def test_customer_data_matches_list(self):
+        attribute_values = Benchmarks.get_attribute_values(
+            FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE))
+        attribute_values += ['name', 'names', 'namesX', 'Qty:', 'Quantity 1', 'Account', 'code12', '']
+        for attribute_value in attribute_values:
+            if attribute_value is not None:
+                self.assertEqual(
+                    potential_customer_data(attribute_value),
+                    ObjectConsiderations.CheckValuesContainCustomerData._potential_customer_data(attribute_value),
+                    attribute_value)
@@ -0,0 +1,76 @@
+import random
+import warnings
+from unittest import TestCase
+from dateutil.parser import parse as dateparse
+from ...Considerations import ObjectConsiderations
+from .. import FixtureLoader
+from .. import Benchmarks
+
+VALUE_TOKENS = ['10', '2020', '01', '12:30', ':', '-', '/', '.', ',', ' ', 'am', 'PM', 'Jan', 'march', 'Mon', 'of',
+                'st', 'on', 'T', 'h', 'EST', 'UTC', 'Z', 'ABCDEF', 'submit', 'nan', 'inf', 'e', '+', '(', ')', '²',
+                'é', '_']
+"""Pieces of dates, numbers and words, joined at random to make attribute values."""
+
+
+def is_useless_attribute_value_dateutil(attribute_value):
+    """The original is_useless_attribute_value, parsing every value with dateutil."""
+    attribute_value_stripped = ''.join(char for char in attribute_value if char not in '(){}<>,./ ')
+    # Don't care about single characters
+    if len(attribute_value_stripped) <= 1:
+        return True
+    # Value equal to number 0
+    try:
+        if float(attribute_value_stripped) == 0:
+            return True
+    except ValueError:
+        pass
+
+    # Check if value is just a date
+    try:
+        dateparse(attribute_value)
+        return True
+    except ValueError:
+        pass
+
+
+def get_result(classify_function, attribute_value):
+    """Return the result of the function for the value, or the name of the exception it raised."""
+    try:
+        return classify_function(attribute_value)
+    except Exception as exception:
+        return type(exception).__name__
+
+
+class TestIsUselessAttributeValue(TestCase):
+
+    def setUp(self):
+        ObjectConsiderations.is_useless_attribute_value.cache_clear()
+
+    def assert_matches_dateutil(self, attribute_values):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # dateutil warns about timezone names it doesn't know
+            for attribute_value in attribute_values:
+                self.assertEqual(get_result(is_useless_attribute_value_dateutil, attribute_value),
+                                 get_result(ObjectConsiderations.is_useless_attribute_value, attribute_value),
+                                 attribute_value)
+
+    def test_fixture_values_match_dateutil(self):
+        for fixture_name in [FixtureLoader.MERS_FIXTURE, FixtureLoader.MULTI_PROCESS_FIXTURE]:
+            self.assert_matches_dateutil(set(Benchmarks.get_attribute_values(
+                FixtureLoader.fixture_release_xml(fixture_name))))
+
+    def test_generated_values_match_dateutil(self):
+        value_random = random.Random(0)
+        self.assert_matches_dateutil({''.join(value_random.choice(VALUE_TOKENS)
+                                              for _ in range(value_random.randint(1, 5))) for _ in range(3000)})
+
+    def test_could_be_date(self):
+        for attribute_value in ['12/01/2020', 'Monday 3rd of March', '10:30 PM EST', 'January', '2020-01-01T10:00Z']:
+            self.assertTrue(ObjectConsiderations.could_be_date(attribute_value), attribute_value)
+        for attribute_value in ['Submit', 'https://dev.example.com', '10 mins', 'Account Number 1234']:
+            self.assertFalse(ObjectConsiderations.could_be_date(attribute_value), attribute_value)
+
+    def test_results_cached(self):
+        for _ in range(3):
+            ObjectConsiderations.is_useless_attribute_value('12/01/2020')
+        self.assertEqual(2, ObjectConsiderations.is_useless_attribute_value.cache_info().hits)
@@ -0,0 +1,110 @@
+import pickle
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import SoupUtilities
+from ... import Constants
+from ...Considerations.ObjectModel import ObjectModel, ExceptionDetail, INDEXED_STAGE_TYPES
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+
+class TestObjectModel(TestCase):
+    """Each record must hold the same fields as the Object's soup."""
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.sub_soups = SoupUtilities.extract_soups(xml_string)
+        self.objects = self.sub_soups.objects.contents
+        self.xml_objects = SoupUtilities.extract_soups(xml_string, Constants.PARSER_BACKENDS['xml']).objects.contents
+
+    def test_stages(self):
+        for soup_object in self.objects + self.xml_objects:
+            object_model = ObjectModel.from_soup(soup_object)
+            stages = soup_object.find_all('stage', recursive=False)
+            self.assertEqual(len(stages), len(object_model.stages))
+            for stage, model_stage in zip(stages, object_model.stages):
+                self.assertEqual((stage.get('stageid'), stage.get('name'), stage.get('type')),
+                                 (model_stage.stageid, model_stage.name, model_stage.type))
+                self.assertEqual(stage.subsheetid.string if stage.subsheetid else None, model_stage.subsheetid)
+                self.assertEqual(stage.onsuccess.string if stage.onsuccess else None, model_stage.onsuccess)
+                self.assertEqual([(step.action.id.string if step.action else None,
+                                   step.element.get('id') if step.element else None)
+                                  for step in stage.find_all('step', recursive=False)], list(model_stage.steps))
+            self.assertEqual([stage.get('stageid') for stage in soup_object.find_all('stage', type='Navigate')],
+                             [stage.stageid for stage in object_model.get_stages('Navigate')])
+
+    def test_exceptions(self):
+        for soup_object in self.objects + self.xml_objects:
+            object_model = ObjectModel.from_soup(soup_object)
+            exceptions = StageIndex(soup_object).exceptions
+            self.assertEqual([ExceptionDetail(exception.get('type'), exception.get('detail'),
+                                              exception.get('usecurrent')) for exception in exceptions],
+                             [exception for stage, exception in object_model.get_exceptions()])
+            self.assertEqual([exception.parent.get('name') for exception in exceptions],
+                             [stage.name for stage, exception in object_model.get_exceptions()])
+
+    def test_subsheets(self):
+        for soup_object in self.objects + self.xml_objects:
+            object_model = ObjectModel.from_soup(soup_object)
+            action_resolver = StageIndex(soup_object).action_resolver
+            self.assertEqual([subsheet.get('subsheetid') for subsheet in soup_object.find_all('subsheet')],
+                             [subsheet.subsheetid for subsheet in object_model.subsheets])
+            for subsheetid, action_name in action_resolver.items():
+                self.assertEqual(action_name, object_model.get_action_name(subsheetid))
+            self.assertIsNone(object_model.get_action_name('not a subsheetid'))
+
+    def test_app_model(self):
+        for soup_object in self.objects:
+            self.assertEqual(StageIndex(soup_object).app_model.elements,
+                             ObjectModel.from_soup(soup_object).app_model.elements)
+
+    def test_model_pickles_smaller_than_xml(self):
+        for soup_object in self.objects:
+            object_model = pickle.loads(pickle.dumps(ObjectModel.from_soup(soup_object)))
+            self.assertEqual(ObjectModel.from_soup(soup_object).stages, object_model.stages)
+            self.assertLess(len(pickle.dumps(object_model)), len(str(soup_object)))
+
+    def test_model_considerations_free_soup(self):
+        metadata = CodeReview.extract_metadata(self.sub_soups.metadata)
+        object_considerations, _ = CodeReview.get_active_considerations(metadata)
+        review_plan = CodeReview.make_review_plan(object_considerations, metadata)
+        model_plan = review_plan._replace(considerations=[
+            planned for planned in review_plan.considerations if planned.consideration_class.USES_OBJECT_MODEL])
+        self.assertGreater(len(model_plan.considerations), 0)
+
+        for soup_object in list(SoupUtilities.extract_soups(
+                FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)).objects.contents):
+            report_page = CodeReview.make_report_object(soup_object, review_plan, metadata)
+            model_page = CodeReview.make_report_object(soup_object, model_plan, metadata, free_soup=True)
+            self.assertEqual([], soup_object.contents)  # Decomposed once the ObjectModel was read
+            model_considerations = model_page['Report Considerations']
+            self.assertEqual([consideration for consideration in report_page['Report Considerations']
+                              if consideration in model_considerations], model_considerations)
+            self.assertEqual(len(model_plan.considerations), len(model_considerations))
+
+    def test_from_stage_index(self):
+        for soup_object in self.objects + self.xml_objects:
+            object_model = ObjectModel.from_soup(soup_object)
+            indexed_model = ObjectModel.from_stage_index(StageIndex(soup_object))
+            self.assertEqual(tuple(stage for stage in object_model.stages if stage.type in INDEXED_STAGE_TYPES),
+                             indexed_model.stages)
+            self.assertEqual(object_model.subsheets, indexed_model.subsheets)
+            self.assertEqual(object_model.get_exceptions(), indexed_model.get_exceptions())
+            self.assertEqual(object_model.app_model.elements, indexed_model.app_model.elements)
+
+    def test_parallel_workers_given_models(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        metadata = CodeReview.extract_metadata(SoupUtilities.extract_header_soup(xml_string))
+        model_names = [consideration_class.CONSIDERATION_NAME for consideration_class
+                       in CodeReview.get_active_considerations(metadata)[0] if consideration_class.USES_OBJECT_MODEL]
+        metadata['active considerations object'] = [
+            active_object for active_object in metadata['active considerations object']
+            if active_object['Object Considerations'] in model_names]
+
+        with patch.object(CodeReview, 'extract_metadata', return_value=metadata), \
+                patch.object(Constants, 'PARALLEL_MIN_OBJECTS', 1), \
+                patch.object(CodeReview, '_review_object_xml') as review_object_xml:
+            report_pages = CodeReview.review_release_parallel(xml_string, max_workers=2)
+            review_object_xml.assert_not_called()
+            self.assertEqual(CodeReview.review_release(xml_string), report_pages)
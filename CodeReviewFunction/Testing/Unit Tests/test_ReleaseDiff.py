@@ -0,0 +1,89 @@
+import json
+import os
+import re
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import ReleaseDiff
+from .. import FixtureLoader
+
+CHANGED_OBJECT = 'SAM Testing'
+
+
+def change_first_action_stage(xml_string, object_name):
+    """Return the release with the narrative of the first stage on an Action page of the Object changed."""
+    object_start = xml_string.index('<object name="{}"'.format(object_name))
+    stage_match = re.compile(r'<stage [^>]*>((?!</stage>).)*?<subsheetid>', re.DOTALL).search(xml_string, object_start)
+    narrative_start = xml_string.index('<narrative>', stage_match.start()) + len('<narrative>')
+    return xml_string[:narrative_start] + 'Changed since the baseline' + xml_string[narrative_start:]
+
+
+class TestReviewReleaseDiff(TestCase):
+
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.report_pages, self.manifest = CodeReview.review_release_diff(self.xml)
+
+    def test_no_baseline_matches_standard(self):
+        self.assertEqual(CodeReview.review_release(self.xml), self.report_pages)
+        self.assertEqual(['Goldard Test Object', 'Kwik Survey - General', 'SAM Testing'],
+                         list(self.manifest['objects']))
+        json.dumps(self.manifest)  # Must be storable between requests
+
+    def test_unchanged_release_copies_pages(self):
+        with patch.object(CodeReview, 'make_report_object') as make_report_object:
+            report_pages, manifest = CodeReview.review_release_diff(self.xml, self.manifest)
+        make_report_object.assert_not_called()
+        self.assertEqual(self.report_pages, report_pages)
+        self.assertEqual(self.manifest, manifest)
+
+    def test_changed_object_reviewed(self):
+        changed_xml = change_first_action_stage(self.xml, CHANGED_OBJECT)
+        with patch.object(CodeReview, 'make_report_object', wraps=CodeReview.make_report_object) as make_report_object:
+            report_pages, manifest = CodeReview.review_release_diff(changed_xml, self.manifest)
+        self.assertEqual([CHANGED_OBJECT], [call[0][0].get('name') for call in make_report_object.call_args_list])
+        self.assertEqual(CodeReview.review_release(changed_xml), report_pages)
+        self.assertNotEqual(self.manifest['objects'][CHANGED_OBJECT]['Fingerprint'],
+                            manifest['objects'][CHANGED_OBJECT]['Fingerprint'])
+
+    def test_changed_actions(self):
+        release_diff = ReleaseDiff.ReleaseDiff(self.manifest)
+        baseline_actions = self.manifest['objects'][CHANGED_OBJECT]['Actions']
+        with patch.object(ReleaseDiff, 'ReleaseDiff', return_value=release_diff):
+            CodeReview.review_release_diff(change_first_action_stage(self.xml, CHANGED_OBJECT), self.manifest)
+        self.assertEqual([CHANGED_OBJECT], release_diff.changed_items)
+        self.assertEqual(1, len(release_diff.changed_actions[CHANGED_OBJECT]))
+        self.assertIn(release_diff.changed_actions[CHANGED_OBJECT][0], baseline_actions)
+
+    def test_changed_config_reviews_everything(self):
+        changed_manifest = json.loads(json.dumps(self.manifest))
+        for item in changed_manifest['objects'].values():
+            item['Fingerprint'] = 'fingerprint from an older version of the considerations'
+        with patch.object(CodeReview, 'make_report_object', wraps=CodeReview.make_report_object) as make_report_object:
+            CodeReview.review_release_diff(self.xml, changed_manifest)
+        self.assertEqual(3, make_report_object.call_count)
+
+
+class TestManifestStore(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        manifest = {'Manifest Version': ReleaseDiff.MANIFEST_VERSION, 'objects': {}, 'processes': {}}
+        ReleaseDiff.save_manifest('Release v2.0 main', manifest, self.temp_dir.name)
+        self.assertEqual(manifest, ReleaseDiff.load_manifest('Release v2.0 main', self.temp_dir.name))
+        self.assertIsNone(ReleaseDiff.load_manifest('Release v2.1', self.temp_dir.name))
+
+    def test_invalid_release_names(self):
+        manifest = {'Manifest Version': ReleaseDiff.MANIFEST_VERSION, 'objects': {}, 'processes': {}}
+        for release_name in ['../Release', 'Release/main', '..', '.hidden', '', 'C:\\Release']:
+            self.assertFalse(ReleaseDiff.is_valid_release_name(release_name))
+            with self.assertRaises(ValueError):
+                ReleaseDiff.save_manifest(release_name, manifest, self.temp_dir.name)
+            self.assertIsNone(ReleaseDiff.load_manifest(release_name, self.temp_dir.name))
+        self.assertEqual([], os.listdir(self.temp_dir.name))
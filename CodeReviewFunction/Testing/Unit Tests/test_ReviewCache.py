@@ -0,0 +1,120 @@
+import copy
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import Constants
+from ... import ReviewCache
+from ... import SoupUtilities
+from .. import FixtureLoader
+
+REPORT_PAGE = {'Page Name': 'Test Object', 'Page Type': 'Object', 'Considerations': [{'Score': 10}]}
+
+
+class TestReviewCache(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, 'review cache')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_returns_copy(self):
+        review_cache = ReviewCache.ReviewCache()
+        self.assertIsNone(review_cache.get('key'))
+        review_cache.set('key', REPORT_PAGE)
+        report_page = review_cache.get('key')
+        self.assertEqual(REPORT_PAGE, report_page)
+        report_page['Considerations'].clear()
+        self.assertEqual(REPORT_PAGE, review_cache.get('key'))
+
+    def test_memory_lru_eviction(self):
+        review_cache = ReviewCache.ReviewCache(max_pages=2)
+        review_cache.set('first', REPORT_PAGE)
+        review_cache.set('second', REPORT_PAGE)
+        review_cache.get('first')  # Now more recently used than 'second'
+        review_cache.set('third', REPORT_PAGE)
+        self.assertIsNotNone(review_cache.get('first'))
+        self.assertIsNone(review_cache.get('second'))
+        self.assertIsNotNone(review_cache.get('third'))
+
+    def test_disk_tier_shared_between_caches(self):
+        ReviewCache.ReviewCache(directory=self.directory).set('key', REPORT_PAGE)
+        self.assertEqual(REPORT_PAGE, ReviewCache.ReviewCache(directory=self.directory).get('key'))
+        self.assertIsNone(ReviewCache.ReviewCache().get('key'))
+
+    def test_disk_size_eviction(self):
+        page_bytes = len(ReviewCache.json.dumps(REPORT_PAGE))
+        review_cache = ReviewCache.ReviewCache(max_pages=1, directory=self.directory, max_disk_bytes=page_bytes * 2)
+        for last_used_time, cache_key in enumerate(['first', 'second']):
+            review_cache.set(cache_key, REPORT_PAGE)
+            os.utime(os.path.join(self.directory, cache_key + '.json'), (last_used_time, last_used_time))
+        review_cache.set('third', REPORT_PAGE)
+        self.assertEqual(['second.json', 'third.json'], sorted(os.listdir(self.directory)))
+        self.assertIsNone(review_cache.get('first'))
+
+    def test_overwritten_page_counted_once(self):
+        page_bytes = len(ReviewCache.json.dumps(REPORT_PAGE))
+        review_cache = ReviewCache.ReviewCache(directory=self.directory)
+        for _ in range(3):
+            review_cache.set('key', REPORT_PAGE)
+        self.assertEqual(page_bytes, review_cache._disk_bytes)
+
+
+class TestMakeCacheKey(TestCase):
+
+    def setUp(self):
+        self.metadata = {'active considerations object': [{'Object Considerations': 'Test', 'Active': True,
+                                                           'Force Result': '', 'Score Scale': ''}],
+                         'blacklist': [], 'additional info': {'Delivery Stage': 'Production'}, 'settings': []}
+        self.cache_key = ReviewCache.make_cache_key('<process name="Test Object"/>', self.metadata)
+
+    def test_same_review_same_key(self):
+        self.assertEqual(self.cache_key,
+                         ReviewCache.make_cache_key('<process name="Test Object"/>', copy.deepcopy(self.metadata)))
+
+    def test_key_changes(self):
+        self.assertNotEqual(self.cache_key, ReviewCache.make_cache_key('<process name="Changed"/>', self.metadata))
+
+        self.metadata['active considerations object'][0]['Force Result'] = 'Yes'
+        self.assertNotEqual(self.cache_key, ReviewCache.make_cache_key('<process name="Test Object"/>', self.metadata))
+
+        with patch.object(Constants, 'REVIEW_CACHE_VERSION', Constants.REVIEW_CACHE_VERSION + 1):
+            self.assertNotEqual(self.cache_key,
+                                ReviewCache.make_cache_key('<process name="Test Object"/>', self.metadata))
+
+
+class TestCachedReview(TestCase):
+
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def test_cached_review_matches_uncached(self):
+        report_pages = CodeReview.review_release(self.xml)
+        # The streaming parser normalises whitespace in attribute values, so it gives Objects different keys
+        for review_function in [CodeReview.review_release, CodeReview.review_release_streaming]:
+            review_cache = ReviewCache.ReviewCache()
+            self.assertEqual(report_pages, review_function(self.xml, review_cache=review_cache))
+            with patch.object(CodeReview, 'StageIndex') as stage_index:
+                self.assertEqual(report_pages, review_function(self.xml, review_cache=review_cache))
+            stage_index.assert_not_called()  # Every Object page came from the cache
+
+    def test_parallel_review_uses_cache(self):
+        review_cache = ReviewCache.ReviewCache()
+        report_pages = CodeReview.review_release(self.xml, review_cache=review_cache)
+        with patch.object(Constants, 'PARALLEL_MIN_OBJECTS', 1), \
+                patch.object(CodeReview, 'ProcessPoolExecutor') as process_pool:
+            self.assertEqual(report_pages, CodeReview.review_release_parallel(self.xml, max_workers=2,
+                                                                              review_cache=review_cache))
+        process_pool.assert_not_called()
+
+    def test_changed_object_reviewed(self):
+        review_cache = ReviewCache.ReviewCache()
+        CodeReview.review_release(self.xml, review_cache=review_cache)
+        sub_soups = SoupUtilities.extract_soups(self.xml)
+        metadata = CodeReview.extract_metadata(sub_soups.metadata)
+        metadata['active considerations object'][0]['Force Result'] = 'No'
+        object_tag = sub_soups.objects.contents[0]
+        self.assertIsNone(review_cache.get(ReviewCache.make_cache_key(str(object_tag), metadata)))
@@ -0,0 +1,46 @@
+import copy
+from unittest import TestCase
+from ... import CodeReview
+from ... import SoupUtilities
+from ... import Constants
+from ...Considerations.ReviewContext import ReviewContext
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+
+class TestReviewContext(TestCase):
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.sub_soups = SoupUtilities.extract_soups(xml_string)
+        self.metadata = CodeReview.extract_metadata(self.sub_soups.metadata)
+        self.soup_object = self.sub_soups.objects.contents[0]
+        self.context = ReviewContext.create(self.soup_object.get('name'), Constants.OBJECT_TYPES['base'], False,
+                                            StageIndex(self.soup_object), self.metadata)
+
+    def test_context_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.context.object_type = Constants.OBJECT_TYPES['wrapper']
+        with self.assertRaises(AttributeError):
+            self.context.new_field = True
+
+    def test_metadata_read_only(self):
+        with self.assertRaises(TypeError):
+            self.context.metadata['object type'] = Constants.OBJECT_TYPES['wrapper']
+        with self.assertRaises(TypeError):
+            self.context.metadata['additional info']['Delivery Stage'] = 'Production'
+        with self.assertRaises(AttributeError):
+            self.context.metadata['blacklist'].append('new object')
+
+    def test_metadata_copied(self):
+        self.assertEqual(self.metadata['additional info'], dict(self.context.metadata['additional info']))
+        self.metadata['additional info']['Delivery Stage'] = 'Changed After Create'
+        self.assertNotEqual('Changed After Create', self.context.metadata['additional info']['Delivery Stage'])
+
+    def test_make_report_object_leaves_metadata_unchanged(self):
+        object_considerations, process_considerations = CodeReview.get_active_considerations(self.metadata)
+        review_plan = CodeReview.make_review_plan(object_considerations, self.metadata)
+        original_metadata = copy.deepcopy(self.metadata)
+        for soup_object in self.sub_soups.objects.contents:
+            CodeReview.make_report_object(soup_object, review_plan, self.metadata)
+        self.assertEqual(original_metadata, self.metadata)
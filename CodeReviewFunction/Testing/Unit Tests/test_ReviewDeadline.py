@@ -0,0 +1,105 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import Constants
+from ... import ReviewCache
+from ... import ReviewDeadline
+from ...ReportPage import Result
+from .. import FixtureLoader
+
+
+class CountdownDeadline(ReviewDeadline.ReviewDeadline):
+    """A deadline that passes after it has been checked a set number of times, rather than after a set time."""
+
+    def __init__(self, checks_left):
+        super().__init__()
+        self.checks_left = checks_left
+
+    def expired(self) -> bool:
+        self.checks_left -= 1
+        return self.checks_left < 0
+
+
+def get_coverage_setting(report_pages) -> dict:
+    return report_pages[-1]['Report Considerations'][-1]
+
+
+def is_blacklisted_page(report_page) -> bool:
+    return report_page['Object Type'] == Constants.BLACKLISTED_OBJECT_TYPE
+
+
+class TestReviewDeadline(TestCase):
+
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.report_pages = CodeReview.review_release(self.xml)
+
+    def test_deadline_not_reached_matches_standard(self):
+        review_deadline = ReviewDeadline.ReviewDeadline(3600)
+        report_pages = CodeReview.review_release(self.xml, review_deadline=review_deadline)
+        self.assertFalse(review_deadline.expired())
+        self.assertGreater(review_deadline.remaining(), 0)
+
+        coverage_setting = get_coverage_setting(report_pages)
+        self.assertEqual(ReviewDeadline.COVERAGE_SETTING_NAME, coverage_setting['Settings'])
+        self.assertFalse(coverage_setting['Timed Out'])
+        self.assertEqual(len(self.report_pages) - 1, coverage_setting['Pages Reviewed'])
+        report_pages[-1]['Report Considerations'].pop()
+        self.assertEqual(self.report_pages, report_pages)
+
+    def test_expired_deadline_evaluates_nothing(self):
+        review_deadline = ReviewDeadline.ReviewDeadline(0)
+        self.assertEqual(0, review_deadline.remaining())
+        report_pages = CodeReview.review_release(self.xml, review_deadline=review_deadline)
+
+        self.assertEqual([(report_page['Report Page Name'], report_page['Page Type'])
+                          for report_page in self.report_pages],
+                         [(report_page['Report Page Name'], report_page['Page Type']) for report_page in report_pages])
+        blacklisted_pages = [report_page for report_page in report_pages[:-1] if is_blacklisted_page(report_page)]
+        self.assertGreater(len(blacklisted_pages), 0)  # Blacklisted Objects are never reviewed, so aren't cut short
+        for report_page in report_pages[:-1]:
+            if not is_blacklisted_page(report_page):
+                self.assertEqual(Constants.NOT_EVALUATED_TYPE, report_page['Object Type'])
+            self.assertEqual([], report_page['Report Considerations'])
+        coverage_setting = get_coverage_setting(report_pages)
+        self.assertTrue(coverage_setting['Timed Out'])
+        self.assertEqual((len(blacklisted_pages), 0, len(report_pages) - 1 - len(blacklisted_pages)),
+                         (coverage_setting['Pages Reviewed'], coverage_setting['Pages Partially Reviewed'],
+                          coverage_setting['Pages Not Evaluated']))
+
+    def test_deadline_during_object(self):
+        index = next(index for index, report_page in enumerate(self.report_pages)
+                     if not is_blacklisted_page(report_page))
+        first_object = self.report_pages[index]
+        checks_left = len(first_object['Report Considerations']) // 2
+        report_pages = CodeReview.review_release(self.xml, review_deadline=CountdownDeadline(checks_left + 1))
+
+        results = [consideration['Result'] for consideration in report_pages[index]['Report Considerations']]
+        self.assertEqual(first_object['Object Type'], report_pages[index]['Object Type'])
+        self.assertEqual(len(first_object['Report Considerations']), len(results))
+        self.assertNotIn(Result.NOT_EVALUATED, results[:checks_left])
+        self.assertIn(Result.NOT_EVALUATED, results[checks_left:])
+        self.assertEqual(Constants.NOT_EVALUATED_TYPE, report_pages[index + 1]['Object Type'])
+        self.assertEqual(1, get_coverage_setting(report_pages)['Pages Partially Reviewed'])
+
+    def test_modes_match_standard(self):
+        report_pages = CodeReview.review_release(self.xml, review_deadline=ReviewDeadline.ReviewDeadline(0))
+        self.assertEqual(report_pages, CodeReview.review_release_streaming(
+            self.xml, review_deadline=ReviewDeadline.ReviewDeadline(0)))
+        self.assertEqual(report_pages, CodeReview.review_release_diff(
+            self.xml, review_deadline=ReviewDeadline.ReviewDeadline(0))[0])
+        with patch.object(Constants, 'PARALLEL_MIN_OBJECTS', 1):
+            self.assertEqual(report_pages, CodeReview.review_release_parallel(
+                self.xml, max_workers=2, review_deadline=ReviewDeadline.ReviewDeadline(0)))
+
+    def test_cut_short_pages_not_kept(self):
+        with tempfile.TemporaryDirectory() as directory:
+            review_cache = ReviewCache.ReviewCache(directory=directory)
+            CodeReview.review_release(self.xml, review_cache=review_cache, review_deadline=CountdownDeadline(1))
+            self.assertEqual(0, len(review_cache._get_disk_entries()))
+
+        report_pages, manifest = CodeReview.review_release_diff(self.xml, review_deadline=CountdownDeadline(1))
+        self.assertEqual([report_page['Report Page Name'] for report_page in report_pages
+                          if is_blacklisted_page(report_page)], list(manifest['objects']))
+        self.assertEqual(self.report_pages, CodeReview.review_release_diff(self.xml, manifest)[0])
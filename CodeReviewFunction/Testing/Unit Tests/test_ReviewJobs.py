@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import azure.functions as func
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import Constants
+from ... import ReviewJobs
+from .. import FixtureLoader
+
+
+class TestReviewJobs(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.job_queue = ReviewJobs.SqliteJobQueue(os.path.join(self.directory.name, 'jobs.sqlite3'))
+        self.blob_store = ReviewJobs.LocalBlobStore(self.directory.name)
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_submit_run_fetch(self):
+        job = ReviewJobs.submit_job(self.xml, {'mode': Constants.REVIEW_MODES['streaming']}, self.job_queue,
+                                    self.blob_store)
+        self.assertEqual(job, self.job_queue.get_job(job.job_id))
+        self.assertEqual(ReviewJobs.JOB_STATUSES['queued'], job.status)
+
+        with patch.object(CodeReview.ReviewCache, 'get_shared_cache', return_value=None):
+            finished_job = ReviewJobs.run_next_job(self.job_queue, self.blob_store, CodeReview.review_job_release)
+        self.assertEqual(ReviewJobs.JOB_STATUSES['complete'], finished_job.status)
+        self.assertIsNone(self.blob_store.get(ReviewJobs.get_release_blob_name(job.job_id)))
+        report_json = self.blob_store.get(ReviewJobs.get_report_blob_name(job.job_id))
+        self.assertEqual(json.loads(json.dumps(CodeReview.review_release(self.xml))), json.loads(report_json))
+        self.assertIsNone(ReviewJobs.run_next_job(self.job_queue, self.blob_store, CodeReview.review_job_release))
+
+    def test_jobs_claimed_once_in_order(self):
+        job_ids = [ReviewJobs.submit_job(self.xml, {}, self.job_queue, self.blob_store).job_id for _ in range(3)]
+        other_queue = ReviewJobs.SqliteJobQueue(self.job_queue.database_path)
+        claimed_ids = [self.job_queue.claim().job_id, other_queue.claim().job_id, self.job_queue.claim().job_id]
+        self.assertEqual(job_ids, claimed_ids)
+        self.assertIsNone(other_queue.claim())
+        self.assertEqual(ReviewJobs.JOB_STATUSES['running'], self.job_queue.get_job(job_ids[0]).status)
+
+    def test_failed_job(self):
+        job = ReviewJobs.submit_job('<not a release/>', {}, self.job_queue, self.blob_store)
+        finished_job = ReviewJobs.run_next_job(self.job_queue, self.blob_store, CodeReview.review_job_release)
+        self.assertEqual(ReviewJobs.JOB_STATUSES['failed'], finished_job.status)
+        self.assertTrue(finished_job.error)
+        self.assertIsNone(self.blob_store.get(ReviewJobs.get_report_blob_name(job.job_id)))
+
+    def test_expired_job(self):
+        job = ReviewJobs.submit_job(self.xml, {}, self.job_queue, self.blob_store)
+        self.job_queue.claim()
+        self.job_queue.expire()
+        self.assertEqual(ReviewJobs.JOB_STATUSES['running'], self.job_queue.get_job(job.job_id).status)
+
+        expired_queue = ReviewJobs.SqliteJobQueue(self.job_queue.database_path, lease_seconds=-1)
+        self.assertIsNone(ReviewJobs.run_next_job(expired_queue, self.blob_store, CodeReview.review_job_release))
+        expired_job = self.job_queue.get_job(job.job_id)
+        self.assertEqual(ReviewJobs.JOB_STATUSES['failed'], expired_job.status)
+        self.assertEqual(ReviewJobs.JOB_EXPIRED_ERROR, expired_job.error)
+
+    def test_prune_jobs(self):
+        finished_job = ReviewJobs.submit_job('<not a release/>', {}, self.job_queue, self.blob_store)
+        ReviewJobs.run_next_job(self.job_queue, self.blob_store, CodeReview.review_job_release)
+        self.blob_store.put(ReviewJobs.get_report_blob_name(finished_job.job_id), b'[]')
+        queued_job = ReviewJobs.submit_job(self.xml, {}, self.job_queue, self.blob_store)
+
+        self.assertEqual([], ReviewJobs.prune_jobs(self.job_queue, self.blob_store))
+        self.assertEqual([finished_job.job_id], ReviewJobs.prune_jobs(self.job_queue, self.blob_store, -1))
+        self.assertIsNone(self.job_queue.get_job(finished_job.job_id))
+        self.assertIsNone(self.blob_store.get(ReviewJobs.get_report_blob_name(finished_job.job_id)))
+        self.assertEqual(queued_job, self.job_queue.get_job(queued_job.job_id))
+        self.assertIsNotNone(self.blob_store.get(ReviewJobs.get_release_blob_name(queued_job.job_id)))
+
+    def test_worker_thread(self):
+        job = ReviewJobs.submit_job(self.xml, {}, self.job_queue, self.blob_store)
+        ReviewJobs.start_worker(self.job_queue, self.blob_store, CodeReview.review_job_release).join()
+        self.assertEqual(ReviewJobs.JOB_STATUSES['complete'], self.job_queue.get_job(job.job_id).status)
+
+    def test_main_job_requests(self):
+        with patch.object(ReviewJobs, '_job_queue', self.job_queue), \
+                patch.object(ReviewJobs, '_blob_store', self.blob_store), \
+                patch.object(Constants, 'JOB_WORKER_THREAD', False):
+            response = CodeReview.main(func.HttpRequest(method='POST', body=self.xml.encode('utf-8'), url='/api',
+                                                        params={'job': 'submit', 'mode': 'parallel'}))
+            self.assertEqual(202, response.status_code)
+            job_id = json.loads(response.get_body())['Job Id']
+            self.assertEqual({'mode': 'parallel'}, self.job_queue.get_job(job_id).params)
+
+            status_request = func.HttpRequest(method='GET', body=b'', url='/api',
+                                              params={'job': 'status', 'id': job_id})
+            report_request = func.HttpRequest(method='GET', body=b'', url='/api',
+                                              params={'job': 'report', 'id': job_id})
+            self.assertEqual('Queued', json.loads(CodeReview.main(status_request).get_body())['Status'])
+            self.assertEqual(409, CodeReview.main(report_request).status_code)
+
+            ReviewJobs.run_next_job(self.job_queue, self.blob_store, CodeReview.review_job_release)
+            self.assertEqual('Complete', json.loads(CodeReview.main(status_request).get_body())['Status'])
+            response = CodeReview.main(report_request)
+            self.assertEqual(200, response.status_code)
+            self.assertEqual('Settings', json.loads(response.get_body())[-1]['Page Type'])
+
+            unknown_request = func.HttpRequest(method='GET', body=b'', url='/api', params={'job': 'status', 'id': 'x'})
+            self.assertEqual(404, CodeReview.main(unknown_request).status_code)
+
+            submit_request = func.HttpRequest(method='POST', body=b'', url='/api', params={'job': 'submit'})
+            with patch.object(func.HttpRequest, 'get_body', side_effect=ValueError):
+                self.assertEqual(400, CodeReview.main(submit_request).status_code)
@@ -1,5 +1,8 @@
 from unittest import TestCase
+from ... import CodeReview
+from ... import Constants
 from ... import SoupUtilities
+from .. import FixtureLoader
 from bs4 import BeautifulSoup
 import pickle
 
@@ -21,6 +24,101 @@ class TestExtract_soups(TestCase):
         sub_soups = SoupUtilities.extract_soups(xml_string)
         self.assertTrue(len(sub_soups.processes.contents) == 0)
 
+
+class TestExtract_soups_single_pass(TestCase):
+    """The single pass splitter must build the same Sub_Soup as parsing the release once per section."""
+    STRAINERS = ['process', 'object', 'work-queue', 'header']
+
+    def assert_matches_per_section_extract(self, xml_string):
+        sub_soups = SoupUtilities.extract_soups(xml_string)
+        for strainer, sub_soup in zip(self.STRAINERS, sub_soups):
+            expected_soup = SoupUtilities._extract_single_soup(strainer, xml_string)
+            self.assertEqual(len(expected_soup.contents), len(sub_soup.contents))
+            self.assertEqual(str(expected_soup), str(sub_soup))
+
+    def test_mers_fixture(self):
+        self.assert_matches_per_section_extract(FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE))
+
+    def test_multi_process_fixture(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.assert_matches_per_section_extract(xml_string)
+
+    def test_sections(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        sub_soups = SoupUtilities.extract_soups(xml_string)
+        self.assertEqual(['Create Reports', 'SAM Reviewer'], [tag.get('name') for tag in sub_soups.processes])
+        self.assertEqual(['Goldard Test Object', 'Kwik Survey - General', 'SAM Testing'],
+                         [tag.get('name') for tag in sub_soups.objects])
+        self.assertEqual(['Report Administration'], [tag.get('name') for tag in sub_soups.queues])
+        self.assertTrue(sub_soups.metadata.contents[0].name == 'header')
+
+    def test_empty_release(self):
+        sub_soups = SoupUtilities.extract_soups('')
+        self.assertTrue(all(len(sub_soup.contents) == 0 for sub_soup in sub_soups))
+
+
+class TestSkip_blacklisted_objects(TestCase):
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def test_blacklisted_object_emptied(self):
+        skipped_xml, skipped_names = SoupUtilities.skip_blacklisted_objects(self.xml, lambda name: 'Kwik' in name)
+        self.assertEqual(['Kwik Survey - General'], skipped_names)
+        self.assertIsInstance(skipped_xml, str)
+        sub_soups = SoupUtilities.extract_soups(skipped_xml)
+        self.assertEqual(['Goldard Test Object', 'Kwik Survey - General', 'SAM Testing'],
+                         [tag.get('name') for tag in sub_soups.objects])
+        self.assertEqual([], sub_soups.objects.contents[1].contents)
+        self.assertEqual(str(SoupUtilities.extract_soups(self.xml).objects.contents[2]),
+                         str(sub_soups.objects.contents[2]))
+        self.assertEqual(str(SoupUtilities.extract_soups(self.xml).metadata), str(sub_soups.metadata))
+
+    def test_nothing_blacklisted(self):
+        self.assertIs(self.xml, SoupUtilities.skip_blacklisted_objects(self.xml, lambda name: False)[0])
+        xml_bytes = self.xml.encode()
+        self.assertEqual((xml_bytes, []), SoupUtilities.skip_blacklisted_objects(xml_bytes, lambda name: False))
+
+    def test_processes_not_skipped(self):
+        skipped_xml, skipped_names = SoupUtilities.skip_blacklisted_objects(self.xml, lambda name: True)
+        self.assertEqual(['Goldard Test Object', 'Kwik Survey - General', 'SAM Testing'], skipped_names)
+        self.assertEqual(str(SoupUtilities.extract_soups(self.xml).processes),
+                         str(SoupUtilities.extract_soups(skipped_xml).processes))
+
+
+class TestIter_release_soups(TestCase):
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def test_yields_objects_and_processes(self):
+        sections = [(section, tag.get('name')) for section, tag in SoupUtilities.iter_release_soups(self.xml)]
+        self.assertEqual([('processes', 'Create Reports'), ('processes', 'SAM Reviewer'),
+                          ('objects', 'Goldard Test Object'), ('objects', 'Kwik Survey - General'),
+                          ('objects', 'SAM Testing')], sections)
+
+    def test_object_matches_extract_soups(self):
+        sub_soups = SoupUtilities.extract_soups(self.xml)
+        streamed_objects = [tag for section, tag in SoupUtilities.iter_release_soups(self.xml.encode())
+                            if section == 'objects']
+        for object_tag, streamed_tag in zip(sub_soups.objects.contents, streamed_objects):
+            self.assertEqual(sorted(object_tag.attrs), sorted(streamed_tag.attrs))
+            self.assertEqual(len(object_tag.find_all('stage', recursive=False)),
+                             len(streamed_tag.find_all('stage', recursive=False)))
+            self.assertEqual(len(object_tag.find_all(True)), len(streamed_tag.find_all(True)))
+
+    def test_leading_comment(self):
+        header_end = self.xml.index('?>') + 2 if self.xml.startswith('<?xml') else 0
+        commented_xml = self.xml[:header_end] + '<!-- exported -->' + self.xml[header_end:]
+        self.assertEqual(5, len(list(SoupUtilities.iter_release_elements(commented_xml))))
+        report_pages = CodeReview.review_release(self.xml)
+        for parser_backend in Constants.PARSER_BACKENDS.values():
+            self.assertEqual(report_pages, list(CodeReview.review_release_streaming(commented_xml, parser_backend)))
+        self.assertEqual(report_pages, CodeReview.review_release_diff(commented_xml)[0])
+
+    def test_extract_header_soup(self):
+        sub_soups = SoupUtilities.extract_soups(self.xml)
+        self.assertEqual(str(sub_soups.metadata), str(SoupUtilities.extract_header_soup(self.xml)))
+
+
 class TestDetermine_object_type(TestCase):
 
     def setUp(self):
@@ -0,0 +1,64 @@
+from unittest import TestCase
+from ... import SoupUtilities
+from ... import Constants
+from ...Considerations.StageIndex import StageIndex
+from .. import FixtureLoader
+
+
+class TestStageIndex(TestCase):
+    """Each lookup must give the same stages as searching the Object's soup directly."""
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.objects = SoupUtilities.extract_soups(xml_string).objects.contents
+        self.xml_objects = SoupUtilities.extract_soups(xml_string, Constants.PARSER_BACKENDS['xml']).objects.contents
+
+    def test_stages_by_type(self):
+        for soup_object in self.objects + self.xml_objects:
+            stage_index = StageIndex(soup_object)
+            for stage_type in ['Start', 'End', 'Navigate', 'WaitStart', 'Data', 'Exception']:
+                self.assertEqual(soup_object.find_all('stage', type=stage_type, recursive=False),
+                                 stage_index.get_stages(stage_type))
+            self.assertEqual([], stage_index.get_stages('Not A Stage Type'))
+
+    def test_get_stage(self):
+        for soup_object in self.objects:
+            stage_index = StageIndex(soup_object)
+            for stage in soup_object.find_all('stage', recursive=False):
+                self.assertIs(stage, stage_index.get_stage(stage.get('stageid')))
+            self.assertIsNone(stage_index.get_stage('not a stageid'))
+
+    def test_subsheet_stages(self):
+        for soup_object in self.objects:
+            stage_index = StageIndex(soup_object)
+            self.assertEqual(len(stage_index.stages),
+                             sum(len(stages) for stages in stage_index.stages_by_subsheetid.values()))
+            for subsheetid, action_name in stage_index.action_resolver.items():
+                for stage in stage_index.get_subsheet_stages(subsheetid):
+                    self.assertEqual(subsheetid, stage.subsheetid.string)
+            for stage in stage_index.get_subsheet_stages(None):
+                self.assertIsNone(stage.subsheetid)
+
+    def test_action_resolver(self):
+        for soup_object in self.objects:
+            stage_index = StageIndex(soup_object)
+            self.assertEqual([subsheet.next_element.string for subsheet in soup_object.find_all('subsheet')],
+                             [action_name for subsheetid, action_name in stage_index.action_resolver.items()])
+
+    def test_exceptions(self):
+        for soup_object in self.objects:
+            self.assertEqual(soup_object.find_all('exception'), StageIndex(soup_object).exceptions)
+
+    def test_data_items(self):
+        for soup_object in self.objects + self.xml_objects:
+            stage_index = StageIndex(soup_object)
+            data_stages = soup_object.find_all('stage', type='Data', recursive=False)
+            self.assertEqual(len({data_stage.get('name') for data_stage in data_stages}), len(stage_index.data_items))
+            for data_stage in data_stages:
+                # The first Data item with a name is the one looked up, as with a search of the soup
+                first_stage = soup_object.find('stage', {'name': data_stage.get('name')}, type='Data', recursive=False)
+                data_item = stage_index.data_items.get(data_stage.get('name'))
+                for tag_name in ['datatype', 'initialvalue', 'exposure']:
+                    tag = first_stage.find(tag_name)
+                    self.assertEqual(tag.string if tag else None, getattr(data_item, tag_name))
+            self.assertIsNone(stage_index.data_items.get('Not A Data Item'))
@@ -0,0 +1,118 @@
+import copy
+from unittest import TestCase
+from unittest.mock import patch
+from ... import CodeReview
+from ... import SoupUtilities
+from ... import Constants
+from ...Considerations import ObjectConsiderations
+from ...Considerations.ReviewContext import ReviewContext
+from ...Considerations.StageIndex import StageIndex
+from ...Considerations.StageTable import StageTable, LOGGING_MODES, MAX_CODES
+from .. import FixtureLoader
+
+NO_LOGGING_TYPES = ['SubSheetInfo', 'ProcessInfo', 'Note', 'Data', 'Collection', 'Block', 'Anchor']
+ALLOWED_LOGGING_STAGE_TYPES = ['Exception', 'Calculation', 'Decision']
+
+
+def get_stage_logging(stage) -> int:
+    """The logging mode of a stage, read from its soup."""
+    if stage.loginhibit:
+        return LOGGING_MODES['errors only'] if stage.loginhibit.get('onsuccess') else LOGGING_MODES['disabled']
+    return LOGGING_MODES['enabled']
+
+
+def find_logging_errors(stages, policy_logging_mode) -> list:
+    """The (stage name, stage type is allowed) of each stage the logging check reports, walking the stages' soup."""
+    logging_errors = []
+    for stage in stages:
+        stage_type = stage.get('type')
+        if stage_type not in NO_LOGGING_TYPES and stage.subsheetid:
+            stage_logging_mode = get_stage_logging(stage)
+            if stage_type not in ALLOWED_LOGGING_STAGE_TYPES:
+                if stage_logging_mode > policy_logging_mode:
+                    logging_errors.append((stage.get('name'), False))
+            elif stage_logging_mode > LOGGING_MODES['errors only']:
+                logging_errors.append((stage.get('name'), True))
+    return logging_errors
+
+
+class TestStageTable(TestCase):
+    """Each column and query must give the same stages as walking the Object's soup."""
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.sub_soups = SoupUtilities.extract_soups(xml_string)
+        self.objects = self.sub_soups.objects.contents
+        self.xml_objects = SoupUtilities.extract_soups(xml_string, Constants.PARSER_BACKENDS['xml']).objects.contents
+
+    def test_columns(self):
+        for soup_object in self.objects + self.xml_objects:
+            stage_index = StageIndex(soup_object)
+            stage_table = stage_index.stage_table
+            self.assertEqual(len(stage_index.stages), len(stage_table))
+            for row, stage in enumerate(stage_index.stages):
+                self.assertEqual(stage.get('type'), stage_table.get_type(row))
+                self.assertEqual(stage.get('name'), stage_table.names[row])
+                self.assertEqual(stage.subsheetid.string if stage.subsheetid else None,
+                                 stage_table.get_subsheetid(row))
+                self.assertEqual(get_stage_logging(stage), stage_table.logging_modes[row])
+
+    def test_masks(self):
+        for soup_object in self.objects + self.xml_objects:
+            stage_index = StageIndex(soup_object)
+            stage_table = stage_index.stage_table
+            data_or_notes = stage_table.type_mask(['Data', 'Note', 'Not A Stage Type'])
+            self.assertEqual([stage for stage in stage_index.stages if stage.get('type') in ['Data', 'Note']],
+                             [stage_index.stages[row] for row in stage_table.rows(data_or_notes)])
+            not_data_or_notes = stage_table.mask_not(data_or_notes)
+            self.assertEqual(b'\x00' * len(stage_table), stage_table.mask_and(data_or_notes, not_data_or_notes))
+            self.assertEqual(b'\x01' * len(stage_table), stage_table.mask_or(data_or_notes, not_data_or_notes))
+            self.assertEqual([row for row in range(len(stage_table))
+                              if stage_table.logging_modes[row] > LOGGING_MODES['disabled']],
+                             stage_table.rows(stage_table.logging_mask(LOGGING_MODES['disabled'])))
+
+    def test_count_by_page(self):
+        for soup_object in self.objects:
+            stage_index = StageIndex(soup_object)
+            stage_table = stage_index.stage_table
+            stage_counts = stage_table.count_by_page(stage_table.mask_not(stage_table.type_mask(['Data', 'Block'])))
+            for subsheetid in stage_index.stages_by_subsheetid:
+                self.assertEqual(len([stage for stage in stage_index.get_subsheet_stages(subsheetid)
+                                      if stage.get('type') not in ('Data', 'Block')]), stage_counts.get(subsheetid, 0))
+
+    def test_more_stage_types_than_codes(self):
+        stages = []
+        for code in range(MAX_CODES + 10):
+            stage = copy.copy(StageIndex(self.objects[1]).stages[0])
+            stage['type'] = 'Type {}'.format(code)
+            stages.append(stage)
+        stage_table = StageTable(stages)
+        self.assertEqual('Type {}'.format(MAX_CODES + 5), stage_table.get_type(MAX_CODES + 5))
+        self.assertEqual([1, MAX_CODES + 1], stage_table.rows(stage_table.type_mask(
+            ['Type 1', 'Type {}'.format(MAX_CODES + 1), 'Not A Stage Type'])))
+
+    def test_empty_table(self):
+        stage_table = StageTable([])
+        self.assertEqual([], stage_table.rows(stage_table.mask_and(stage_table.type_mask(['Data']),
+                                                                   stage_table.page_mask())))
+        self.assertEqual({}, stage_table.count_by_page(stage_table.type_mask(['Data'])))
+
+    def test_logging_check_matches_soup(self):
+        metadata = copy.deepcopy(CodeReview.extract_metadata(self.sub_soups.metadata))
+        metadata['additional info']['Delivery Stage'] = 'Production'
+        for setting, policy_logging_mode in [('ALL_DISABLED', LOGGING_MODES['disabled']),
+                                             ('ALL_ERRORS_ONLY', LOGGING_MODES['errors only'])]:
+            for soup_object in self.objects:
+                stage_index = StageIndex(soup_object)
+                context = ReviewContext.create(soup_object.get('name'), Constants.OBJECT_TYPES['base'], False,
+                                               stage_index, metadata)
+                consideration = ObjectConsiderations.CheckLoggingAdhereToPolicy()
+                with patch.object(ObjectConsiderations.CheckLoggingAdhereToPolicy, setting, True), \
+                        patch('builtins.print'):
+                    consideration.check_consideration(soup_object, context)
+                logging_errors = find_logging_errors(stage_index.stages, policy_logging_mode)
+                self.assertEqual(len(logging_errors), len(consideration.errors_list))
+                self.assertGreater(len(logging_errors), 0)
+                for (stage_name, allowed_type), error in zip(logging_errors, consideration.errors_list):
+                    self.assertIn("'{}'".format(stage_name), str(error))
+                    self.assertEqual(allowed_type, 'exception list' in str(error))
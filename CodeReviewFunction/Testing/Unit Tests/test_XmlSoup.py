@@ -0,0 +1,83 @@
+from unittest import TestCase
+from ... import SoupUtilities
+from ... import Constants
+from ...XmlSoup import XmlTag, normalize_element
+from .. import FixtureLoader
+from bs4 import BeautifulSoup
+from lxml import etree
+
+STAGE_XML = '<process name="Test" type="object">' \
+            '<stage stageid="1" name="Start" type="Start"><subsheetid>a</subsheetid>' \
+            '<inputs><input name="In" narrative="" /><input name="Other" /></inputs><onsuccess>2</onsuccess></stage>' \
+            '<stage stageid="2" name="End" type="End"><subsheetid>a</subsheetid></stage>' \
+            '<subsheet subsheetid="a" type="Normal"><name>Action</name></subsheet>' \
+            '<appdef><element name="Root"><id>e1</id><basetype>Button</basetype></element></appdef>' \
+            '</process>'
+
+
+class TestXmlTag(TestCase):
+    """XmlTag must answer each query the considerations make the same way the bs4 soup does."""
+
+    def setUp(self):
+        self.soup = BeautifulSoup(STAGE_XML, 'lxml').find('process')
+        self.xml_tag = XmlTag(etree.fromstring(STAGE_XML))
+
+    def test_find_all(self):
+        for args, kwargs in [(('stage',), {}), (('stage',), {'recursive': False}), (('stage',), {'type': 'End'}),
+                             (('stage', {'stageid': '1'}), {}), (('input',), {'narrative': True}),
+                             ((['stage', 'subsheet'],), {}), ((True,), {'recursive': False})]:
+            self.assertEqual([str(tag.attrs) for tag in self.soup.find_all(*args, **kwargs)],
+                             [str(tag.attrs) for tag in self.xml_tag.find_all(*args, **kwargs)])
+
+    def test_find(self):
+        self.assertEqual('2', self.xml_tag.find('stage', type='End').get('stageid'))
+        self.assertIsNone(self.xml_tag.find('stage', type='Decision'))
+        self.assertEqual('id', self.xml_tag.find('id', text='e1').name)
+        self.assertIsNone(self.xml_tag.find('id', text='e2'))
+
+    def test_child_tag_access(self):
+        start_stage = self.xml_tag.find('stage')
+        self.assertEqual('a', start_stage.subsheetid.string)
+        self.assertIsNone(start_stage.missing)
+        self.assertEqual('Action', self.xml_tag.subsheet.next_element.string)
+        self.assertIn('Button', self.xml_tag.find('id').parent.basetype)
+        self.assertEqual('Root', self.xml_tag.appdef.element.get('name'))  # <element> tags, as used by App Models
+
+    def test_string(self):
+        self.assertEqual(self.soup.subsheet.string, self.xml_tag.subsheet.string)
+        self.assertIsNone(self.xml_tag.find('stage').string)
+        self.assertIsNone(self.xml_tag.find('input').string)
+
+    def test_contents(self):
+        self.assertEqual(len(self.soup.inputs.contents), len(self.xml_tag.inputs.contents))
+        self.assertEqual(['Action'], self.xml_tag.find('name').contents)
+
+    def test_normalize_element(self):
+        element = etree.fromstring('<Root xmlns="urn:test"><ProcessValue ElementId="1"/></Root>')
+        normalize_element(element)
+        self.assertEqual('<root><processvalue elementid="1"/></root>', etree.tostring(element, encoding='unicode'))
+
+
+class TestExtract_soups_xml_backend(TestCase):
+
+    def test_sections_match_bs4(self):
+        for fixture_name in [FixtureLoader.MERS_FIXTURE, FixtureLoader.MULTI_PROCESS_FIXTURE]:
+            xml_string = FixtureLoader.fixture_release_xml(fixture_name)
+            bs4_soups = SoupUtilities.extract_soups(xml_string)
+            xml_soups = SoupUtilities.extract_soups(xml_string, Constants.PARSER_BACKENDS['xml'])
+            for section in SoupUtilities.Sub_Soup._fields:
+                self.assertEqual([tag.get('name') for tag in getattr(bs4_soups, section).contents],
+                                 [tag.get('name') for tag in getattr(xml_soups, section).contents])
+                self.assertEqual(len(getattr(bs4_soups, section).find_all(True)),
+                                 len(getattr(xml_soups, section).find_all(True)))
+
+    def test_header(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        header = SoupUtilities.extract_header_soup(xml_string, Constants.PARSER_BACKENDS['xml'])
+        self.assertEqual(SoupUtilities.extract_header_soup(xml_string).find('settings').string,
+                         header.find('settings').string)
+
+    def test_empty_release(self):
+        sub_soups = SoupUtilities.extract_soups('', Constants.PARSER_BACKENDS['xml'])
+        self.assertEqual(0, len(sub_soups.objects.contents))
+        self.assertEqual(0, len(sub_soups.metadata.contents))
@@ -1,8 +1,12 @@
+import json
 import typing
 import azure.functions as func
 from unittest import TestCase
+from unittest.mock import patch
 
 from ... import CodeReview
+from ... import Constants
+from .. import FixtureLoader
 
 class TestMain(TestCase):
 
@@ -22,3 +26,146 @@ class TestMain(TestCase):
         self.assertRaises(ValueError, CodeReview.main(self.request))
 
 
+
+
+class TestReviewRelease(TestCase):
+
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def test_review_release(self):
+        report_pages = CodeReview.review_release(self.xml)
+        self.assertEqual(['Object', 'Object', 'Object', 'Process', 'Process', 'Settings'],
+                         [report_page['Page Type'] for report_page in report_pages])
+
+    def test_streaming_matches_standard(self):
+        self.assertEqual(CodeReview.review_release(self.xml), CodeReview.review_release_streaming(self.xml))
+
+    def test_xml_backend_matches_bs4(self):
+        bs4_report_pages = CodeReview.review_release(self.xml, Constants.PARSER_BACKENDS['bs4'])
+        self.assertEqual(bs4_report_pages, CodeReview.review_release(self.xml, Constants.PARSER_BACKENDS['xml']))
+        self.assertEqual(bs4_report_pages,
+                         CodeReview.review_release_streaming(self.xml, Constants.PARSER_BACKENDS['xml']))
+
+    def test_xml_backend_matches_bs4_mers(self):
+        xml = FixtureLoader.fixture_release_xml(FixtureLoader.MERS_FIXTURE)
+        self.assertEqual(CodeReview.review_release(xml, Constants.PARSER_BACKENDS['bs4']),
+                         CodeReview.review_release(xml, Constants.PARSER_BACKENDS['xml']))
+
+    def test_parallel_matches_standard(self):
+        with patch.object(Constants, 'PARALLEL_MIN_OBJECTS', 1):
+            for parser_backend in Constants.PARSER_BACKENDS.values():
+                self.assertEqual(CodeReview.review_release(self.xml, parser_backend),
+                                 CodeReview.review_release_parallel(self.xml, parser_backend, max_workers=2))
+
+    def test_parallel_serial_fallback(self):
+        # The fixture's 3 Objects are below PARALLEL_MIN_OBJECTS, so no worker processes are started
+        with patch.object(CodeReview, 'ProcessPoolExecutor') as process_pool:
+            report_pages = CodeReview.review_release_parallel(self.xml, max_workers=2)
+        process_pool.assert_not_called()
+        self.assertEqual(CodeReview.review_release(self.xml), report_pages)
+
+
+class TestReportJson(TestCase):
+
+    def setUp(self):
+        self.xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+
+    def test_report_json_matches_dumps(self):
+        report_pages = CodeReview.review_release(self.xml)
+        self.assertEqual(json.loads(json.dumps(report_pages)),
+                         json.loads(''.join(CodeReview.iter_report_json(report_pages))))
+        self.assertEqual([], json.loads(''.join(CodeReview.iter_report_json([]))))
+
+    def test_report_json_is_incremental(self):
+        with patch.object(CodeReview, 'make_report_object', wraps=CodeReview.make_report_object) as make_report_object:
+            json_chunks = CodeReview.iter_report_json(CodeReview.iter_review_release_streaming(self.xml))
+            self.assertEqual('[', next(json_chunks))
+            first_page_json = next(json_chunks)
+            self.assertEqual(1, make_report_object.call_count)  # Only the first Object has been reviewed so far
+            report_json = '[' + first_page_json + ''.join(json_chunks)
+        self.assertEqual(CodeReview.review_release(self.xml), json.loads(report_json))
+
+    def test_main_streaming_response(self):
+        req = func.HttpRequest(method='POST', body=self.xml.encode('utf-8'), url='/api/CodeReviewFunction',
+                               params={'mode': Constants.REVIEW_MODES['streaming']})
+        with patch.object(CodeReview.ReviewCache, 'get_shared_cache', return_value=None):
+            response = CodeReview.main(req)
+        report_pages = json.loads(response.get_body())
+        coverage_setting = report_pages[-1]['Report Considerations'].pop()  # main always reviews within a budget
+        self.assertEqual(Constants.REVIEW_TIME_BUDGET, coverage_setting['Time Budget'])
+        self.assertFalse(coverage_setting['Timed Out'])
+        self.assertEqual(json.loads(json.dumps(CodeReview.review_release(self.xml))), report_pages)
+
+    def test_main_time_budget(self):
+        req = func.HttpRequest(method='POST', body=self.xml.encode('utf-8'), url='/api/CodeReviewFunction',
+                               params={'budget': '1e-9'})
+        with patch.object(CodeReview.ReviewCache, 'get_shared_cache', return_value=None):
+            response = CodeReview.main(req)
+        coverage_setting = json.loads(response.get_body())[-1]['Report Considerations'][-1]
+        self.assertEqual(1e-9, coverage_setting['Time Budget'])
+        self.assertTrue(coverage_setting['Timed Out'])
+        self.assertEqual(0, coverage_setting['Pages Partially Reviewed'])
+
+    def test_get_time_budget(self):
+        for budget in ['nan', 'inf', '-inf', '-5', '0', 'not a number']:
+            self.assertEqual(Constants.REVIEW_TIME_BUDGET, CodeReview.get_time_budget({'budget': budget}))
+        self.assertEqual(Constants.REVIEW_TIME_BUDGET, CodeReview.get_time_budget({}))
+        self.assertEqual(Constants.REVIEW_TIME_BUDGET, CodeReview.get_time_budget({'budget': '100000'}))
+        self.assertEqual(12.5, CodeReview.get_time_budget({'budget': '12.5'}))
+        self.assertEqual(100000, CodeReview.get_time_budget({'budget': '100000'}, max_budget=None))
+
+
+class TestReviewPlan(TestCase):
+
+    def setUp(self):
+        xml_string = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.sub_soups = CodeReview.SoupUtilities.extract_soups(xml_string)
+        self.metadata = CodeReview.extract_metadata(self.sub_soups.metadata)
+        self.object_considerations, _ = CodeReview.get_active_considerations(self.metadata)
+
+    def test_plan_follows_config(self):
+        self.metadata['active considerations object'][0]['Force Result'] = 'Yes'
+        self.metadata['active considerations object'][0]['Score Scale'] = '0.5'
+        review_plan = CodeReview.make_review_plan(self.object_considerations, self.metadata)
+        self.assertEqual(self.object_considerations,
+                         [planned.consideration_class for planned in review_plan.considerations])
+        forced = [planned for planned in review_plan.considerations if planned.score_scale is not None]
+        self.assertEqual(1, len(forced))
+        self.assertEqual((0.5, 'Yes'), (forced[0].score_scale, forced[0].force_result))
+
+    def test_blacklist(self):
+        self.metadata['blacklist'] = ['Survey', 'a.b']
+        review_plan = CodeReview.make_review_plan(self.object_considerations, self.metadata)
+        self.assertTrue(CodeReview.is_blacklisted(review_plan, 'Kwik Survey - General'))
+        self.assertTrue(CodeReview.is_blacklisted(review_plan, 'MS Excel VBO'))  # From Constants.BLACKLIST_OBJECT_NAMES
+        self.assertFalse(CodeReview.is_blacklisted(review_plan, 'SAM Testing'))
+        self.assertFalse(CodeReview.is_blacklisted(review_plan, 'aXb'))  # Blacklist entries aren't patterns
+
+        self.metadata['blacklist'] = []
+        with patch.object(Constants, 'BLACKLIST_OBJECT_NAMES', []):
+            review_plan = CodeReview.make_review_plan(self.object_considerations, self.metadata)
+            self.assertFalse(CodeReview.is_blacklisted(review_plan, 'MS Excel VBO'))
+
+    def test_blacklisted_object_not_checked(self):
+        self.metadata['blacklist'] = ['survey']
+        review_plan = CodeReview.make_review_plan(self.object_considerations, self.metadata)
+        object_tag = [tag for tag in self.sub_soups.objects.contents if tag.get('name') == 'Kwik Survey - General'][0]
+        with patch.object(CodeReview, 'StageIndex') as stage_index:
+            report_page = CodeReview.make_report_object(object_tag, review_plan, self.metadata)
+        stage_index.assert_not_called()
+        self.assertEqual([], report_page['Report Considerations'])
+        self.assertEqual(Constants.BLACKLISTED_OBJECT_TYPE, report_page['Object Type'])
+
+    def test_blacklisted_objects_not_parsed(self):
+        xml = FixtureLoader.fixture_release_xml(FixtureLoader.MULTI_PROCESS_FIXTURE)
+        self.metadata['blacklist'] = ['survey']
+        with patch.object(CodeReview, 'extract_metadata', return_value=self.metadata):
+            report_pages = CodeReview.review_release(xml)
+            for review_function in [CodeReview.review_release_streaming, CodeReview.review_release_parallel]:
+                self.assertEqual(report_pages, review_function(xml))
+            self.assertEqual(report_pages, CodeReview.review_release_diff(xml)[0])
+        self.assertEqual(['Goldard Test Object', 'Kwik Survey - General', 'SAM Testing'],
+                         [report_page['Report Page Name'] for report_page in report_pages[:3]])
+        self.assertEqual(Constants.BLACKLISTED_OBJECT_TYPE, report_pages[1]['Object Type'])
+        self.assertNotEqual(Constants.BLACKLISTED_OBJECT_TYPE, report_pages[2]['Object Type'])
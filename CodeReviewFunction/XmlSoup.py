@@ -0,0 +1,203 @@
+"""
+This module contains a thin bs4 compatible layer over lxml's native XML tree.
+
+The considerations were written against BeautifulSoup Tags from the 'lxml' HTML parser. XmlTag gives an lxml element
+the same find/find_all, attribute and child tag access, so the considerations run unchanged on either parser backend.
+normalize_element must be run on a tree first so tag and attribute names match the lower case names the HTML parser
+produces.
+"""
+
+from lxml import etree
+
+
+def normalize_element(element):
+    """Strip namespaces and lower case every tag and attribute name below and including the element."""
+    for descendant in element.iter(etree.Element):
+        descendant.tag = etree.QName(descendant).localname.lower()
+        attrib = descendant.attrib
+        for attribute_name in attrib.keys():
+            if not attribute_name.islower():
+                value = attrib.pop(attribute_name)
+                attrib[etree.QName(attribute_name).localname.lower()] = value
+    etree.cleanup_namespaces(element)
+
+
+class XmlString(str):
+    """A text node of an XmlTag, standing in for bs4's NavigableString."""
+    name = None
+
+    @property
+    def string(self):
+        return self
+
+
+class XmlTag:
+    """Wraps an lxml element so it can be searched and read the same way as a bs4 Tag.
+
+    Attribute access falls through to the first descendant tag of that name (e.g. stage.subsheetid), like bs4.
+    """
+    __slots__ = ('_element',)
+
+    _xpath_cache = {}
+
+    def __init__(self, element):
+        self._element = element
+
+    # -- Tag information
+    @property
+    def lxml_element(self):
+        """The wrapped lxml element. Not named element, as tag.element must find an <element> child like bs4."""
+        return self._element
+
+    @property
+    def name(self):
+        return self._element.tag
+
+    @property
+    def attrs(self) -> dict:
+        return dict(self._element.attrib)
+
+    @property
+    def string(self):
+        """Return the tag's only string, following a single child tag down like bs4. None if there isn't one."""
+        element = self._element
+        while True:
+            if len(element) == 0:
+                return XmlString(element.text) if element.text else None
+            if len(element) > 1 or element.text or element[0].tail:
+                return None
+            element = element[0]
+
+    @property
+    def contents(self) -> list:
+        """Return the child tags and strings in document order."""
+        element = self._element
+        contents = [XmlString(element.text)] if element.text else []
+        for child in element:
+            if isinstance(child.tag, str):
+                contents.append(XmlTag(child))
+            if child.tail:
+                contents.append(XmlString(child.tail))
+        return contents
+
+    @property
+    def parent(self):
+        parent = self._element.getparent()
+        return XmlTag(parent) if parent is not None else None
+
+    @property
+    def next_element(self):
+        """Return whatever was parsed straight after this tag's opening tag, being a string or a tag."""
+        element = self._element
+        if element.text:
+            return XmlString(element.text)
+        if len(element):
+            return XmlTag(element[0])
+        while element is not None:
+            if element.tail:
+                return XmlString(element.tail)
+            next_sibling = element.getnext()
+            if next_sibling is not None:
+                return XmlTag(next_sibling)
+            element = element.getparent()
+        return None
+
+    def get(self, key, default=None):
+        return self._element.get(key, default)
+
+    def has_attr(self, key) -> bool:
+        return key in self._element.attrib
+
+    def __getitem__(self, key):
+        return self._element.attrib[key]
+
+    # -- Searching
+    def find(self, name=None, attrs={}, recursive=True, text=None, **kwargs):
+        """Return the first matching tag, or None. Takes the same arguments as bs4's Tag.find."""
+        matches = self._search(name, attrs, recursive, text, kwargs, first_only=True)
+        return XmlTag(matches[0]) if matches else None
+
+    def find_all(self, name=None, attrs={}, recursive=True, text=None, **kwargs) -> list:
+        """Return all matching tags. Takes the same arguments as bs4's Tag.find_all."""
+        return [XmlTag(match) for match in self._search(name, attrs, recursive, text, kwargs)]
+
+    def _search(self, name, attrs, recursive, text, kwargs, first_only=False):
+        """Run the bs4 style search as a compiled XPath over the element."""
+        search_attrs = dict(attrs)
+        search_attrs.update(kwargs)
+        attr_items = sorted(search_attrs.items())
+
+        # Strings are passed in as XPath variables, so the compiled expression only depends on the query's shape
+        attr_shape = tuple((key, value if value is True or value is None or value is False else '')
+                           for key, value in attr_items)
+        names = tuple(name) if isinstance(name, (list, tuple)) else name
+        xpath_key = (names, attr_shape, recursive, text is not None, first_only)
+        xpath = self._xpath_cache.get(xpath_key)
+        if xpath is None:
+            xpath = self._xpath_cache[xpath_key] = etree.XPath(_build_xpath(*xpath_key))
+
+        variables = {'v{}'.format(idx): value for idx, (key, value) in enumerate(attr_items)
+                     if not (value is True or value is None or value is False)}
+        if text is not None:
+            variables['text'] = text
+        return xpath(self._element, **variables)
+
+    def __getattr__(self, tag_name):
+        if tag_name.startswith('__'):
+            raise AttributeError(tag_name)
+        return self.find(tag_name)
+
+    # -- Python data model
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __contains__(self, item):
+        return item in self.contents
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, XmlTag) and self._element is other._element
+
+    def __hash__(self):
+        return hash(self._element)
+
+    def __str__(self):
+        return etree.tostring(self._element, encoding='unicode', with_tail=False)
+
+    def __repr__(self):
+        return '<XmlTag {} {}>'.format(self.name, self.attrs)
+
+    def decompose(self):
+        """Clear the element's subtree so its memory can be released straight away."""
+        self._element.clear()
+
+
+def _build_xpath(names, attr_shape, recursive, match_text, first_only) -> str:
+    """Build an XPath expression equivalent to a bs4 find/find_all with the given shape."""
+    axis = 'descendant::' if recursive else 'child::'
+    if names is None or names is True:
+        node_test = '*'
+    elif isinstance(names, tuple):
+        node_test = '*[{}]'.format(' or '.join('self::' + name for name in names))
+    else:
+        node_test = names
+
+    predicates = []
+    for idx, (key, value) in enumerate(attr_shape):
+        if value is True:
+            predicates.append('[@{}]'.format(key))
+        elif value is None or value is False:
+            predicates.append('[not(@{})]'.format(key))
+        else:
+            predicates.append('[@{}=$v{}]'.format(key, idx))
+    if match_text:
+        predicates.append('[not(*) and .=$text]')
+    if first_only:
+        predicates.append('[1]')
+
+    return axis + node_test + ''.join(predicates)